@@ -0,0 +1,62 @@
+"""
+Benchmarks for yankee's hot paths. These aren't collected by the default test
+run; run them with
+
+    pytest benchmarks
+
+Every benchmark records its input size in `extra_info["records"]`, its
+throughput in `extra_info["records_per_sec"]`, and the peak memory allocated by
+one run in `extra_info["peak_memory_kb"]`, so results saved with
+`--benchmark-autosave` can be compared with `pytest-benchmark compare`. The
+number of records generated can be changed with the YANKEE_BENCH_RECORDS
+environment variable.
+"""
+import os
+import tracemalloc
+
+import pytest
+
+RECORDS = int(os.environ.get("YANKEE_BENCH_RECORDS", 500))
+
+results = list()
+
+
+def peak_memory(func, *args, **kwargs):
+    """Run `func` once, and return the peak memory it allocated, in bytes"""
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def measure(benchmark, request):
+    """Benchmark `func(*args)`, which processes `records` records, and record
+    its throughput and peak memory"""
+
+    def measure(func, *args, records=RECORDS, **kwargs):
+        peak = peak_memory(func, *args, **kwargs)
+        result = benchmark(func, *args, **kwargs)
+        if benchmark.stats is None:  # --benchmark-disable
+            return result
+        rate = records / benchmark.stats.stats.mean
+        benchmark.extra_info.update(
+            records=records,
+            records_per_sec=round(rate),
+            peak_memory_kb=round(peak / 1024),
+        )
+        results.append((request.node.name, rate, peak))
+        return result
+
+    return measure
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not results:
+        return
+    terminalreporter.section("throughput and peak memory")
+    width = max(len(name) for name, _, _ in results)
+    for name, rate, peak in results:
+        terminalreporter.write_line(f"{name:<{width}}  {rate:>12,.0f} records/s  {peak / 1024:>10,.0f} KiB peak")
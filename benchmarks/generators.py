@@ -0,0 +1,152 @@
+"""Deterministic synthetic inputs shaped like the data yankee is used on"""
+import datetime
+import json
+import random
+
+WORDS = (
+    "apparatus method system device composition layer substrate signal circuit "
+    "assembly housing member first second plurality wherein comprising coupled "
+    "configured surface portion electrode controller data network module"
+).split()
+
+CLASSES = ("H01L", "G06F", "A61K", "B65D", "H04L", "C07D", "F16H", "G01N")
+
+
+def words(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def date(rng):
+    return datetime.date(1976, 1, 1) + datetime.timedelta(days=rng.randrange(17000))
+
+
+def uspto_record(rng, i):
+    inventors = "".join(
+        f"<inventor sequence=\"{j:03d}\"><addressbook>"
+        f"<last-name>{words(rng, 1).title()}</last-name>"
+        f"<first-name>{words(rng, 1).title()}</first-name>"
+        f"<address><city>{words(rng, 1).title()}</city><country>US</country></address>"
+        f"</addressbook></inventor>"
+        for j in range(rng.randint(1, 4))
+    )
+    claims = "".join(
+        f"<claim id=\"CLM-{j:05d}\" num=\"{j:05d}\"><claim-text>{j}. A {words(rng, 40)}.</claim-text></claim>"
+        for j in range(1, rng.randint(3, 20))
+    )
+    citations = "".join(
+        f"<us-citation><patcit num=\"{j:05d}\"><document-id><country>US</country>"
+        f"<doc-number>{rng.randrange(3000000, 11000000)}</doc-number><kind>B2</kind>"
+        f"<date>{date(rng):%Y%m%d}</date></document-id></patcit></us-citation>"
+        for j in range(rng.randint(0, 10))
+    )
+    return (
+        f"<us-patent-grant lang=\"EN\" id=\"US{10000000 + i}-{date(rng):%Y%m%d}\">"
+        f"<us-bibliographic-data-grant>"
+        f"<publication-reference><document-id><country>US</country>"
+        f"<doc-number>{10000000 + i}</doc-number><kind>B2</kind><date>{date(rng):%Y%m%d}</date>"
+        f"</document-id></publication-reference>"
+        f"<application-reference appl-type=\"utility\"><document-id><country>US</country>"
+        f"<doc-number>{rng.randrange(10000000, 17000000)}</doc-number><date>{date(rng):%Y%m%d}</date>"
+        f"</document-id></application-reference>"
+        f"<classifications-ipcr><classification-ipcr><section>{rng.choice(CLASSES)}</section>"
+        f"</classification-ipcr></classifications-ipcr>"
+        f"<invention-title id=\"d2e43\">{words(rng, 8).capitalize()}</invention-title>"
+        f"<us-references-cited>{citations}</us-references-cited>"
+        f"<number-of-claims>{claims.count('<claim ')}</number-of-claims>"
+        f"<us-parties><inventors>{inventors}</inventors></us-parties>"
+        f"</us-bibliographic-data-grant>"
+        f"<abstract id=\"abstract\"><p id=\"p-0001\" num=\"0000\">{words(rng, 120)}</p></abstract>"
+        f"<claims id=\"claims\">{claims}</claims>"
+        f"</us-patent-grant>"
+    )
+
+
+def uspto_bulk_xml(n, seed=0) -> bytes:
+    """A USPTO-style bulk file: `n` complete XML documents concatenated together"""
+    rng = random.Random(seed)
+    header = "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<!DOCTYPE us-patent-grant SYSTEM \"us-patent-grant-v45.dtd\" [ ]>\n"
+    return "".join(header + uspto_record(rng, i) + "\n" for i in range(n)).encode()
+
+
+def uspto_records(n, seed=0) -> "List[bytes]":
+    rng = random.Random(seed)
+    return [uspto_record(rng, i).encode() for i in range(n)]
+
+
+def aps_record(rng, i):
+    lines = [
+        "PATN",
+        f"WKU  0{4000000 + i:07d}",
+        f"APN  {rng.randrange(1000000, 9999999)}",
+        f"TTL  {words(rng, 8).capitalize()}",
+        f"ISD  {date(rng):%Y%m%d}",
+    ]
+    for _ in range(rng.randint(1, 4)):
+        lines += ["INVT", f"NAM  {words(rng, 1).title()}; {words(rng, 1).title()}", f"CTY  {words(rng, 1).title()}"]
+    lines += ["ABST", f"PAL  {words(rng, 60)}"]
+    for j in range(1, rng.randint(3, 10)):
+        lines += ["CLMS", f"NUM  {j}", f"PAR  {j}. A {words(rng, 30)}."]
+    return "\n".join(lines) + "\n"
+
+
+def aps_bulk(n, seed=0) -> bytes:
+    """An APS (pre-2001 USPTO full text) file of `n` records"""
+    rng = random.Random(seed)
+    return ("HHHHHT APS1\n" + "".join(aps_record(rng, i) for i in range(n))).encode()
+
+
+def api_record(rng, i):
+    return {
+        "id": f"app-{i}",
+        "attributes": {
+            "title": words(rng, 8).capitalize(),
+            "filingDate": f"{date(rng):%Y-%m-%d}",
+            "status": {"code": rng.randrange(1, 200), "description": words(rng, 3)},
+            "claimCount": rng.randrange(1, 40),
+            "allowed": rng.random() > 0.5,
+        },
+        "relationships": {
+            "applicants": [
+                {"name": words(rng, 2).title(), "country": "US", "address": {"city": words(rng, 1).title()}}
+                for _ in range(rng.randint(1, 3))
+            ],
+            "transactions": [
+                {"date": f"{date(rng):%Y-%m-%d}", "code": words(rng, 1).upper(), "description": words(rng, 6)}
+                for _ in range(rng.randint(2, 15))
+            ],
+        },
+    }
+
+
+def api_records(n, seed=0) -> "List[dict]":
+    """`n` nested records like the items of a JSON API response"""
+    rng = random.Random(seed)
+    return [api_record(rng, i) for i in range(n)]
+
+
+def api_response(n, seed=0) -> bytes:
+    return json.dumps({"data": api_records(n, seed), "meta": {"count": n}}).encode()
+
+
+def html_page(rng, i):
+    rows = "".join(
+        f"<tr><td class=\"date\">{date(rng):%Y-%m-%d}</td><td class=\"event\">{words(rng, 5)}</td></tr>"
+        for _ in range(rng.randint(3, 20))
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Case Docket</title>"
+        "<script>var x = 1;</script></head><body>"
+        "<nav><ul><li><a href=\"/\">Home</a></li><li><a href=\"/search\">Search</a></li></ul></nav>"
+        f"<div id=\"case\"><h1 class=\"caption\">{words(rng, 4).title()} v. {words(rng, 3).title()}</h1>"
+        f"<dl><dt>Case Number</dt><dd class=\"number\">{rng.randrange(1, 99)}-cv-{rng.randrange(10000):05d}</dd>"
+        f"<dt>Filed</dt><dd class=\"filed\">{date(rng):%Y-%m-%d}</dd>"
+        f"<dt>Judge</dt><dd class=\"judge\">Hon. {words(rng, 2).title()}</dd></dl>"
+        f"<p class=\"summary\">{words(rng, 80)}</p>"
+        f"<table class=\"docket\"><tbody>{rows}</tbody></table></div>"
+        "<footer>Generated page</footer></body></html>"
+    )
+
+
+def html_pages(n, seed=0) -> "List[str]":
+    rng = random.Random(seed)
+    return [html_page(rng, i) for i in range(n)]
@@ -0,0 +1,92 @@
+"""Schemas for the synthetic inputs in `benchmarks.generators`"""
+from yankee.html.schema import CSS
+from yankee.html import Schema as HtmlSchema
+from yankee.html import fields as hf
+from yankee.json import Schema as JsonSchema
+from yankee.json import fields as jf
+from yankee.xml import Schema as XmlSchema
+from yankee.xml import fields as xf
+
+
+class DocumentIdSchema(XmlSchema):
+    country = xf.Str("./country")
+    doc_number = xf.Str("./doc-number")
+    kind = xf.Str("./kind")
+    date = xf.Date("./date")
+
+
+class InventorSchema(XmlSchema):
+    last_name = xf.Str(".//last-name")
+    first_name = xf.Str(".//first-name")
+    city = xf.Str(".//city")
+    country = xf.Str(".//country")
+
+
+class ClaimSchema(XmlSchema):
+    number = xf.Int("./@num")
+    text = xf.Str("./claim-text")
+
+
+class PatentGrantSchema(XmlSchema):
+    publication = DocumentIdSchema(".//publication-reference/document-id")
+    application = DocumentIdSchema(".//application-reference/document-id")
+    appl_type = xf.Str(".//application-reference/@appl-type")
+    title = xf.Str(".//invention-title")
+    ipc_section = xf.Str(".//classification-ipcr/section")
+    number_of_claims = xf.Int(".//number-of-claims")
+    inventors = xf.List(xf.Nested(InventorSchema()), ".//inventors/inventor")
+    citations = xf.List(xf.Nested(DocumentIdSchema()), ".//us-citation/patcit/document-id")
+    abstract = xf.Str("./abstract")
+    claims = xf.List(xf.Nested(ClaimSchema()), "./claims/claim")
+
+
+class ApsInventorSchema(XmlSchema):
+    name = xf.Str("./NAM")
+    city = xf.Str("./CTY")
+
+
+class ApsPatentSchema(XmlSchema):
+    patent_number = xf.Str("./WKU")
+    appl_id = xf.Str("./APN")
+    title = xf.Str("./TTL")
+    issue_date = xf.Date("./ISD")
+    inventors = xf.List(xf.Nested(ApsInventorSchema()), "./INVT")
+    abstract = xf.Str("./ABST/PAL")
+
+
+class ApplicantSchema(JsonSchema):
+    name = jf.Str("name")
+    country = jf.Str("country")
+    city = jf.Str("address.city")
+
+
+class TransactionSchema(JsonSchema):
+    date = jf.Date("date")
+    code = jf.Str("code")
+    description = jf.Str("description")
+
+
+class ApplicationSchema(JsonSchema):
+    id = jf.Str("id")
+    title = jf.Str("attributes.title")
+    filing_date = jf.Date("attributes.filingDate")
+    status_code = jf.Int("attributes.status.code")
+    status = jf.Str("attributes.status.description")
+    claim_count = jf.Int("attributes.claimCount")
+    allowed = jf.Bool("attributes.allowed")
+    applicants = jf.List(jf.Nested(ApplicantSchema()), "relationships.applicants")
+    transactions = jf.List(jf.Nested(TransactionSchema()), "relationships.transactions")
+
+
+class DocketEntrySchema(HtmlSchema):
+    date = hf.Date(CSS("td.date"))
+    event = hf.Str(CSS("td.event"))
+
+
+class DocketPageSchema(HtmlSchema):
+    caption = hf.Str(CSS("h1.caption"))
+    case_number = hf.Str(CSS("dd.number"))
+    filed = hf.Date(CSS("dd.filed"))
+    judge = hf.Str(CSS("dd.judge"))
+    summary = hf.Str(CSS("p.summary"))
+    docket = hf.List(hf.Nested(DocketEntrySchema()), CSS("table.docket tr"))
@@ -0,0 +1,33 @@
+import pytest
+
+from yankee.data import Collection
+
+from . import generators
+from .conftest import RECORDS
+from .schemas import ApplicationSchema, PatentGrantSchema
+
+
+@pytest.fixture(scope="module", params=["xml", "json"])
+def collection(request):
+    if request.param == "xml":
+        schema, records = PatentGrantSchema(), generators.uspto_records(RECORDS)
+    else:
+        schema, records = ApplicationSchema(), generators.api_records(RECORDS)
+    return Collection([schema.load(r) for r in records], schema=schema)
+
+
+def test_to_records(measure, collection):
+    assert len(measure(collection.to_records)) == RECORDS
+
+
+def test_to_pandas(measure, collection):
+    pytest.importorskip("pandas")
+    assert len(measure(collection.to_pandas)) == RECORDS
+
+
+def test_to_json(measure, collection):
+    assert measure(collection.to_json)
+
+
+def test_iter_json_bytes(measure, collection):
+    assert len(measure(lambda: list(collection.iter_json_bytes()))) == RECORDS
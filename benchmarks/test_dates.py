@@ -0,0 +1,24 @@
+import datetime
+import random
+
+import pytest
+
+from yankee.base.dates import DateParser
+
+from .conftest import RECORDS
+
+
+def date_strings(n, fmt, distinct=2000, seed=0):
+    rng = random.Random(seed)
+    start = datetime.date(1976, 1, 1)
+    return [(start + datetime.timedelta(days=rng.randrange(distinct))).strftime(fmt) for _ in range(n)]
+
+
+@pytest.mark.parametrize("fmt", ["%Y%m%d", "%Y-%m-%d", "%B %d, %Y"])
+@pytest.mark.parametrize("output_type", [datetime.date, datetime.datetime])
+def test_parse_dates(measure, fmt, output_type):
+    texts = date_strings(RECORDS * 20, fmt)
+    def run():
+        parse = DateParser(output_type)
+        return [parse(t) for t in texts]
+    assert len(measure(run, records=len(texts))) == len(texts)
@@ -0,0 +1,27 @@
+"""Import time of each entry point, as paid by CLI tools and serverless handlers"""
+import subprocess
+import sys
+
+import pytest
+
+
+def import_time(module):
+    """Import `module` in a fresh interpreter with -X importtime, and return
+    the cumulative import time it reports, in microseconds"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    for line in result.stderr.splitlines():
+        if line.rstrip().endswith(f"| {module}"):
+            return int(line.split("|")[1])
+    raise ValueError(f"{module} not found in -X importtime output")
+
+
+@pytest.mark.parametrize("module", ["yankee", "yankee.xml", "yankee.json", "yankee.html"])
+def test_import_time(measure, benchmark, module):
+    """The benchmark times a whole interpreter start, and the median time of the
+    import itself is recorded in extra_info["import_time_us"]"""
+    measure(import_time, module, records=1)
+    samples = sorted(import_time(module) for _ in range(5))
+    benchmark.extra_info["import_time_us"] = samples[2]
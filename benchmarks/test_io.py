@@ -0,0 +1,51 @@
+import io
+
+import pytest
+
+from yankee.io.iterparse import file_iterparse
+from yankee.xml.io.aps import aps_iterator
+from yankee.xml.io.iterparse import xml_iterparse
+
+from . import generators
+from .conftest import RECORDS
+from .schemas import ApsPatentSchema, PatentGrantSchema
+
+
+@pytest.fixture(scope="module")
+def bulk_xml():
+    return generators.uspto_bulk_xml(RECORDS)
+
+
+@pytest.fixture(scope="module")
+def bulk_aps():
+    return generators.aps_bulk(RECORDS)
+
+
+def test_xml_iterparse(measure, bulk_xml):
+    result = measure(lambda: list(xml_iterparse(io.BytesIO(bulk_xml), tag="us-patent-grant")))
+    assert len(result) == RECORDS
+
+
+def test_file_iterparse(measure, bulk_xml):
+    start, end = rb"<us-patent-grant", rb"</us-patent-grant>"
+    result = measure(lambda: list(file_iterparse(io.BytesIO(bulk_xml), start=start, end=end)))
+    assert len(result) == RECORDS
+
+
+def test_aps_iterator(measure, bulk_aps):
+    result = measure(lambda: list(aps_iterator(io.BytesIO(bulk_aps), record_tag="PATN")))
+    assert len(result) == RECORDS
+
+
+def test_xml_iterparse_and_load(measure, bulk_xml):
+    schema = PatentGrantSchema()
+    def run():
+        return [schema.load(r) for r in xml_iterparse(io.BytesIO(bulk_xml), tag="us-patent-grant")]
+    assert len(measure(run)) == RECORDS
+
+
+def test_aps_iterator_and_load(measure, bulk_aps):
+    schema = ApsPatentSchema()
+    def run():
+        return [schema.load(r) for r in aps_iterator(io.BytesIO(bulk_aps), record_tag="PATN")]
+    assert len(measure(run)) == RECORDS
@@ -0,0 +1,64 @@
+import pytest
+
+from yankee.json.schema.schema import loads
+
+from . import generators
+from .conftest import RECORDS
+from .schemas import ApplicationSchema, DocketPageSchema, PatentGrantSchema
+
+
+def load_each(schema, records):
+    return [schema.load(r) for r in records]
+
+
+@pytest.fixture(scope="module")
+def xml_records():
+    return generators.uspto_records(RECORDS)
+
+
+@pytest.fixture(scope="module")
+def json_records():
+    return generators.api_records(RECORDS)
+
+
+@pytest.fixture(scope="module")
+def html_records():
+    return generators.html_pages(RECORDS)
+
+
+def test_xml_load(measure, xml_records):
+    result = measure(load_each, PatentGrantSchema(), xml_records)
+    assert len(result) == RECORDS
+
+
+def test_xml_load_batch(measure, xml_records):
+    result = measure(PatentGrantSchema().load_batch, xml_records)
+    assert len(result) == RECORDS
+
+
+def test_json_load(measure, json_records):
+    result = measure(load_each, ApplicationSchema(), json_records)
+    assert len(result) == RECORDS
+
+
+def test_json_load_batch(measure, json_records):
+    result = measure(ApplicationSchema().load_batch, json_records)
+    assert len(result) == RECORDS
+
+
+def test_json_load_response(measure):
+    """Decode a whole API response, and load the records in it"""
+    response = generators.api_response(RECORDS)
+    schema = ApplicationSchema()
+    result = measure(lambda: schema.load_batch(loads(response)["data"]))
+    assert len(result) == RECORDS
+
+
+def test_html_load(measure, html_records):
+    result = measure(load_each, DocketPageSchema(), html_records)
+    assert len(result) == RECORDS
+
+
+def test_html_load_batch(measure, html_records):
+    result = measure(DocketPageSchema().load_batch, html_records)
+    assert len(result) == RECORDS
@@ -0,0 +1,56 @@
+"""Construction time of a large schema, as paid by short-lived workers"""
+from yankee.xml import Schema
+from yankee.xml import fields as f
+
+from .schemas import PatentGrantSchema
+
+FIELD_TYPES = (f.Str, f.Int, f.Date, f.Bool, f.Float)
+
+
+def make_schema(name, n_fields, children=(), many=()):
+    """Build a schema class with `n_fields` scalar fields, plus a Nested
+    field for each of `children` and a List field for each of `many`"""
+    attrs = {
+        f"field_{i}": FIELD_TYPES[i % len(FIELD_TYPES)](f"./field-{i}")
+        for i in range(n_fields)
+    }
+    for i, child in enumerate(children):
+        attrs[f"child_{i}"] = child(f"./child-{i}")
+    for i, child in enumerate(many):
+        attrs[f"items_{i}"] = f.List(f.Nested(child()), f"./items-{i}/item")
+    return type(name, (Schema,), attrs)
+
+
+def large_schema_class():
+    """A schema with 300 fields in all, nested three levels deep"""
+    leaf = make_schema("LeafSchema", 20)
+    middle = make_schema("MiddleSchema", 20, children=(leaf, leaf), many=(leaf,))
+    return make_schema("LargeSchema", 27, children=(middle, middle), many=(middle, leaf))
+
+
+def count_fields(schema):
+    total = 0
+    stack = [schema]
+    while stack:
+        s = stack.pop()
+        for field in s.fields.values():
+            total += 1
+            inner = getattr(field, "item_schema", field)
+            inner = getattr(inner, "_schema", inner)
+            if getattr(inner, "fields", None):
+                stack.append(inner)
+    return total
+
+
+def test_large_schema_construction(measure):
+    cls = large_schema_class()
+    schema = measure(cls, records=1)
+    assert count_fields(schema) == 300
+
+
+def test_large_schema_class_creation(measure):
+    measure(large_schema_class, records=1)
+
+
+def test_patent_schema_construction(measure):
+    measure(PatentGrantSchema, records=1)
@@ -1,30 +1,101 @@
-from yankee.util import camelize
+import re
+from operator import itemgetter
 from collections.abc import Sequence, Mapping
 
+from yankee.util import camelize
+
 def do_nothing(obj):
     return obj
 
+index_re = re.compile(r"-?\d+")
+
+def split_key(data_key):
+    """Split a dotted data key into segments, with numeric segments (including
+    negative ones, e.g. "items.-1") as list indexes"""
+    return tuple(int(s) if index_re.fullmatch(s) else s for s in data_key.split("."))
+
+def mapping_path(segments):
+    """
+    Build an accessor for a path through parsed JSON (dicts and lists).
+    String segments become a chain of `dict.get` calls, and integer
+    segments become index operations. Missing keys, out-of-range indexes
+    and type mismatches all resolve to None.
+    """
+    if all(isinstance(seg, str) for seg in segments):
+        if len(segments) == 1:
+            key = segments[0]
+            def accessor_func(obj):
+                try:
+                    return obj.get(key)
+                except AttributeError:
+                    return None
+            return accessor_func
+        def accessor_func(obj):
+            try:
+                for key in segments:
+                    obj = obj.get(key)
+                return obj
+            except AttributeError:
+                return None
+        return accessor_func
+    if len(segments) == 1:
+        getter = itemgetter(segments[0])
+        def accessor_func(obj):
+            try:
+                return getter(obj)
+            except (LookupError, TypeError):
+                return None
+        return accessor_func
+    steps = tuple((seg, isinstance(seg, int)) for seg in segments)
+    def accessor_func(obj):
+        try:
+            for seg, is_index in steps:
+                obj = obj[seg] if is_index else obj.get(seg)
+            return obj
+        except (AttributeError, LookupError, TypeError):
+            return None
+    return accessor_func
+
+def _key_step(key):
+    def step(obj):
+        if isinstance(obj, Mapping):
+            return obj.get(key)
+        return getattr(obj, key, None)
+    return step
+
+def _index_step(index):
+    def step(obj):
+        if isinstance(obj, Sequence) and not isinstance(obj, str):
+            try:
+                return obj[index]
+            except IndexError:
+                return None
+        if isinstance(obj, Mapping):
+            return obj.get(index)
+        return None
+    return step
+
+def object_path(segments):
+    """
+    Build an accessor for a path through arbitrary python objects. Each
+    segment is resolved against the current value as a mapping key,
+    sequence index or attribute.
+    """
+    steps = tuple(_index_step(seg) if isinstance(seg, int) else _key_step(seg) for seg in segments)
+    if len(steps) == 1:
+        return steps[0]
+    def accessor_func(obj):
+        for step in steps:
+            if obj is None:
+                return None
+            obj = step(obj)
+        return obj
+    return accessor_func
+
 def python_accessor(data_key, name, many, meta):
     if data_key is False or (data_key is None and name is None):
         return do_nothing
     data_key = data_key or name
     if not isinstance(data_key, str):
         return data_key
-    key_segments = tuple(int(s) if s.isdigit() else s for s in data_key.split("."))
-    def accessor_func(obj):
-        result = obj
-        for seg in key_segments:
-            if isinstance(obj, Sequence):
-                try:
-                    result = result[seg]
-                except IndexError:
-                    result = None
-            elif isinstance(result, Mapping):
-                result = result.get(seg, None)
-            else:
-                result = getattr(result, seg, None)
-        return result
-    return accessor_func
-
-
-
+    return object_path(split_key(data_key))
@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from yankee.json.schema.accessor import json_accessor
+
+from .accessor import python_accessor
+
+
+def test_python_accessor_mixed_path():
+    obj = SimpleNamespace(items=[{"name": SimpleNamespace(value="first")}])
+    assert python_accessor("items.0.name.value", None, False, None)(obj) == "first"
+    assert python_accessor("items.1.name", None, False, None)(obj) is None
+    assert python_accessor("items.0.missing.value", None, False, None)(obj) is None
+
+
+def test_python_accessor_index_into_nested_list():
+    # The root is a dict; indexes apply to the current value, not the root
+    obj = {"items": ["a", "b"]}
+    assert python_accessor("items.1", None, False, None)(obj) == "b"
+    assert python_accessor("items.2", None, False, None)(obj) is None
+
+
+def test_negative_index():
+    obj = {"items": [{"name": "first"}, {"name": "last"}]}
+    assert python_accessor("items.-1", None, False, None)(obj) == {"name": "last"}
+    assert python_accessor("items.-1.name", None, False, None)(SimpleNamespace(**obj)) == "last"
+    assert json_accessor("items.-1", None, False, None)(obj) == {"name": "last"}
+    assert json_accessor("items.-1.name", None, False, None)(obj) == "last"
+    assert json_accessor("items.-3.name", None, False, None)(obj) is None
@@ -0,0 +1,149 @@
+import hashlib
+import os
+import pickle
+import re
+import sys
+import tempfile
+from functools import partial
+
+from yankee.util import import_class
+from yankee.version import __version__
+
+from . import fields
+from .deserializer import Deserializer
+from .schema import Schema
+
+# Attributes that are set by binding or loading, or rebuilt after unpickling, and
+# so don't change what a schema loads. Schemas' fields and Nested and List schemas
+# are described from their declarations instead
+_ignored = {"name", "output_name", "parent", "Meta", "accessor", "_load_func", "_plan",
+            "_plan_index", "_single_pass_plan", "_projections", "_compiled", "__model__",
+            "_raw", "date_parser", "fields", "_schema", "item_schema", "text_accessor"}
+
+
+def cache_dir():
+    return os.environ.get("YANKEE_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "yankee")
+
+
+def describe(value, seen=None, module=None) -> str:
+    """A stable text description of a field tree's declaration - its field types,
+    data keys, options, nested schemas and Meta options - that doesn't depend on
+    object ids, or on anything binding or loading changes. `module` is where bare
+    schema names are looked up, as when binding"""
+    seen = set() if seen is None else seen
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(describe(v, seen, module) for v in value) + "]"
+    if isinstance(value, dict):
+        items = sorted(value.items(), key=lambda i: repr(i[0]))
+        return "{" + ", ".join(f"{k!r}: {describe(v, seen, module)}" for k, v in items) + "}"
+    if isinstance(value, partial):
+        return f"partial({describe(value.func, seen)}, {describe(value.args, seen)}, {describe(value.keywords, seen)})"
+    if isinstance(value, re.Pattern):
+        return f"re({value.pattern!r}, {value.flags})"
+    if isinstance(value, type) and issubclass(value, Schema):
+        return describe_schema_class(value, seen)
+    if hasattr(value, "__qualname__"):
+        return f"{getattr(value, '__module__', None)}.{value.__qualname__}"
+    if id(value) in seen:
+        return "<ref>"
+    seen.add(id(value))
+    name = f"{type(value).__module__}.{type(value).__qualname__}"
+    if isinstance(value, Deserializer):
+        state = {k: v for k, v in vars(value).items() if k not in _ignored}
+        if "_schema_ref" in state:
+            state["_schema_ref"] = schema_reference(state["_schema_ref"], module)
+        if "_item_ref" in state:
+            state["_item_ref"] = schema_reference(state["_item_ref"], module)
+        if isinstance(value, Schema) and not isinstance(value, fields.Nested):
+            state["schema"] = type(value)
+        return f"{name}{describe(state, seen, module)}"
+    if hasattr(value, "__dict__"):
+        return f"{name}{describe(vars(value), seen, module)}"
+    return f"{name}({getattr(value, 'path', '')!r})"
+
+
+def schema_reference(reference, module):
+    """The schema class a string reference names, if it can be imported, as Nested
+    and List resolve it when they're bound"""
+    if not isinstance(reference, str) or ("." not in reference and module is None):
+        return reference
+    try:
+        return import_class(reference, module)
+    except (ImportError, AttributeError, ValueError):
+        return reference
+
+
+def describe_schema_class(schema_class, seen) -> str:
+    name = f"{schema_class.__module__}.{schema_class.__qualname__}"
+    if id(schema_class) in seen:
+        return f"<ref {name}>"
+    seen.add(id(schema_class))
+    declaration = {"fields": list(schema_class._field_table), "meta": meta_options(schema_class)}
+    return f"{name}{describe(declaration, seen, schema_class.__module__)}"
+
+
+def meta_options(schema_class) -> dict:
+    """The Meta options a schema class declares, or inherits, as declared. Meta classes
+    are filled in with inherited options when first used, so those aren't read"""
+    options = dict()
+    for c in schema_class.mro():
+        meta = vars(c).get("Meta")
+        if meta is None:
+            continue
+        declared = vars(meta).get("_declared")
+        if declared is None:
+            declared = {k: v for k, v in vars(meta).items() if not k.startswith("_")}
+        for k, v in declared.items():
+            options.setdefault(k, v)
+    return options
+
+
+def fingerprint(schema_class, *args, **kwargs) -> str:
+    """Fingerprint of the schema `schema_class(*args, **kwargs)` would build, computed
+    from the declarations of it and the schemas nested in it, without constructing it"""
+    description = describe([
+        __version__,
+        sys.version_info[:2],
+        schema_class,
+        list(args),
+        kwargs,
+    ], module=schema_class.__module__)
+    return hashlib.sha256(description.encode()).hexdigest()[:20]
+
+
+def cached_schema(schema_class, *args, directory=None, **kwargs):
+    """
+    Return `schema_class(*args, **kwargs)`, unpickled from an on-disk cache if a schema
+    with the same fingerprint has been saved before, which skips binding the field tree.
+    Otherwise the schema is constructed, and saved to the cache. The cache directory
+    defaults to $YANKEE_CACHE_DIR, or ~/.cache/yankee
+    """
+    directory = directory or cache_dir()
+    key = fingerprint(schema_class, *args, **kwargs)
+    path = os.path.join(directory, f"{schema_class.__module__}.{schema_class.__qualname__}-{key}.pickle")
+    try:
+        with open(path, "rb") as f:
+            schema = pickle.load(f)
+        if type(schema) is schema_class:
+            return schema
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        # A stale or corrupt entry is rebuilt, and overwritten
+        pass
+    schema = schema_class(*args, **kwargs)
+    try:
+        data = pickle.dumps(schema)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # e.g. a schema with a lambda formatter, or defined inside a function
+        return schema
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as f:
+            f.write(data)
+        os.replace(f.name, path)
+    except OSError:
+        pass
+    return schema
@@ -0,0 +1,104 @@
+import pickle
+import sys
+
+from yankee.util import import_class
+from yankee.xml.schema import Schema, fields as f
+
+from .cache import cached_schema, fingerprint
+
+
+class PartSchema(Schema):
+    number = f.Int("./number")
+    made = f.Date("./made", dt_format="%d/%m/%Y")
+
+
+class AssemblySchema(Schema):
+    class Meta:
+        compiled = True
+    name = f.Str("./name")
+    main_part = PartSchema("./main")
+    parts = f.List(f.Nested(PartSchema()), "./part")
+
+
+doc = """
+<assembly>
+    <name>Widget</name>
+    <main><number>1</number><made>03/02/2021</made></main>
+    <part><number>2</number><made>04/02/2021</made></part>
+    <part><number>3</number></part>
+</assembly>
+"""
+
+
+def test_pickle_schema():
+    schema = AssemblySchema()
+    expected = schema.load(doc)
+    restored = pickle.loads(pickle.dumps(schema))
+    assert "accessor" not in restored.fields["name"].__dict__
+    assert restored.load(doc) == expected
+    assert restored._plan is not None
+    assert pickle.loads(pickle.dumps(restored)).load(doc) == expected
+
+
+def test_fingerprint():
+    assert fingerprint(AssemblySchema) == fingerprint(AssemblySchema)
+    assert fingerprint(AssemblySchema) != fingerprint(PartSchema)
+    assert fingerprint(PartSchema) != fingerprint(PartSchema, "./part")
+
+
+def test_cached_schema(tmp_path):
+    schema = cached_schema(AssemblySchema, directory=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 1
+    cached = cached_schema(AssemblySchema, directory=tmp_path)
+    assert cached is not schema
+    assert cached.load(doc) == schema.load(doc)
+    next(tmp_path.iterdir()).write_bytes(b"corrupt")
+    assert cached_schema(AssemblySchema, directory=tmp_path).load(doc) == schema.load(doc)
+
+
+class InnerSchema(Schema):
+    number = f.Int("./number")
+
+
+class OuterSchema(Schema):
+    inner = f.Nested("InnerSchema", "./main")
+    inners = f.List("InnerSchema", "./part")
+    made = f.Date("./main/made", dt_format="%d/%m/%Y")
+
+
+def test_fingerprint_is_stable_after_binding_and_loading():
+    key = fingerprint(OuterSchema)
+    schema = OuterSchema()
+    assert schema.fields["inners"].item_schema.__class__ is InnerSchema
+    schema.load(doc)
+    AssemblySchema().load(doc)
+    assert fingerprint(OuterSchema) == key
+    assert fingerprint(AssemblySchema) == fingerprint(AssemblySchema)
+
+
+class ChangedInnerSchema(Schema):
+    number = f.Int("./number")
+    made = f.Str("./made")
+
+
+class CachedOuterSchema(Schema):
+    inner = f.Nested("InnerSchema", "./main")
+    inners = f.List("InnerSchema", "./part")
+
+
+def test_cache_misses_when_nested_schema_changes(tmp_path, monkeypatch):
+    key = fingerprint(CachedOuterSchema)
+    cached_schema(CachedOuterSchema, directory=tmp_path)
+    monkeypatch.setattr(sys.modules[__name__], "InnerSchema", ChangedInnerSchema)
+    # String references are resolved once per process, so start afresh as a new process would
+    fields = dict(CachedOuterSchema._field_table)
+    monkeypatch.setattr(fields["inner"], "_schema", "InnerSchema")
+    monkeypatch.setattr(fields["inners"], "item_schema", "InnerSchema")
+    import_class.cache_clear()
+    try:
+        assert fingerprint(CachedOuterSchema) != key
+        schema = cached_schema(CachedOuterSchema, directory=tmp_path)
+        assert len(list(tmp_path.iterdir())) == 2
+        assert schema.load(doc).inner.made == "03/02/2021"
+    finally:
+        import_class.cache_clear()
@@ -0,0 +1,105 @@
+import datetime
+import re
+from functools import lru_cache
+
+# Formats with a fast parser. Anything else is parsed with dateutil
+compact_re = re.compile(r"\d{8}$")
+iso_re = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:[+-]\d{2}:\d{2})?)?$")
+
+
+def compact_datetime(text):
+    if len(text) != 8 or not text.isdigit():
+        raise ValueError(f"Not a YYYYMMDD date: {text!r}")
+    return datetime.datetime(int(text[:4]), int(text[4:6]), int(text[6:]))
+
+
+def compact_date(text):
+    if len(text) != 8 or not text.isdigit():
+        raise ValueError(f"Not a YYYYMMDD date: {text!r}")
+    return datetime.date(int(text[:4]), int(text[4:6]), int(text[6:]))
+
+
+def iso_datetime(text):
+    return datetime.datetime.fromisoformat(text)
+
+
+def iso_date(text):
+    if len(text) == 10:
+        return datetime.date.fromisoformat(text)
+    return datetime.datetime.fromisoformat(text).date()
+
+
+def dateutil_datetime(text):
+    from dateutil.parser import parse, isoparse
+    try:
+        return isoparse(text)
+    except ValueError:
+        return parse(text)
+
+
+def dateutil_date(text):
+    return dateutil_datetime(text).date()
+
+
+# (pattern, parser returning a datetime, parser returning a date)
+formats = (
+    (compact_re, compact_datetime, compact_date),
+    (iso_re, iso_datetime, iso_date),
+)
+
+
+def sniff(text, output_type=datetime.datetime):
+    """Return a fast parser for the format of `text`, or None if there isn't one"""
+    for pattern, to_datetime, to_date in formats:
+        if pattern.match(text):
+            return to_date if output_type is datetime.date else to_datetime
+    return None
+
+
+class DateParser(object):
+    """
+    Parses date strings into `output_type` (datetime.datetime or datetime.date).
+
+    The format is sniffed from the first value parsed, and later values are parsed
+    with a specialized parser for it (YYYYMMDD or ISO 8601), which builds dates
+    directly rather than via a datetime. Values that don't match are sniffed
+    again, and finally parsed with dateutil. Results for the last `cache_size`
+    distinct strings are cached, as bulk data repeats the same dates many times.
+    """
+
+    def __init__(self, output_type=datetime.datetime, cache_size=4096):
+        self.output_type = output_type
+        self.cache_size = cache_size
+        self.parser = None
+        self.parse = lru_cache(maxsize=cache_size)(self.parse_uncached)
+
+    def __call__(self, text):
+        return self.parse(text)
+
+    def parse_uncached(self, text):
+        if self.parser is not None:
+            try:
+                return self.parser(text)
+            except ValueError:
+                pass
+        parser = sniff(text, self.output_type)
+        if parser is not None:
+            try:
+                value = parser(text)
+                if self.parser is None:
+                    self.parser = parser
+                return value
+            except ValueError:
+                pass
+        return dateutil_date(text) if self.output_type is datetime.date else dateutil_datetime(text)
+
+    # The cache is a closure, so it is dropped when pickling and recreated empty
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["parse"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.parse = lru_cache(maxsize=self.cache_size)(self.parse_uncached)
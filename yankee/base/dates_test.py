@@ -0,0 +1,39 @@
+import datetime
+
+import pytest
+
+from .dates import DateParser, compact_date, iso_datetime, sniff
+
+
+def test_sniff():
+    assert sniff("20210504", datetime.date) is compact_date
+    assert sniff("2021-05-04T12:05", datetime.datetime) is iso_datetime
+    assert sniff("May 4, 2021") is None
+
+
+@pytest.mark.parametrize("output_type", [datetime.date, datetime.datetime])
+def test_date_parser(output_type):
+    parse = DateParser(output_type)
+    expected = output_type(2021, 5, 4)
+    assert parse("20210504") == expected
+    assert parse("2021-05-04") == expected
+    assert parse("May 4, 2021") == expected
+    assert parse("20210504") == expected
+    assert type(parse("20210504")) is output_type
+
+
+def test_date_parser_datetimes():
+    parse = DateParser(datetime.datetime)
+    assert parse("2021-05-04T12:05") == datetime.datetime(2021, 5, 4, 12, 5)
+    assert parse("2021-05-04T12:05:30+02:00").utcoffset() == datetime.timedelta(hours=2)
+    assert parse("20210504") == datetime.datetime(2021, 5, 4)
+    assert DateParser(datetime.date)("2021-05-04T12:05") == datetime.date(2021, 5, 4)
+
+
+def test_date_parser_mismatch_and_invalid():
+    parse = DateParser(datetime.date)
+    assert parse("20210504") == datetime.date(2021, 5, 4)
+    # Looks like YYYYMMDD, but isn't a valid date
+    with pytest.raises(ValueError):
+        parse("20211399")
+    assert parse("04 May 2021") == datetime.date(2021, 5, 4)
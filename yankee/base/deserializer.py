@@ -1,12 +1,53 @@
-from toolz.functoolz import compose
+import copy
+from contextvars import ContextVar
+from functools import lru_cache
+
 from yankee.util import inflect
 from yankee import settings
 from .accessor import python_accessor
 
+# The (deserializer, object) currently being loaded in this thread or task. Kept in a
+# context variable rather than on the deserializer, so schemas can be shared across threads
+_current_load = ContextVar("current_load", default=None)
+
+def pipeline(steps):
+    """Return a function that passes its argument through each of `steps` in turn"""
+    def run(obj):
+        for step in steps:
+            obj = step(obj)
+        return obj
+    return run
+
+_hooks = ("pre_load", "deserialize", "post_load", "load_model")
+
+def ignores_raw(hook):
+    """Mark a load hook as not reading `raw`. Hooks that override it aren't marked,
+    and so may read it"""
+    hook.ignores_raw = True
+    return hook
+
+@lru_cache(maxsize=None)
+def reads_raw(cls):
+    """Whether any of `cls`'s load hooks may read `raw`, i.e. isn't marked `ignores_raw`"""
+    return not all(getattr(getattr(cls, name), "ignores_raw", False) for name in _hooks)
+
+def with_raw(deserializer, func):
+    """Return `func`, made to record its argument as `deserializer.raw` while it runs"""
+    def run(obj):
+        token = _current_load.set((deserializer, obj))
+        try:
+            return func(obj)
+        finally:
+            _current_load.reset(token)
+    return run
+
 class DefaultMeta:
     accessor_function = python_accessor
     infer_keys = True
     output_style = "python"
+    compiled = False
+    single_pass = False
+    slots = False
 
 class Deserializer(object):
     Meta = DefaultMeta
@@ -21,13 +62,22 @@ class Deserializer(object):
         self.bind()
 
     def _build_meta(self):
-        for c in self.__class__.mro():
+        # Meta options are filled in from the MRO on the class's Meta, so this
+        # only needs to happen once per class
+        cls = self.__class__
+        if cls.__dict__.get("_meta_built"):
+            return
+        # Keep the options the Meta was declared with, before they're filled in
+        if "_declared" not in vars(self.Meta):
+            self.Meta._declared = {k: v for k, v in vars(self.Meta).items() if not k.startswith("_")}
+        for c in cls.mro():
             if not hasattr(c, "Meta"):
                 continue
             for k in filter(lambda k: not k.startswith("_"), c.Meta.__dict__.keys()):
                 if not hasattr(self.Meta, k):
                     setattr(self.Meta, k, getattr(c.Meta, k))
-                
+        cls._meta_built = True
+
     def bind(self, name=None, parent=None, meta=None):
         self.name = name
         self.parent = parent
@@ -41,27 +91,119 @@ class Deserializer(object):
         # Set Output Name
         if self.name is not None:
             self.output_name = inflect(self.name, style=self.Meta.output_style)
-        if settings.use_model:
-            self._load_func = compose(self.load_model, self.post_load, self.deserialize, self.pre_load)
-        else:
-            self._load_func = compose(self.post_load, self.deserialize, self.pre_load)
+        self._load_func = self.make_load_func()
         return self
 
+    def make_load_func(self):
+        """Build the load pipeline, leaving out any hooks that are no-ops"""
+        cls = self.__class__
+        steps = list()
+        if cls.pre_load is not Deserializer.pre_load:
+            steps.append(self.pre_load)
+        steps.append(self.deserialize)
+        if cls.post_load is not Deserializer.post_load:
+            steps.append(self.post_load)
+        if settings.use_model and cls.load_model is not Deserializer.load_model:
+            steps.append(self.load_model)
+        func = steps[0] if len(steps) == 1 else pipeline(tuple(steps))
+        return with_raw(self, func) if reads_raw(cls) else func
+
+    def finish_load(self, obj, raw=None):
+        """Apply the post_load and load_model hooks to an already deserialized object,
+        with `raw` as the object it was loaded from"""
+        cls = self.__class__
+        token = _current_load.set((self, raw))
+        try:
+            if cls.post_load is not Deserializer.post_load:
+                obj = self.post_load(obj)
+            if settings.use_model and cls.load_model is not Deserializer.load_model:
+                obj = self.load_model(obj)
+        finally:
+            _current_load.reset(token)
+        return obj
+
+    def make_loader(self):
+        """Return a callable equivalent to `load` for use in compiled schema plans"""
+        if self.__class__.load is Deserializer.load:
+            return self._load_func
+        return self.load
+
+    def compile(self):
+        return self
+
+    def detached(self):
+        """Return a copy of this deserializer with no data key, for loading a value
+        that has already been accessed. The copy shares its parent with the original"""
+        memo = {id(self.parent): self.parent} if getattr(self, "parent", None) is not None else {}
+        field = copy.deepcopy(self, memo)
+        field.data_key = False
+        field.make_accessor()
+        return field.compile()
+
     def make_accessor(self):
         self.accessor = self.Meta.accessor_function(self.data_key, self.name, self.many, self.Meta)
 
+    # Pickling - accessors and load functions are closures, so they are dropped,
+    # and rebuilt from the data key and Meta options the first time they are used
+    # after the object is restored. XPaths etc. are only compiled for fields that load
+
+    _derived = ("accessor", "_load_func")
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for attr in self._derived:
+            state.pop(attr, None)
+        # The object last loaded isn't part of the schema
+        state.pop("_raw", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, so this costs nothing once rebuilt
+        if name not in Deserializer._derived or "_load_func" in self.__dict__:
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+        self.rebuild()
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}") from None
+
+    def rebuild(self):
+        """Recreate the accessor and load function of a bound deserializer, without rebinding"""
+        self.make_accessor()
+        self._load_func = self.make_load_func()
+
     def load(self, obj):
-        self.raw = obj
+        self.__dict__["_raw"] = obj
         return self._load_func(obj)
 
+    @property
+    def raw(self):
+        """The object this deserializer is currently loading, e.g. for use in post_load.
+        Outside of a load, the object last passed to `load` (or assigned), or None"""
+        current = _current_load.get()
+        if current is not None and current[0] is self:
+            return current[1]
+        return self.__dict__.get("_raw")
+
+    @raw.setter
+    def raw(self, value):
+        self.__dict__["_raw"] = value
+
+    @ignores_raw
     def pre_load(self, obj):
         return obj
 
+    @ignores_raw
     def load_model(self, obj):
         return obj
     
+    @ignores_raw
     def deserialize(self, obj):
         return self.accessor(obj)
 
+    @ignores_raw
     def post_load(self, obj):
         return obj
@@ -2,15 +2,13 @@ from __future__ import annotations
 import typing
 import datetime
 import re
-import importlib
 import warnings
 
-from dateutil.parser import parse as parse_dt, isoparse
-
 from yankee.util import AttrDict, clean_whitespace, is_valid, import_class
 
 from yankee.data.collection import ListCollection
-from .deserializer import Deserializer
+from .dates import DateParser
+from .deserializer import Deserializer, ignores_raw
 from .schema import Schema
 from functools import partial
 
@@ -26,6 +24,15 @@ class Field(Deserializer):
         result = super().load(obj)
         return result if is_valid(result) else self.default
 
+    def make_loader(self):
+        if self.__class__.load is not Field.load:
+            return self.load
+        load_func, default = self._load_func, self.default
+        def loader(obj):
+            result = load_func(obj)
+            return result if is_valid(result) else default
+        return loader
+
 class String(Field):
     """String Field
 
@@ -36,12 +43,25 @@ class String(Field):
         null_value (str): a string value to indicate that it should be None. Some data sources use a hyphen or other symbol rather than empty value
     """
     output_type = str
+    # Set by the XML and HTML mixins for fields whose data key only selects elements,
+    # to read the selected element's text (as to_string would return it) in one call
+    text_accessor = None
+    _derived = Field._derived + ("text_accessor",)
+
     def __init__(self, *args, formatter=None, null_value=None, **kwargs):
-        super().__init__(*args, **kwargs)
+        # Set before binding, which may choose the accessor by the formatter
         self.formatter = formatter or partial(clean_whitespace, preserve_newlines=True)
         self.null_value = null_value
+        super().__init__(*args, **kwargs)
 
+    @ignores_raw
     def deserialize(self, elem) -> "Optional[str]":
+        if self.text_accessor is not None:
+            # An element is never "" or the null_value, only missing
+            text = self.text_accessor(elem)
+            if text is None:
+                return None
+            return self.formatter(text) if self.formatter else text
         elem = super().deserialize(elem)
         if elem is None or elem == "" or elem == self.null_value:
             return None
@@ -52,10 +72,14 @@ class String(Field):
         return str(elem)
 
 
+def strptime(dt_format, text):
+    return datetime.datetime.strptime(text, dt_format)
+
+
 class DateTime(String):
     """DateTime Field
     
-    Always outputs a datetime.datetime value. The initial value retrieved should be a string, which is then parsed as an isoformatted date. If that parsing fails, it uses `dateutil.parser.parse` to attempt to retrieve a datetime.
+    Always outputs a datetime.datetime value. The initial value retrieved should be a string. YYYYMMDD and isoformatted dates are parsed with fast parsers, chosen by sniffing the format of the first value. If that parsing fails, it uses `dateutil.parser.parse` to attempt to retrieve a datetime. See `yankee.base.dates.DateParser`
     
     Args:
         dt_format (str): a formatting string from datetime.datetime.strptime to use
@@ -67,18 +91,18 @@ class DateTime(String):
         if dt_converter:
             self.parse_date = dt_converter
         elif dt_format:
-            self.parse_date = lambda s: datetime.datetime.strptime(s, dt_format)
+            self.parse_date = partial(strptime, dt_format)
+        self.date_parser = DateParser(self.output_type)
 
     def parse_date(self, text:str):
-        try:
-            return isoparse(text)
-        except ValueError:
-            return parse_dt(text)
+        return self.date_parser(text)
 
+    @ignores_raw
     def deserialize(self, elem) -> "Optional[datetime.datetime]":
         string = super(DateTime, self).deserialize(elem)
         return self.parse_date(string) if string else None
 
+    @ignores_raw
     def post_load(self, obj):
         if self.Meta.output_style == "json":
             return obj.isoformat()
@@ -90,9 +114,11 @@ class Date(DateTime):
     Always outputs a datetime.date value. Uses the same args as DateTime
     """
     output_type = datetime.date
+    @ignores_raw
     def deserialize(self, elem) -> "Optional[datetime.date]":
-        date_time = super().deserialize(elem)
-        return date_time.date() if date_time else None
+        # The default parser returns dates, but custom ones may return datetimes
+        value = super().deserialize(elem)
+        return value.date() if isinstance(value, datetime.datetime) else value
 
 
 class Boolean(String):
@@ -118,6 +144,7 @@ class Boolean(String):
         if not self.case_sensitive:
             self.true_value = self.true_value.lower()
 
+    @ignores_raw
     def deserialize(self, elem) -> "Optional[bool]":
         string = super(Boolean, self).deserialize(elem)
         if string is None or string == '':
@@ -135,6 +162,7 @@ class Float(String):
     Always outputs a float value
     """
     output_type = float
+    @ignores_raw
     def deserialize(self, elem) -> "Optional[float]":
         string = super(Float, self).deserialize(elem)
         return float(string) if string is not None else None
@@ -146,6 +174,7 @@ class Integer(String):
     Always outputs an integer value. If the value is a float, the result will be the result of calling `int` on the value.
     """
     output_type = int
+    @ignores_raw
     def deserialize(self, elem) -> "Optional[int]":
         string = super(Integer, self).deserialize(elem)
         return int(string) if string is not None else None
@@ -157,6 +186,7 @@ class Exists(Field):
     Outputs true if the data item is present, else false
     """
     output_type = bool
+    @ignores_raw
     def deserialize(self, elem) -> bool:
         obj = super(Exists, self).deserialize(elem)
         return obj is not None
@@ -177,6 +207,7 @@ class Const(Field):
             warnings.warn(f"Constant has unassigned output type - cannot infer output schema without constant type information")
         self.output_type = output_type
 
+    @ignores_raw
     def deserialize(self, elem) -> "Any":
         return self.const
     
@@ -186,6 +217,8 @@ class Const(Field):
 class Nested(Schema):
     output_type = dict
     def __init__(self, schema, *args, **kwargs):
+        # The schema as declared, as _schema is replaced by an instance when bound
+        self._schema_ref = schema
         self._schema = schema
         self._args = args
         self._kwargs = kwargs
@@ -194,9 +227,7 @@ class Nested(Schema):
     def bind(self, name=None, parent=None, meta=None):
         super().bind(name=name, parent=parent)
         if isinstance(self._schema, str):
-            *module, _schema = self._schema.split(".")
-            module = ".".join(module) or parent.__module__
-            schema_class = getattr(importlib.import_module(module), _schema)
+            schema_class = import_class(self._schema, parent.__module__ if parent is not None else None)
             self._schema = schema_class(*self._args, **self._kwargs)
         self._schema.bind(name, parent, meta)
 
@@ -205,6 +236,21 @@ class Nested(Schema):
             return
         return self._schema.make_accessor(*args, **kwargs)
 
+    def rebuild(self):
+        # The nested schema rebuilds its own accessor when it is restored
+        self._load_func = self.make_load_func()
+
+    def _setup(self):
+        # Loads are passed to the nested schema, which is set up in its place
+        pass
+
+    def compile(self):
+        self._schema.compile()
+        return self
+
+    def make_loader(self):
+        return self._schema.make_loader()
+
     def load(self, obj):
         return self._schema.load(obj)
 
@@ -212,6 +258,8 @@ class List(Field):
     output_type = list
     def __init__(self, item_schema, data_key=None, **kwargs):
         kwargs['many'] = True
+        # The item schema as declared, as item_schema is replaced by an instance when bound
+        self._item_ref = item_schema
         self.item_schema = item_schema
         if callable(self.item_schema):
             self.item_schema = item_schema()
@@ -220,16 +268,16 @@ class List(Field):
     def bind(self, name=None, schema=None, meta=None):
         super().bind(name, schema, meta)
         if isinstance(self.item_schema, str):
-            *module, _schema = self.item_schema.split(".")
-            if module:
-                module = ".".join(module)
-            elif schema is not None:
-                module = schema.__module__
-            else:
+            if "." not in self.item_schema and schema is None:
                 return
-            self.item_schema = getattr(importlib.import_module(module), self.item_schema)()
+            module = schema.__module__ if schema is not None else None
+            self.item_schema = import_class(self.item_schema, module)()
         self.item_schema.bind(None, schema)
 
+    def compile(self):
+        self.item_schema.compile()
+        return self
+
     def load(self, obj):
         obj = super().load(obj)
         if not obj:
@@ -247,6 +295,11 @@ class Dictionary(List):
         self.key = key
         self.value = value
         return super().__init__(Field(), data_key, **kwargs)
+
+    def compile(self):
+        self.key.compile()
+        self.value.compile()
+        return self
     
     def load(self, obj):
         obj = self.deserialize(obj)
@@ -271,6 +324,11 @@ class DelimitedString(String):
         super().bind(name, schema, meta=None)
         self.item_schema.bind(None, schema)
 
+    def compile(self):
+        self.item_schema.compile()
+        return self
+
+    @ignores_raw
     def deserialize(self, obj):
         obj = super().deserialize(obj)
         if obj is None:
@@ -308,6 +366,7 @@ class Alternative(Schema):
     in different contexts. This has fields like a schema, then
     passes as a value the first non-empty or non-null result"""
 
+    @ignores_raw
     def deserialize(self, et_elem):
         obj = super().deserialize(et_elem)
         return next((v for v in obj.values() if is_valid(v)), None)
@@ -0,0 +1,138 @@
+import copy
+
+from . import fields
+
+WHOLE = None
+
+
+def path_tree(paths):
+    """
+    Convert dotted output paths (e.g. "claims.0.text") into a nested dict of names.
+    Numeric segments address list items, and are skipped. A name mapped to
+    WHOLE selects the entire field
+    """
+    tree = dict()
+    for path in paths or ():
+        segments = [s for s in path.split(".") if not s.isdigit()]
+        if not segments:
+            continue
+        *parents, last = segments
+        node = tree
+        for seg in parents:
+            child = node.setdefault(seg, dict())
+            if child is WHOLE:
+                break
+            node = child
+        else:
+            node[last] = WHOLE
+    return tree
+
+
+def children(deserializer):
+    """The deserializers directly inside a bound field tree node"""
+    for attr in ("_schema", "item_schema", "key", "value"):
+        child = getattr(deserializer, attr, None)
+        if child is not None and not isinstance(child, str) and hasattr(child, "bind"):
+            yield child
+    yield from (getattr(deserializer, "fields", None) or {}).values()
+    yield from getattr(deserializer, "schemas", None) or ()
+
+
+def reset(deserializer):
+    """Drop compiled plans throughout a field tree, so they are rebuilt for a copy"""
+    stack = [deserializer]
+    while stack:
+        d = stack.pop()
+        for attr in ("_plan", "_plan_index", "_single_pass_plan", "_projections"):
+            d.__dict__.pop(attr, None)
+        stack.extend(children(d))
+
+
+def match(tree, names):
+    for name in names:
+        if name in tree:
+            return True, tree[name]
+    return False, WHOLE
+
+
+def prune(deserializer, only, exclude, validate=True):
+    """
+    Remove fields from a bound field tree in place. `only` and `exclude` are
+    trees from `path_tree`; `only=None` keeps everything. Returns the names
+    that were matched at this level
+    """
+    if isinstance(deserializer, fields.Nested):
+        return prune(deserializer._schema, only, exclude, validate)
+    if isinstance(deserializer, (fields.List, fields.DelimitedString)) and not isinstance(deserializer, fields.Dictionary):
+        return prune(deserializer.item_schema, only, exclude, validate)
+    # Combine fields output one value built from all of their children,
+    # and Dictionary keys are data, so neither can be pruned
+    if isinstance(deserializer, (fields.Combine, fields.Dictionary)):
+        return set()
+    schema_fields = getattr(deserializer, "fields", None)
+    if schema_fields is None:
+        return set()
+    matched, kept = set(), dict()
+    for key, field in schema_fields.items():
+        names = (key, getattr(field, "output_name", key))
+        if getattr(field, "flatten", False) and getattr(field, "fields", None) is not None:
+            matched |= prune(field, only, exclude, validate=False)
+            if only is None or field.fields:
+                kept[key] = field
+            continue
+        in_only, sub_only = match(only, names) if only is not None else (True, WHOLE)
+        in_exclude, sub_exclude = match(exclude, names) if exclude else (False, WHOLE)
+        if in_only and only is not None:
+            matched.add(next(n for n in names if n in only))
+        if in_exclude:
+            matched.add(next(n for n in names if n in exclude))
+        if not in_only or (in_exclude and sub_exclude is WHOLE):
+            continue
+        if sub_only is not WHOLE or in_exclude:
+            prune(field, sub_only, sub_exclude if in_exclude else None)
+        kept[key] = field
+    if validate:
+        unknown = (set(only or ()) | set(exclude or ())) - matched
+        if unknown:
+            raise ValueError(f"{deserializer.__class__.__name__} has no fields named {sorted(unknown)}")
+    deserializer.fields = kept
+    return matched
+
+
+def project(schema, only=None, exclude=None):
+    """Return a bound copy of `schema` that only loads the fields selected by `only`
+    (a list of dotted output paths), minus those in `exclude`"""
+    parent = getattr(schema, "parent", None)
+    memo = {id(parent): parent} if parent is not None else {}
+    projections = schema.__dict__.get("_projections")
+    if projections is not None:
+        memo[id(projections)] = None
+    projected = copy.deepcopy(schema, memo)
+    reset(projected)
+    prune(projected, path_tree(only) if only is not None else None, path_tree(exclude))
+    return projected.compile()
+
+
+def matches(value, condition):
+    if callable(condition):
+        return bool(condition(value))
+    if isinstance(value, list) and not isinstance(condition, list):
+        return any(matches(v, condition) for v in value)
+    return value == condition
+
+
+def where_filter(schema, where):
+    """
+    Build a predicate from `where`, a dict mapping dotted output paths to either
+    a value to compare against, or a callable that takes the field value and
+    returns True to keep the record. Paths that resolve to lists match if any
+    item matches. Only the fields named in `where` are loaded to evaluate it
+    """
+    from yankee.data.util import resolve
+
+    predicate_schema = schema.project(list(where))
+    conditions = tuple(where.items())
+    def predicate(obj):
+        partial = predicate_schema.load(obj)
+        return all(matches(resolve(partial, path), condition) for path, condition in conditions)
+    return predicate
@@ -1,17 +1,30 @@
 import re
+from collections import deque
+import sys
+import warnings
 import dataclasses as dc
 import importlib
 import copy
 from yankee.util import is_valid, AttrDict, clean_whitespace, unzip_records, import_class
 from yankee import settings
 from yankee.data import Row, AttrDict
-from .deserializer import Deserializer, DefaultMeta
+from yankee.data.util import row_fields
+from yankee.data.lazy import LazyRow
+from .deserializer import Deserializer, DefaultMeta, ignores_raw
 from .accessor import python_accessor
 from yankee.data.collection import Collection, ListCollection
+from yankee.io.iterparse import compile_pattern
+
+# Returned by record loaders for records that are filtered out
+SKIP = object()
 
 class Schema(Deserializer):
     output_type = dict
     __model__ = None
+    _plan = None
+    _plan_index = None
+    _projections = None
+    _field_table = ()
     def __init__(
         self,
         *args,
@@ -22,13 +35,25 @@ class Schema(Deserializer):
         self.flatten = flatten
         self.prefix = prefix
         super().__init__(*args, **kwargs)
-        self.bind()
+
+    def __init_subclass__(cls, **kwargs):
+        # Collect the fields declared on the class and its superclasses once, when
+        # the class is created, rather than walking the MRO for every instance
+        super().__init_subclass__(**kwargs)
+        class_fields = list()
+        for c in reversed(cls.mro()):
+            class_fields += [
+                (k, v) for k, v in c.__dict__.items() if isinstance(v, Deserializer)
+            ]
+        cls._field_table = tuple(dict(class_fields).items())
 
     def bind(self, name=None, parent=None, meta=None):
         super().bind(name, parent)
         # Make sure that fields are grabbed from superclasses as well
         self.fields = self.get_fields()
         self.bind_fields()
+        self._plan = None
+        self._projections = None
 
     def bind_fields(self, meta=None):
         for name, field in self.fields.items():
@@ -38,12 +63,21 @@ class Schema(Deserializer):
                 field.bind(name, self, meta)
 
     def get_fields(self):
-        class_fields = list()
-        for c in reversed(self.__class__.mro()):
-            class_fields += [
-                (k, v) for k, v in c.__dict__.items() if isinstance(v, Deserializer)
-            ]
-        return dict(class_fields)
+        return dict(self._field_table)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Compiled plans are closures too, and are recompiled on first load (the
+        # rest of the field tree may not be restored yet when this object is).
+        # The model is dropped, as a generated dataclass can't be imported by
+        # name, and is recreated on first load
+        state["_compiled"] = self._plan is not None
+        for attr in ("_plan", "_plan_index", "_single_pass_plan", "_projections"):
+            if attr in state:
+                state[attr] = None
+        state.pop("__model__", None)
+        return state
+
 
     def get_model(self):
         # Model class is expressly there
@@ -60,14 +94,106 @@ class Schema(Deserializer):
                 raise e
             self.__model__ = self.make_dataclass()
         
-    def load(self, obj):
+    def compile(self):
+        """Flatten the bound field tree into a plan of (output_name, loader, flatten)
+        tuples, so that loading a record is a single loop over precomputed loaders.
+        This happens automatically on first load if `Meta.compiled` is True"""
+        for field in self.fields.values():
+            field.compile()
+        self._plan = tuple(
+            (field.output_name, field.make_loader(), bool(getattr(field, "flatten", False)))
+            for field in self.fields.values()
+        )
+        self._plan_index = {name: i for i, (name, _, flatten) in enumerate(self._plan) if not flatten}
+        return self
+
+    def coerce(self, obj):
+        """Convert raw input (e.g. a string or bytes) into the object fields are read from"""
+        return obj
+
+    def load_lazy(self, obj) -> "LazyRow":
+        """Return a LazyRow that loads each field from `obj` only when it is first read.
+        Schemas that override deserialize or load_fields (e.g. RegexSchema or ZipSchema)
+        don't read their fields from `obj` directly, so they're loaded eagerly, and the
+        loaded record is returned instead"""
+        if not self._loads_by_field():
+            return self.load(obj)
         if settings.use_model:
             self.get_model()
-        return super().load(obj)
+        if self._plan is None:
+            self.compile()
+        obj = self.coerce(obj)
+        if self.__class__.pre_load is not Deserializer.pre_load:
+            obj = self.pre_load(obj)
+        return LazyRow(self, self.accessor(obj), obj)
 
+    def _loads_by_field(self):
+        # LazyRow loads each field from the accessed object, as Schema.deserialize does
+        cls = self.__class__
+        return cls.deserialize is Schema.deserialize and cls.load_fields is Schema.load_fields
+
+    def project(self, only=None, exclude=None) -> "Schema":
+        """Return a bound copy of this schema that only loads the fields named in `only`,
+        minus any in `exclude`. Both are lists of dotted output paths, e.g. "claims.0.text",
+        and reach into Nested, List and ZipSchema fields. Projections are cached"""
+        key = (tuple(only) if only is not None else None, tuple(exclude or ()))
+        if self._projections is None:
+            self._projections = dict()
+        if key not in self._projections:
+            from .project import project
+            self._projections[key] = project(self, only, exclude)
+        return self._projections[key]
+
+    def prepare(self):
+        """Do the one-time setup that load otherwise does on first use, for this schema
+        and every schema nested in it, so that it can then be shared between threads"""
+        from .project import children
+        seen, stack = set(), [self]
+        while stack:
+            deserializer = stack.pop()
+            if id(deserializer) in seen:
+                continue
+            seen.add(id(deserializer))
+            if isinstance(deserializer, Schema):
+                deserializer._setup()
+            stack.extend(children(deserializer))
+        return self
+
+    def _setup(self):
+        if settings.use_model:
+            self.get_model()
+        if self._plan is None and (self.Meta.compiled or self.__dict__.get("_compiled")):
+            self.compile()
+
+    def load(self, obj, only=None, exclude=None):
+        if only is not None or exclude is not None:
+            return self.project(only, exclude).load(obj)
+        self.__dict__["_raw"] = obj
+        self._setup()
+        return self._load_func(obj)
+
+    def load_many(self, objs, executor=None, workers=None) -> "ListCollection":
+        """
+        Load many records on a pool of threads (or on `executor`, if given), returning
+        results in order. lxml releases the GIL while parsing, so raw XML records can
+        be parsed in parallel. The schema is prepared first, and is then shared safely
+        by all threads
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        self.prepare()
+        if executor is not None:
+            return ListCollection(executor.map(self.load, objs))
+        with ThreadPoolExecutor(workers) as pool:
+            return ListCollection(pool.map(self.load, objs))
+
+    @ignores_raw
     def deserialize(self, obj) -> "Dict":
+        return self.load_fields(self.accessor(obj))
+
+    def load_fields(self, obj) -> "Dict":
+        if self._plan is not None:
+            return self._load_plan(obj)
         output = AttrDict()
-        obj = self.accessor(obj)
         for key, field in self.fields.items():
             value = field.load(obj)
             # If there is no value, don't include anything in the output dictionary
@@ -81,6 +207,19 @@ class Schema(Deserializer):
             output.update(value)
         return output
 
+    def _load_plan(self, obj) -> "Dict":
+        output = AttrDict()
+        for output_name, loader, flatten in self._plan:
+            value = loader(obj)
+            if not is_valid(value):
+                continue
+            if flatten and isinstance(value, dict):
+                output.update(value)
+            else:
+                output[output_name] = value
+        return output
+
+    @ignores_raw
     def load_model(self, obj):
         return self.__model__(**obj)
 
@@ -95,16 +234,127 @@ class Schema(Deserializer):
             (f.output_name, f.output_type, self.make_field(f.output_type))
             for f in self.fields.values()
             )
+        options = dict()
+        if getattr(self.Meta, "slots", False):
+            if sys.version_info >= (3, 10):
+                options["slots"] = True
+            else:
+                warnings.warn("Meta.slots requires Python 3.10 or later - generating a regular dataclass")
         dataclass = dc.make_dataclass(
             cls_name=self.__class__.__name__.replace("Schema", ""),
             fields=fields,
-            bases=(Row,)
+            bases=(Row,),
+            **options
         )
+        row_fields(dataclass)
         return dataclass
 
+    def column_types(self) -> "Dict[str, type]":
+        """Map of output name to output_type for each field, with flattened fields merged in"""
+        types = dict()
+        for field in self.fields.values():
+            if getattr(field, "flatten", False) and hasattr(field, "column_types"):
+                types.update(field.column_types())
+            else:
+                types[field.output_name] = field.output_type
+        return types
+
+    def load_iter(self, records, where=None, prefilter=None, record_tag=None) -> "Collection":
+        """
+        Load records lazily, skipping records that don't match without fully loading them.
+
+        `records` is an iterable of raw records, or a bulk file if `record_tag` is given.
+        `prefilter` is a regex searched in each raw (str or bytes) record before parsing.
+        `where` is either a dict of {output path: value or callable}, evaluated by loading
+        only the fields it names, or a callable that receives a LazyRow, so only the
+        fields it reads are loaded. Matching records are then fully loaded.
+        """
+        if record_tag is not None:
+            records = self.iter_records(records, record_tag)
+        return Collection(self._load_where(records, where, compile_pattern(prefilter)), schema=self)
+
+    def _load_where(self, records, where, prefilter):
+        load = self.record_loader(where, prefilter)
+        for record in records:
+            result = load(record)
+            if result is not SKIP:
+                yield result
+
+    def record_loader(self, where=None, prefilter=None):
+        """Return a function that loads a raw record, or returns SKIP if it doesn't
+        match `prefilter` and `where`. See `load_iter`"""
+        prefilter = compile_pattern(prefilter)
+        if isinstance(where, dict):
+            from .project import where_filter
+            predicate = where_filter(self, where)
+        else:
+            predicate = where
+        def load(record):
+            if prefilter is not None and isinstance(record, (str, bytes, bytearray, memoryview)):
+                if prefilter.search(record.encode() if isinstance(record, str) else record) is None:
+                    return SKIP
+            obj = self.coerce(record)
+            if predicate is None:
+                return self.load(obj)
+            elif isinstance(where, dict):
+                return self.load(obj) if predicate(obj) else SKIP
+            row = self.load_lazy(obj)
+            if not isinstance(row, LazyRow):
+                return row if predicate(row) else SKIP
+            return row.materialize() if predicate(row) else SKIP
+        return load
+
+    def aload_iter(self, stream, record_tag=None, where=None, prefilter=None, executor=None, concurrency=4) -> "Collection":
+        """
+        Asynchronously load records from `stream`, an async (or sync) iterable of raw
+        records, or an async byte stream split into records if `record_tag` is given.
+        Loading runs in `executor` (default: the event loop's thread pool), with up to
+        `concurrency` records in flight, so parsing overlaps with reading the stream.
+        Records are yielded in order. `where` and `prefilter` are as for `load_iter`.
+        """
+        self.prepare()
+        if record_tag is not None:
+            stream = self.aiter_records(stream, record_tag)
+        return Collection(self._aload_where(stream, self.record_loader(where, prefilter), executor, concurrency), schema=self)
+
+    async def _aload_where(self, records, load, executor, concurrency):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        pending = deque()
+        async for record in Collection(records):
+            if len(pending) >= concurrency:
+                result = await pending.popleft()
+                if result is not SKIP:
+                    yield result
+            pending.append(loop.run_in_executor(executor, load, record))
+        while pending:
+            result = await pending.popleft()
+            if result is not SKIP:
+                yield result
+
+    def aiter_records(self, stream, record_tag):
+        raise NotImplementedError("Must be implemented in subclass!")
+
     def load_batch(self, objs):
         return ListCollection(self.load(o) for o in objs)
 
+    def iter_records(self, file_obj, record_tag):
+        raise NotImplementedError("Must be implemented in subclass!")
+
+    def load_parallel(self, file_obj, record_tag, workers=None, chunksize=100, ordered=True, max_in_flight=None):
+        """Split a bulk file into records in this process, and load them in a
+        pool of `workers` processes. See `yankee.io.parallel.parallel_load`"""
+        from yankee.io.parallel import parallel_load
+        records = self.iter_records(file_obj, record_tag)
+        return Collection(parallel_load(
+            self,
+            records,
+            workers=workers,
+            chunksize=chunksize,
+            ordered=ordered,
+            max_in_flight=max_in_flight,
+        ), schema=self)
+
 
 class PolymorphicSchema(Schema):
     def bind(self, name=None, parent=None, meta=None):
@@ -115,6 +365,7 @@ class PolymorphicSchema(Schema):
     def choose_schema(self, obj):
         raise NotImplementedError("Must be implemented in subclass!")
 
+    @ignores_raw
     def deserialize(self, raw_obj) -> "Dict":
         # Get the key one time only, rather than
         # on both deserializing the selector obj
@@ -134,6 +385,7 @@ class RegexSchema(Schema):
         self._regex = re.compile(self.__regex__)
         super().__init__(*args, **kwargs)
         
+    @ignores_raw
     def deserialize(self, obj):
         obj = self.accessor(obj)
         if obj is None:
@@ -143,19 +395,7 @@ class RegexSchema(Schema):
         if match is None:
             return dict()
         obj = self.convert_groupdict(match.groupdict())
-        output = AttrDict()
-        for key, field in self.fields.items():
-            value = field.load(obj)
-            # If there is no value, don't include anything in the output dictionary
-            if not is_valid(value):
-                continue
-            # If the value isn't a dict, or there's not flatten directive, add and continue
-            if not isinstance(value, dict) or not getattr(field, "flatten", False):
-                output[field.output_name] = value
-                continue
-            # Merge in flattened fields
-            output.update(value)
-        return output
+        return self.load_fields(obj)
 
     def bind_fields(self, meta=None):
         return super().bind_fields(DefaultMeta)
@@ -179,7 +419,8 @@ class ZipSchema(Schema):
         super().bind(name, parent)
         new_fields = dict()
         for name, field in self.fields.items():
-            f_copy = copy.deepcopy(field)
+            # Copy the field without copying this schema, which it refers to as its parent
+            f_copy = copy.deepcopy(field, {id(self): self})
             list_field = self.list_field(f_copy, field.data_key)
             f_copy.data_key = False
             f_copy.make_accessor()
@@ -187,9 +428,11 @@ class ZipSchema(Schema):
             new_fields[name] = list_field
         self.fields = new_fields
 
+    @ignores_raw
     def deserialize(self, obj) -> "Dict":
         result = unzip_records(super().deserialize(obj))
         return result
 
+    @ignores_raw
     def load_model(self, obj):
         return [self.__model__(**o) for o in obj]
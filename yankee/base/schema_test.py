@@ -3,6 +3,7 @@ import datetime
 import pytest
 from yankee import settings
 from yankee import Schema, fields as f
+from yankee.base.schema import RegexSchema
 
 doc1 = {
     "string": "Some String Data",
@@ -145,6 +146,21 @@ def test_list_field_by_string():
     data = schema.load(delayed_list_doc)
     assert data.to_dict() == delayed_list_doc
 
+class DottedListSchema(Schema):
+    l = f.List("yankee.base.schema_test.ItemSchema")
+
+def test_list_field_by_dotted_string():
+    schema = DottedListSchema()
+    data = schema.load(delayed_list_doc)
+    assert data.to_dict() == delayed_list_doc
+
+def test_field_table_built_at_class_creation():
+    assert [k for k, _ in ListSchema._field_table] == ["l"]
+    class ExtendedSchema(ListSchema):
+        extra = f.Str()
+    assert [k for k, _ in ExtendedSchema._field_table] == ["l", "extra"]
+    assert list(ExtendedSchema().fields) == ["l", "extra"]
+
 def test_loads_model():
     from .fixtures.schema import ObjectSchema
     from .fixtures.model import Object
@@ -154,3 +170,145 @@ def test_loads_model():
     schema.load({"foo": 1, "bar": 2})
     assert schema.__model__ == Object
     settings.use_model = old_setting
+
+class CompiledExampleSchema(ExampleSchema):
+    class Meta:
+        compiled = True
+
+def test_compiled_schema_matches_interpreted():
+    expected = ExampleSchema().load(doc1).to_dict()
+    schema = ExampleSchema().compile()
+    assert schema._plan is not None
+    assert schema.load(doc1).to_dict() == expected
+    assert schema.load(doc2).to_dict() == ExampleSchema().load(doc2).to_dict()
+
+def test_compiled_meta():
+    schema = CompiledExampleSchema()
+    data = schema.load(doc1)
+    assert schema._plan is not None
+    assert data.to_dict() == ExampleSchema().load(doc1).to_dict()
+
+def test_compiled_nested_and_list():
+    schema = ListSchema().compile()
+    assert schema.load(delayed_list_doc).to_dict() == delayed_list_doc
+    schema = SecondSchema().compile()
+    assert schema.load(delayed_data_doc).to_dict() == {"first_schema": {"string": "Some String"}}
+
+class SlotsExampleSchema(ExampleSchema):
+    class Meta:
+        slots = True
+
+def test_slots_model():
+    import tracemalloc
+
+    schema = SlotsExampleSchema()
+    compact = schema.make_dataclass()
+    regular = ExampleSchema().make_dataclass()
+    data = schema.load(doc1)
+    row = compact(**data)
+    assert not hasattr(row, "__dict__")
+    assert row.to_dict() == regular(**data).to_dict()
+    assert bool(row)
+    assert list(row.keys()) == list(regular(**data).keys())
+
+    def measure(model):
+        tracemalloc.start()
+        rows = [model(string=str(i)) for i in range(1000)]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size
+    assert measure(compact) < measure(regular)
+
+def test_load_lazy():
+    schema = ExampleSchema()
+    expected = ExampleSchema().load(doc1)
+    row = schema.load_lazy(doc1)
+    assert row._values == {}
+    assert row.string == "Some String Data"
+    assert row["date"] == datetime.date(2021, 5, 4)
+    assert len(row._values) == 2
+    assert row.bad_string is None
+    assert "bad_string" not in row and "string" in row
+    with pytest.raises(AttributeError):
+        row.not_a_field
+    assert row.materialize() == expected
+    assert row.to_dict() == expected.to_dict()
+
+class UpperSchema(Schema):
+    string = f.Str()
+
+    def deserialize(self, obj):
+        obj = dict(obj, string=obj["string"].upper())
+        return super().deserialize(obj)
+
+def test_load_lazy_overridden_deserialize():
+    schema = UpperSchema()
+    expected = schema.load(doc1)
+    assert schema.load_lazy(doc1) == expected
+    data = list(schema.load_iter([doc1], where=lambda row: row.string == "SOME STRING DATA"))
+    assert data == [expected]
+
+class PairSchema(RegexSchema):
+    __regex__ = r"(?P<a>[^;]+);(?P<b>[^;]+)"
+    a = f.Str()
+    b = f.Str()
+
+def test_load_lazy_regex():
+    schema = PairSchema()
+    expected = schema.load("first;second")
+    assert expected == {"a": "first", "b": "second"}
+    assert schema.load_lazy("first;second") == expected
+    assert list(schema.load_iter(["first;second", "x;y"], where=lambda row: row.a == "first")) == [expected]
+
+class FlattenedSchema(Schema):
+    string = f.Str()
+    sub = SubSchema(data_key=False, flatten=True)
+
+def test_load_lazy_flattened():
+    row = FlattenedSchema().load_lazy(doc1)
+    assert row.float == 1.234
+    assert row.materialize() == FlattenedSchema().load(doc1)
+
+class ProjectedSchema(Schema):
+    string = f.Str()
+    sub = SubSchema(False)
+    items = f.List(SubSchema, data_key="list")
+    flat = SubSchema(False, flatten=True)
+
+projection_doc = {
+    "string": "top",
+    "float": 1.5,
+    "list": [{"string": "a", "float": 1.0}, {"string": "b", "float": 2.0}],
+}
+
+def test_project_only():
+    schema = ProjectedSchema()
+    data = schema.load(projection_doc, only=["sub.float", "items.0.string"])
+    assert data.to_dict() == {"sub": {"float": 1.5}, "items": [{"string": "a"}, {"string": "b"}]}
+    projected = schema.project(["sub.float", "items.0.string"])
+    assert projected is schema.project(["sub.float", "items.0.string"])
+    assert list(projected.fields) == ["sub", "items"]
+    # The original schema is untouched
+    assert schema.load(projection_doc).to_dict()["sub"] == {"string": "top", "float": 1.5}
+    assert list(schema.fields["sub"].fields) == ["string", "float"]
+
+def test_project_exclude():
+    schema = ProjectedSchema()
+    data = schema.load(projection_doc, exclude=["sub", "items.float", "string"])
+    assert data.to_dict() == {"items": [{"string": "a"}, {"string": "b"}], "float": 1.5}
+
+def test_project_flattened_and_unknown():
+    schema = ProjectedSchema()
+    assert schema.load(projection_doc, only=["float"]).to_dict() == {"float": 1.5}
+    with pytest.raises(ValueError):
+        schema.project(["not_a_field"])
+
+def test_load_iter_where_paths():
+    records = [
+        {"string": str(i), "float": float(i), "list": [{"string": "x"}, {"string": str(i % 3)}]}
+        for i in range(9)
+    ]
+    schema = ProjectedSchema()
+    data = schema.load_iter(records, where={"items.string": "2", "sub.float": lambda v: v > 3}).to_list()
+    assert [d.string for d in data] == ["5", "8"]
+    assert data[0].to_dict() == schema.load(records[5]).to_dict()
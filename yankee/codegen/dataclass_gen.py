@@ -1,8 +1,43 @@
+import builtins
+import dataclasses
 
 
-def generate_dc_code(dc):
-    code = list()
-    code.append("from dataclasses import dataclass, field")
+def type_name(t, imports):
+    if isinstance(t, str):
+        return repr(t)
+    module = getattr(t, "__module__", None)
+    name = getattr(t, "__qualname__", None)
+    if module is None or name is None:
+        return repr(str(t))
+    if module == "builtins":
+        return name
+    if module == "typing":
+        return f"'{t}'".replace("typing.", "")
+    imports.add(f"import {module}")
+    return f"{module}.{name}"
+
+
+def generate_dc_code(dc, slots=False):
+    """Generate the source code of a dataclass equivalent to `dc`, e.g. a model
+    generated by Schema.make_dataclass. If `slots` is True, the generated
+    class uses __slots__ instead of an instance __dict__ (Python 3.10+)"""
+    imports = {"from dataclasses import dataclass, field", "from yankee.data import Row"}
+    body = list()
+    for f in dataclasses.fields(dc):
+        annotation = type_name(f.type, imports)
+        if f.default_factory is not dataclasses.MISSING:
+            factory = f.default_factory
+            if getattr(builtins, factory.__name__, None) is not factory:
+                imports.add(f"from {factory.__module__} import {factory.__name__}")
+            body.append(f"    {f.name}: {annotation} = field(default_factory={factory.__name__})")
+        elif f.default is not dataclasses.MISSING:
+            body.append(f"    {f.name}: {annotation} = {f.default!r}")
+        else:
+            body.append(f"    {f.name}: {annotation}")
+    code = sorted(imports)
+    code.append("")
     code.append("")
-    code.append("@dataclass")
-    
\ No newline at end of file
+    code.append("@dataclass(slots=True)" if slots else "@dataclass")
+    code.append(f"class {dc.__name__}(Row):")
+    code += body or ["    pass"]
+    return "\n".join(code) + "\n"
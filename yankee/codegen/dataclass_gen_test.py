@@ -1,7 +1,6 @@
 import dataclasses as dc
 from .dataclass_gen import generate_dc_code
 from yankee.data import Row
-from pathlib import Path
 
 import pytest
 
@@ -12,9 +11,33 @@ class Example(Row):
 
     def example_function(self):
         pass
-@pytest.mark.skip("WIP")
-def test_generate_dc_code():
-    source = generate_dc_code(Example)
-    with (Path(__file__).parent / "example.py").open("w") as f:
-        f.write(source)
-    assert True
\ No newline at end of file
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_generate_dc_code(slots):
+    source = generate_dc_code(Example, slots=slots)
+    assert ("@dataclass(slots=True)" in source) == slots
+    assert "    b: 'List' = field(default_factory=list)" in source
+    namespace = dict()
+    exec(source, namespace)
+    generated = namespace["Example"](a=1)
+    assert hasattr(generated, "__dict__") != slots
+    assert generated.to_dict() == {"a": 1, "b": []}
+    assert [f.name for f in dc.fields(generated)] == ["a", "b"]
+
+def test_generate_slots_dc_code():
+    from yankee.data.collection import ListCollection
+
+    @dc.dataclass
+    class Model(Row):
+        a: int = None
+        when: "datetime.date" = None
+        items: list = dc.field(default_factory=ListCollection)
+
+    source = generate_dc_code(Model, slots=True)
+    assert "@dataclass(slots=True)" in source
+    namespace = dict()
+    exec(source, namespace)
+    generated = namespace["Model"](a=1)
+    assert not hasattr(generated, "__dict__")
+    assert generated.to_dict() == {"a": 1, "when": None, "items": []}
+    assert isinstance(generated.items, ListCollection)
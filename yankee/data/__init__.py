@@ -1,3 +1,4 @@
 from .row import Row
 from .collection import Collection, ValuesCollection, ValuesListCollection, UnpackedCollection, ExplodedCollection, ListCollection
-from .attrdict import AttrDict
\ No newline at end of file
+from .attrdict import AttrDict
+from .lazy import LazyRow
\ No newline at end of file
@@ -0,0 +1,243 @@
+import datetime
+
+from .columnar import ColumnBuilder, arrow_scalar_type
+
+
+def arrow_type(field) -> "pyarrow.DataType":
+    """
+    Arrow type for the output of a bound yankee field. Schema-like fields map to
+    structs, List fields to lists of their item type, and ZipSchemas to lists of
+    structs of their fields' item types. Returns None where the type can't be known
+    from the schema alone (e.g. Dictionary fields, or Alternative and PolymorphicSchema
+    fields, which output one of several types), so that pyarrow infers it from the
+    data instead.
+    """
+    import pyarrow as pa
+    from yankee.base import fields
+    from yankee.base.schema import PolymorphicSchema, ZipSchema
+
+    if isinstance(field, fields.Nested):
+        return arrow_type(field._schema)
+    if isinstance(field, (fields.Dictionary, fields.Alternative, PolymorphicSchema)):
+        return None
+    if isinstance(field, ZipSchema):
+        # Each of its fields is a List, zipped together into one record per item
+        item_fields = list()
+        for sub_field in field.fields.values():
+            item_type = arrow_type(sub_field.item_schema)
+            if item_type is None:
+                return None
+            item_fields.append(pa.field(sub_field.output_name, item_type))
+        return pa.list_(pa.struct(item_fields))
+    if isinstance(field, (fields.List, fields.DelimitedString)):
+        item_type = arrow_type(field.item_schema)
+        return pa.list_(item_type) if item_type is not None else None
+    output_type = getattr(field, "output_type", None)
+    if output_type is dict and getattr(field, "fields", None):
+        struct_fields = arrow_fields(field)
+        if struct_fields is None:
+            return None
+        return pa.struct(struct_fields)
+    if output_type is datetime.datetime:
+        return pa.timestamp("us")
+    return arrow_scalar_type(output_type)
+
+
+def arrow_fields(schema) -> "List[pyarrow.Field]":
+    """Arrow fields for each output of a schema, with flattened fields merged in.
+    Returns None if any field's type can't be determined"""
+    import pyarrow as pa
+
+    result = list()
+    for field in schema.fields.values():
+        if getattr(field, "flatten", False) and getattr(field, "fields", None):
+            sub_fields = arrow_fields(field)
+            if sub_fields is None:
+                return None
+            result += sub_fields
+            continue
+        field_type = arrow_type(field)
+        if field_type is None:
+            return None
+        result.append(pa.field(field.output_name, field_type))
+    return result
+
+
+def arrow_schema(schema) -> "pyarrow.Schema":
+    """
+    Arrow schema for records loaded by a yankee Schema. Fields whose type
+    can't be determined from the schema are left out, and are inferred from
+    the data when building tables.
+    """
+    import pyarrow as pa
+
+    result = list()
+    for field in schema.fields.values():
+        if getattr(field, "flatten", False) and getattr(field, "fields", None):
+            sub_fields = arrow_fields(field)
+            if sub_fields is not None:
+                result += sub_fields
+            continue
+        field_type = arrow_type(field)
+        if field_type is not None:
+            result.append(pa.field(field.output_name, field_type))
+    return pa.schema(result)
+
+
+class TableWriter(object):
+    """
+    Writes records to an Arrow-based file format in batches of `batch_size`,
+    so only one batch is held in memory at a time. Each batch becomes a
+    row group (Parquet) or record batch (IPC).
+
+    Every batch is written with the same file schema. Columns of `schema`, if
+    given, have the types from `arrow_schema(schema)`. Other columns are inferred
+    from the data. So that a column that is all null, or missing, in the first
+    batch still gets its real type, up to `infer_batches` batches are held back
+    until every column has a type. Columns that are still all null then are
+    written as strings (as are empty lists' items). Each batch is cast to the file schema, and columns a batch
+    lacks are filled with nulls. `open_writer` is called with the file schema to
+    create the underlying writer.
+    """
+
+    def __init__(self, open_writer, batch_size=10000, schema=None, annotate=(), infer_batches=10):
+        self.open_writer = open_writer
+        self.batch_size = batch_size
+        self.annotate = annotate
+        self.infer_batches = infer_batches
+        self.types = schema.column_types() if schema is not None else dict()
+        self.arrow_schema = arrow_schema(schema) if schema is not None else None
+        self.declared = set(self.arrow_schema.names) if self.arrow_schema is not None else set()
+        # Types of columns that aren't in the schema, as inferred so far
+        self.inferred = dict()
+        self.pending = list()
+        self.writer = None
+        self.builder = self.new_builder()
+
+    def new_builder(self):
+        columns = self.arrow_schema.names if self.arrow_schema is not None else ()
+        return ColumnBuilder(columns, self.types, self.annotate)
+
+    def append(self, item):
+        self.builder.append(item)
+        if self.builder.length >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.builder.length:
+            return
+        table = self.builder.to_arrow(self.arrow_schema)
+        self.builder = self.new_builder()
+        if self.writer is not None:
+            self.writer.write_table(self.conform(table))
+            return
+        self.infer(table)
+        self.pending.append(table)
+        untyped = any(contains_null(t) for t in self.inferred.values())
+        if not untyped or len(self.pending) >= self.infer_batches:
+            self.open()
+
+    def infer(self, table):
+        for field in table.schema:
+            if field.name in self.declared:
+                continue
+            known = self.inferred.get(field.name)
+            if known is None or (contains_null(known) and not contains_null(field.type)):
+                self.inferred[field.name] = field.type
+
+    def open(self):
+        import pyarrow as pa
+
+        fields = list(self.arrow_schema) if self.arrow_schema is not None else list()
+        for name, field_type in self.inferred.items():
+            fields.append(pa.field(name, promote_nulls(field_type)))
+        self.arrow_schema = pa.schema(fields)
+        self.declared = set(self.arrow_schema.names)
+        self.writer = self.open_writer(self.arrow_schema)
+        for table in self.pending:
+            self.writer.write_table(self.conform(table))
+        self.pending = list()
+
+    def conform(self, table):
+        """Cast `table` to the file schema, adding missing columns as nulls"""
+        import pyarrow as pa
+
+        extra = [name for name in table.column_names if name not in self.declared]
+        if extra:
+            raise ValueError(
+                f"Columns {extra} first appeared after the file schema was fixed. "
+                "Pass a schema that declares them, or raise infer_batches"
+            )
+        arrays = list()
+        for field in self.arrow_schema:
+            if field.name not in table.column_names:
+                arrays.append(pa.nulls(table.num_rows, field.type))
+                continue
+            column = table.column(field.name)
+            if column.type != field.type:
+                try:
+                    column = column.cast(field.type)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+                    raise ValueError(f"Column {field.name!r} can't be written as {field.type}: {e}") from e
+            arrays.append(column)
+        return pa.Table.from_arrays(arrays, schema=self.arrow_schema)
+
+    def close(self):
+        self.flush()
+        if self.writer is None:
+            self.open()
+        self.writer.close()
+
+    def write(self, items):
+        for item in items:
+            self.append(item)
+        self.close()
+
+    async def awrite(self, items):
+        async for item in items:
+            self.append(item)
+        self.close()
+
+
+def contains_null(arrow_type) -> bool:
+    """Whether an inferred Arrow type is, or contains, the null type, e.g. list<null>
+    for a column of empty lists, so its real type isn't known yet"""
+    import pyarrow as pa
+
+    if pa.types.is_null(arrow_type):
+        return True
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        return contains_null(arrow_type.value_type)
+    if pa.types.is_struct(arrow_type):
+        return any(contains_null(arrow_type.field(i).type) for i in range(arrow_type.num_fields))
+    return False
+
+
+def promote_nulls(arrow_type) -> "pyarrow.DataType":
+    """Replace the null type, wherever it occurs in `arrow_type`, with string"""
+    import pyarrow as pa
+
+    if pa.types.is_null(arrow_type):
+        return pa.string()
+    if pa.types.is_list(arrow_type):
+        return pa.list_(promote_nulls(arrow_type.value_type))
+    if pa.types.is_large_list(arrow_type):
+        return pa.large_list(promote_nulls(arrow_type.value_type))
+    if pa.types.is_struct(arrow_type):
+        fields = [arrow_type.field(i) for i in range(arrow_type.num_fields)]
+        return pa.struct([f.with_type(promote_nulls(f.type)) for f in fields])
+    return arrow_type
+
+
+def parquet_writer(path, **kwargs):
+    import pyarrow.parquet as pq
+
+    return lambda schema: pq.ParquetWriter(path, schema, **kwargs)
+
+
+def ipc_writer(path, stream=False, **kwargs):
+    import pyarrow as pa
+
+    if stream:
+        return lambda schema: pa.ipc.new_stream(path, schema, **kwargs)
+    return lambda schema: pa.ipc.new_file(path, schema, **kwargs)
@@ -0,0 +1,192 @@
+import datetime
+
+import pytest
+
+from yankee.data import Collection
+from yankee.json.schema import Schema, ZipSchema, fields as f
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+class PartSchema(Schema):
+    name = f.Str()
+    count = f.Int()
+
+
+class RecordSchema(Schema):
+    id = f.Int()
+    title = f.Str()
+    date = f.Date()
+    main_part = f.Nested(PartSchema())
+    parts = f.List(PartSchema())
+    tags = f.List(f.Str)
+
+
+def make_records(n):
+    return [
+        {
+            "id": i,
+            "title": f"Record {i}",
+            "date": "2021-05-04",
+            "mainPart": {"name": "main", "count": i},
+            "parts": [{"name": f"part {j}", "count": j} for j in range(i % 3)],
+            "tags": ["a", "b"][: i % 3],
+        }
+        for i in range(n)
+    ]
+
+
+def test_arrow_schema():
+    from .arrow import arrow_schema
+
+    result = arrow_schema(RecordSchema())
+    part = pa.struct([("name", pa.string()), ("count", pa.int64())])
+    assert result.field("id").type == pa.int64()
+    assert result.field("date").type == pa.date32()
+    assert result.field("main_part").type == part
+    assert result.field("parts").type == pa.list_(part)
+    assert result.field("tags").type == pa.list_(pa.string())
+
+
+def test_to_parquet(tmp_path):
+    schema = RecordSchema()
+    records = Collection(schema.load(r) for r in make_records(25))
+    path = tmp_path / "records.parquet"
+    records.to_parquet(path, batch_size=10, schema=schema)
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.num_rows == 25
+    row = table.slice(2, 1).to_pylist()[0]
+    assert row["date"] == datetime.date(2021, 5, 4)
+    assert row["main_part"] == {"name": "main", "count": 2}
+    assert row["parts"] == [{"name": "part 0", "count": 0}, {"name": "part 1", "count": 1}]
+    assert row["tags"] == ["a", "b"]
+
+
+def test_to_arrow_ipc(tmp_path):
+    schema = RecordSchema()
+    path = tmp_path / "records.arrow"
+    Collection(schema.load(r) for r in make_records(5)).to_arrow_ipc(path, batch_size=2, schema=schema)
+    with pa.ipc.open_file(path) as reader:
+        assert reader.num_record_batches == 3
+        assert reader.read_all().column("id").to_pylist() == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_ato_parquet(tmp_path):
+    schema = RecordSchema()
+
+    async def gen():
+        for r in make_records(5):
+            yield schema.load(r)
+
+    path = tmp_path / "records.parquet"
+    await Collection(gen(), schema=schema).ato_parquet(path, batch_size=2)
+    assert pq.read_table(path).column("title").to_pylist() == [f"Record {i}" for i in range(5)]
+
+
+def sparse_records():
+    # "note" and "tags" are null or empty in the first batch, and "extra" only appears in the second
+    records = [{"id": i, "note": None, "tags": []} for i in range(4)]
+    records += [{"id": i, "note": f"note {i}", "tags": ["a"], "extra": i * 1.5} for i in range(4, 6)]
+    records += [{"id": i, "note": None, "tags": []} for i in range(6, 8)]
+    records += [{"id": i, "note": f"note {i}", "tags": [], "extra": None} for i in range(8, 10)]
+    return records
+
+
+def test_to_parquet_sparse_columns(tmp_path):
+    path = tmp_path / "sparse.parquet"
+    Collection(sparse_records()).to_parquet(path, batch_size=2)
+    table = pq.read_table(path)
+    assert table.schema.field("note").type == pa.string()
+    assert table.schema.field("tags").type == pa.list_(pa.string())
+    assert table.column("note").to_pylist() == [None] * 4 + ["note 4", "note 5", None, None, "note 8", "note 9"]
+    assert table.column("tags").to_pylist() == [[]] * 4 + [["a"], ["a"]] + [[]] * 4
+    assert table.column("extra").to_pylist() == [None] * 4 + [6.0, 7.5] + [None] * 4
+
+
+def test_to_arrow_ipc_sparse_columns(tmp_path):
+    path = tmp_path / "sparse.arrow"
+    Collection(sparse_records()).to_arrow_ipc(path, batch_size=2)
+    with pa.ipc.open_file(path) as reader:
+        table = reader.read_all()
+    assert table.column("id").to_pylist() == list(range(10))
+    assert table.column("note").to_pylist()[4] == "note 4"
+
+
+def test_to_parquet_sparse_schema_columns(tmp_path):
+    schema = RecordSchema()
+    records = make_records(6)
+    for record in records[:3]:
+        del record["title"]
+    path = tmp_path / "records.parquet"
+    Collection(schema.load(r) for r in records).to_parquet(path, batch_size=3, schema=schema, infer_batches=1)
+    table = pq.read_table(path)
+    assert table.schema.field("title").type == pa.string()
+    assert table.column("title").to_pylist() == [None] * 3 + [f"Record {i}" for i in range(3, 6)]
+
+
+def test_to_parquet_late_column_after_schema_fixed(tmp_path):
+    path = tmp_path / "late.parquet"
+    records = [{"id": i} for i in range(4)] + [{"id": 4, "late": "x"}]
+    with pytest.raises(ValueError, match="late"):
+        Collection(records).to_parquet(path, batch_size=2, infer_batches=1)
+
+
+class PairSchema(ZipSchema):
+    key = f.Str("key")
+    value = f.Int("value")
+
+
+class CodeSchema(f.Alt):
+    code = f.Str("code")
+    legacy_code = f.Str("legacyCode")
+
+
+class MixedSchema(Schema):
+    id = f.Int()
+    pairs = PairSchema("pairs")
+    code = CodeSchema("code")
+
+
+def mixed_records(n):
+    return [
+        {
+            "id": i,
+            "pairs": {"key": [f"k{j}" for j in range(i % 3)], "value": list(range(i % 3))},
+            "code": {"code": f"c{i}"} if i % 2 else {"legacyCode": f"l{i}"},
+        }
+        for i in range(n)
+    ]
+
+
+def test_arrow_schema_zip_and_alternative():
+    from .arrow import arrow_schema
+
+    result = arrow_schema(MixedSchema())
+    assert result.field("pairs").type == pa.list_(pa.struct([("key", pa.string()), ("value", pa.int64())]))
+    # Alternative fields output one of several types, so they're inferred from the data
+    assert "code" not in result.names
+
+
+def test_to_parquet_zip_and_alternative(tmp_path):
+    schema = MixedSchema()
+    records = [schema.load(r) for r in mixed_records(6)]
+    path = tmp_path / "mixed.parquet"
+    Collection(records).to_parquet(path, batch_size=2, schema=schema)
+    table = pq.read_table(path)
+    assert table.column("pairs").to_pylist()[2] == [{"key": "k0", "value": 0}, {"key": "k1", "value": 1}]
+    assert table.column("code").to_pylist() == ["l0", "c1", "l2", "c3", "l4", "c5"]
+
+
+def test_to_arrow_ipc_zip_and_alternative(tmp_path):
+    schema = MixedSchema()
+    records = [schema.load(r) for r in mixed_records(6)]
+    path = tmp_path / "mixed.arrow"
+    Collection(records).to_arrow_ipc(path, batch_size=2, schema=schema)
+    with pa.ipc.open_file(path) as reader:
+        table = reader.read_all()
+    assert table.column("pairs").to_pylist()[1] == [{"key": "k0", "value": 0}]
+    assert table.column("code").to_pylist()[:2] == ["l0", "c1"]
@@ -1,4 +1,3 @@
-import ujson as json
 from .util import DataConversion
 
 class AttrDict(dict, DataConversion):    
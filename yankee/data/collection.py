@@ -1,5 +1,4 @@
 import json
-import asyncio
 from typing import TypeVar, Generic, AsyncIterator, Iterator, List, Union
 from copy import deepcopy
 from itertools import chain
@@ -13,10 +12,14 @@ from .attrdict import AttrDict
 T = TypeVar("T")
 
 class Collection(Generic[T]):
-    def __init__(self, iterable):
+    schema = None
+
+    def __init__(self, iterable, schema=None):
         self.iterable = iterable
+        self.schema = schema
 
     def _sync_iterator(self) -> Iterator[T]:
+        import asyncio
         loop = asyncio.get_event_loop()
         agen = self.iterable.__aiter__()
         try:
@@ -67,7 +70,7 @@ class Collection(Generic[T]):
     def to_mongo(self) -> List[dict]:
         """Return a list of dictionaries containing MongoDB compatible datatypes
         """
-        return to_dict(self, dict, list, convert_dates=True)
+        return to_dict(self, dict, list, date_style="mongo")
 
     def to_json(self, *args, **kwargs) -> str:
         """Convert objects to JSON format"""
@@ -77,35 +80,89 @@ class Collection(Generic[T]):
         """Convert objects to JSON format"""
         return json.dumps(await self.ato_records(), *args, cls=JsonEncoder, **kwargs)
 
-    def to_pandas(self, annotate=list()) -> "pandas.DataFrame":
-        """Convert Collection into a Pandas DataFrame"""
-        import pandas as pd
-
-        list_of_series = list()
-        for i in iter(self):
-            try:
-                series = i.to_pandas()
-            except AttributeError:
-                series = pd.Series(i)
-            for a in annotate:
-                series[a] = resolve(i, a)
-            list_of_series.append(series)
-        return pd.DataFrame(list_of_series)
-    
-    async def ato_pandas(self, annotate=list()) -> "pandas.DataFrame":
-        """Convert Collection into a Pandas DataFrame"""
-        import pandas as pd
-
-        list_of_series = list()
+    def column_builder(self, annotate=list(), schema=None) -> "ColumnBuilder":
+        from .columnar import ColumnBuilder
+        schema = schema or self.schema
+        if schema is not None:
+            return ColumnBuilder.from_schema(schema, annotate)
+        return ColumnBuilder(annotate=annotate)
+
+    def iter_json_bytes(self) -> Iterator[bytes]:
+        """Yield each item encoded as JSON bytes, using orjson if it is installed"""
+        from .encode import iter_json_bytes
+        return iter_json_bytes(self)
+
+    def aiter_json_bytes(self) -> AsyncIterator[bytes]:
+        """Yield each item encoded as JSON bytes, using orjson if it is installed"""
+        from .encode import aiter_json_bytes
+        return aiter_json_bytes(self)
+
+    def write_ndjson(self, fp) -> int:
+        """Write items as newline-delimited JSON to a path or file object, one item
+        at a time, and return the number of items written"""
+        from .encode import write_ndjson
+        return write_ndjson(self, fp)
+
+    async def awrite_ndjson(self, fp) -> int:
+        """Write items as newline-delimited JSON to a path or file object, one item
+        at a time, and return the number of items written"""
+        from .encode import awrite_ndjson
+        return await awrite_ndjson(self, fp)
+
+    def to_pandas(self, annotate=list(), schema=None) -> "pandas.DataFrame":
+        """Convert Collection into a Pandas DataFrame, built column-wise.
+        If a schema is passed (or the Collection came from one), columns are typed
+        from each field's output_type"""
+        return self.column_builder(annotate, schema).extend(self).to_pandas()
+
+    async def ato_pandas(self, annotate=list(), schema=None) -> "pandas.DataFrame":
+        """Convert Collection into a Pandas DataFrame, built column-wise"""
+        builder = self.column_builder(annotate, schema)
+        async for i in self:
+            builder.append(i)
+        return builder.to_pandas()
+
+    def _arrow_schema(self, schema=None):
+        from .arrow import arrow_schema
+        schema = schema or self.schema
+        return arrow_schema(schema) if schema is not None else None
+
+    def to_arrow(self, annotate=list(), schema=None) -> "pyarrow.Table":
+        """Convert Collection into a PyArrow Table, built column-wise.
+        If a schema is passed (or the Collection came from one), nested Lists
+        and schemas are typed as Arrow lists and structs"""
+        builder = self.column_builder(annotate, schema).extend(self)
+        return builder.to_arrow(self._arrow_schema(schema))
+
+    async def ato_arrow(self, annotate=list(), schema=None) -> "pyarrow.Table":
+        """Convert Collection into a PyArrow Table, built column-wise"""
+        builder = self.column_builder(annotate, schema)
         async for i in self:
-            try:
-                series = i.to_pandas()
-            except AttributeError:
-                series = pd.Series(i)
-            for a in annotate:
-                series[a] = resolve(i, a)
-            list_of_series.append(series)
-        return pd.DataFrame(list_of_series)
+            builder.append(i)
+        return builder.to_arrow(self._arrow_schema(schema))
+
+    def to_parquet(self, path, batch_size=10000, annotate=list(), schema=None, infer_batches=10, **kwargs):
+        """Write the Collection to a Parquet file, one row group per `batch_size`
+        records, without holding the whole Collection in memory. See `yankee.data.arrow.TableWriter`
+        for how column types are chosen. Extra keyword arguments are passed to pyarrow.parquet.ParquetWriter"""
+        from .arrow import TableWriter, parquet_writer
+        TableWriter(parquet_writer(path, **kwargs), batch_size, schema or self.schema, annotate, infer_batches).write(self)
+
+    async def ato_parquet(self, path, batch_size=10000, annotate=list(), schema=None, infer_batches=10, **kwargs):
+        """Write the Collection to a Parquet file, one row group per `batch_size` records"""
+        from .arrow import TableWriter, parquet_writer
+        await TableWriter(parquet_writer(path, **kwargs), batch_size, schema or self.schema, annotate, infer_batches).awrite(self)
+
+    def to_arrow_ipc(self, path, batch_size=10000, annotate=list(), schema=None, stream=False, infer_batches=10, **kwargs):
+        """Write the Collection to an Arrow IPC file (or stream, if `stream` is True),
+        one record batch per `batch_size` records"""
+        from .arrow import TableWriter, ipc_writer
+        TableWriter(ipc_writer(path, stream, **kwargs), batch_size, schema or self.schema, annotate, infer_batches).write(self)
+
+    async def ato_arrow_ipc(self, path, batch_size=10000, annotate=list(), schema=None, stream=False, infer_batches=10, **kwargs):
+        """Write the Collection to an Arrow IPC file (or stream), one record batch per `batch_size` records"""
+        from .arrow import TableWriter, ipc_writer
+        await TableWriter(ipc_writer(path, stream, **kwargs), batch_size, schema or self.schema, annotate, infer_batches).awrite(self)
 
     def explode(self, attribute, unpack=False, connector=".", prefix=True) -> Union["UnpackedCollection", "ExplodedCollection"]:
         """Implement an "explode" function for nested listed objects."""
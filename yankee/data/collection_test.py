@@ -36,8 +36,39 @@ class TestCollection():
         iterable = [{"a": 1}, {"a": 2}]
         collection = Collection(iterable)
         assert collection.to_pandas().a.tolist() == [1, 2]
-        
-    
+
+    def test_pandas_sparse_columns(self):
+        collection = Collection([{"a": 1}, {"b": "x"}, {"a": 3, "b": "y"}])
+        df = collection.to_pandas()
+        assert list(df.columns) == ["a", "b"]
+        assert df.b.tolist()[1:] == ["x", "y"]
+        assert df.a.isna().tolist() == [False, True, False]
+
+    def test_pandas_typed_columns(self):
+        from yankee.json.schema import Schema, fields as f
+
+        class TypedSchema(Schema):
+            count = f.Int()
+            flag = f.Bool()
+            when = f.Date()
+
+        schema = TypedSchema()
+        records = [schema.load({"count": "1", "flag": "true", "when": "2021-05-04"}), schema.load({"flag": "false"})]
+        df = Collection(records).to_pandas(schema=schema)
+        assert str(df["count"].dtype) == "Int64"
+        assert str(df["flag"].dtype) == "boolean"
+        assert str(df["when"].dtype).startswith("datetime64")
+        assert df["count"].tolist()[0] == 1
+
+    def test_arrow_conversion(self):
+        pa = pytest.importorskip("pyarrow")
+        import datetime
+
+        collection = Collection([{"a": 1, "d": datetime.date(2021, 5, 4)}, {"a": None, "d": None}])
+        table = collection.to_arrow(schema=None)
+        assert table.column("a").to_pylist() == [1, None]
+        assert table.schema.field("d").type == pa.date32()
+
 
 class TestCollectionAsync():
     @pytest.mark.asyncio
@@ -195,4 +226,57 @@ class TestValuesListAsync():
         assert values == [
             (1, 3),
             (2, 5),
-        ]
\ No newline at end of file
+        ]
+
+class TestNdjson():
+    def rows(self):
+        import datetime
+        from .row_test import make_record
+
+        return [make_record(), {"when": datetime.datetime(2021, 5, 4, 12, 5), "n": 2}]
+
+    def expected(self):
+        return [
+            {
+                "id": 1,
+                "date": "2021-05-04",
+                "part": {"name": "a"},
+                "parts": [{"name": "b"}, {"name": None}],
+                "extra": {"nested": [{"name": "c"}]},
+            },
+            {"when": "2021-05-04T12:05:00", "n": 2},
+        ]
+
+    def test_iter_json_bytes(self):
+        lines = list(Collection(self.rows()).iter_json_bytes())
+        assert all(isinstance(l, bytes) for l in lines)
+        assert [json.loads(l) for l in lines] == self.expected()
+
+    def test_ujson_fallback(self, monkeypatch):
+        from . import encode
+
+        monkeypatch.setattr(encode, "orjson", None)
+        lines = list(Collection(self.rows()).iter_json_bytes())
+        assert [json.loads(l) for l in lines] == self.expected()
+
+    def test_write_ndjson(self, tmp_path):
+        import io
+
+        path = tmp_path / "out.ndjson"
+        assert Collection(self.rows()).write_ndjson(path) == 2
+        assert [json.loads(l) for l in path.read_text().splitlines()] == self.expected()
+        buffer = io.StringIO()
+        Collection(self.rows()).write_ndjson(buffer)
+        assert [json.loads(l) for l in buffer.getvalue().splitlines()] == self.expected()
+
+    @pytest.mark.asyncio
+    async def test_awrite_ndjson(self):
+        import io
+
+        async def gen():
+            for row in self.rows():
+                yield row
+
+        buffer = io.BytesIO()
+        assert await Collection(gen()).awrite_ndjson(buffer) == 2
+        assert [json.loads(l) for l in buffer.getvalue().splitlines()] == self.expected()
@@ -0,0 +1,113 @@
+import datetime
+from collections import abc
+
+from .util import resolve
+
+
+class ColumnBuilder(object):
+    """
+    Accumulates records into one list per column as they stream in, so a
+    DataFrame or Arrow Table can be built in one shot at the end rather than
+    from a list of per-row Series.
+
+    Columns may be declared up front, with types (e.g. from `Schema.column_types()`);
+    any other keys are added as they are first seen, backfilled with None.
+    """
+
+    def __init__(self, columns=(), types=None, annotate=()):
+        self.types = dict(types or {})
+        self.columns = {name: list() for name in (*columns, *self.types)}
+        self.annotate = tuple(annotate)
+        self.length = 0
+
+    @classmethod
+    def from_schema(cls, schema, annotate=()):
+        return cls(types=schema.column_types(), annotate=annotate)
+
+    def append(self, item):
+        if isinstance(item, abc.Mapping):
+            row = item
+        elif hasattr(item, "to_dict"):
+            row = item.to_dict()
+        else:
+            row = dict(item)
+        if self.annotate:
+            row = {**row, **{a: resolve(item, a) for a in self.annotate}}
+        columns = self.columns
+        for key in row:
+            if key not in columns:
+                columns[key] = [None] * self.length
+        for key, values in columns.items():
+            values.append(row.get(key))
+        self.length += 1
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+        return self
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        import pandas as pd
+
+        data = dict()
+        for name, values in self.columns.items():
+            dtype = pandas_dtype(self.types.get(name))
+            if dtype is None:
+                data[name] = values
+                continue
+            try:
+                if dtype == "datetime64[ns]":
+                    data[name] = pd.to_datetime(pd.Series(values, dtype=object))
+                else:
+                    data[name] = pd.Series(values, dtype=dtype)
+            except (TypeError, ValueError, OverflowError):
+                data[name] = values
+        return pd.DataFrame(data, index=pd.RangeIndex(self.length))
+
+    def to_arrow(self, arrow_schema=None) -> "pyarrow.Table":
+        """Build a Table, with column types taken from `arrow_schema` where given"""
+        import pyarrow as pa
+
+        known = set(arrow_schema.names) if arrow_schema is not None else ()
+        arrays, names = list(), list()
+        for name, values in self.columns.items():
+            if name in known:
+                arrow_type = arrow_schema.field(name).type
+            else:
+                arrow_type = arrow_scalar_type(self.types.get(name))
+            try:
+                arrays.append(pa.array(values, type=arrow_type))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError):
+                arrays.append(pa.array(values))
+            names.append(name)
+        return pa.Table.from_arrays(arrays, names=names)
+
+
+def pandas_dtype(output_type):
+    """Nullable pandas dtype for a field's output_type, or None to let pandas infer"""
+    if output_type is bool:
+        return "boolean"
+    if output_type is int:
+        return "Int64"
+    if output_type is float:
+        return "float64"
+    if output_type in (datetime.date, datetime.datetime):
+        return "datetime64[ns]"
+    return None
+
+
+def arrow_scalar_type(output_type):
+    """Arrow type for a scalar output_type, or None to let pyarrow infer"""
+    import pyarrow as pa
+
+    if output_type is bool:
+        return pa.bool_()
+    if output_type is int:
+        return pa.int64()
+    if output_type is float:
+        return pa.float64()
+    if output_type is str:
+        return pa.string()
+    if output_type is datetime.date:
+        return pa.date32()
+    return None
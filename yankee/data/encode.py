@@ -0,0 +1,88 @@
+import io
+import os
+
+import ujson
+
+from .util import to_dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def orjson_default(obj):
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "__iter__") and not isinstance(obj, (str, bytes)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj) -> bytes:
+    """
+    Encode a loaded record as JSON bytes. With orjson installed, Rows, dates and
+    nested collections are encoded natively without an intermediate dict;
+    otherwise the record is converted with to_dict and encoded with ujson
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=orjson_default)
+        except orjson.JSONEncodeError:
+            pass
+    return ujson.dumps(to_dict(obj, date_style="json"), ensure_ascii=False).encode()
+
+
+def iter_json_bytes(items) -> "Iterator[bytes]":
+    for item in items:
+        yield dumps_bytes(item)
+
+
+async def aiter_json_bytes(items) -> "AsyncIterator[bytes]":
+    async for item in items:
+        yield dumps_bytes(item)
+
+
+class LineWriter(object):
+    """Writes newline-delimited JSON to a path or a binary or text file object"""
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.owned = isinstance(fp, (str, os.PathLike))
+        if self.owned:
+            self.fp = open(fp, "wb")
+        self.text = isinstance(self.fp, io.TextIOBase)
+        self.count = 0
+
+    def write(self, line):
+        if self.text:
+            self.fp.write(line.decode())
+            self.fp.write("\n")
+        else:
+            self.fp.write(line + b"\n")
+        self.count += 1
+
+    def close(self):
+        if self.owned:
+            self.fp.close()
+        return self.count
+
+
+def write_ndjson(items, fp) -> int:
+    writer = LineWriter(fp)
+    try:
+        for line in iter_json_bytes(items):
+            writer.write(line)
+    finally:
+        count = writer.close()
+    return count
+
+
+async def awrite_ndjson(items, fp) -> int:
+    writer = LineWriter(fp)
+    try:
+        async for line in aiter_json_bytes(items):
+            writer.write(line)
+    finally:
+        count = writer.close()
+    return count
@@ -0,0 +1,97 @@
+from yankee.util import is_valid
+
+from .attrdict import AttrDict
+
+
+class LazyRow(object):
+    """
+    A record whose fields are loaded on first access. Holds a reference to the
+    source object, and runs each field's accessor and converters only when that
+    field is read, caching the result. Fields with no value read as None.
+
+    Call `materialize()` to load every field and get the same result as
+    `Schema.load`. Create with `Schema.load_lazy`.
+    """
+
+    __slots__ = ("_schema", "_obj", "_raw", "_values", "_flattened")
+
+    def __init__(self, schema, obj, raw=None):
+        self._schema = schema
+        self._obj = obj
+        self._raw = raw
+        self._values = dict()
+        self._flattened = None
+
+    def _load(self, i):
+        values = self._values
+        if i not in values:
+            output_name, loader, flatten = self._schema._plan[i]
+            value = loader(self._obj)
+            values[i] = value if is_valid(value) else None
+        return values[i]
+
+    def _load_flattened(self):
+        if self._flattened is None:
+            flattened = dict()
+            for i, (output_name, loader, flatten) in enumerate(self._schema._plan):
+                if not flatten:
+                    continue
+                value = self._load(i)
+                if isinstance(value, dict):
+                    flattened.update(value)
+                elif value is not None:
+                    flattened[output_name] = value
+            self._flattened = flattened
+        return self._flattened
+
+    def __getitem__(self, name):
+        i = self._schema._plan_index.get(name)
+        if i is not None:
+            return self._load(i)
+        flattened = self._load_flattened()
+        if name in flattened:
+            return flattened[name]
+        raise KeyError(name)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __contains__(self, name):
+        try:
+            return self[name] is not None
+        except KeyError:
+            return False
+
+    def get(self, name, default=None):
+        try:
+            value = self[name]
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def materialize(self):
+        """Load all remaining fields, and return the record as `Schema.load` would"""
+        output = AttrDict()
+        for i, (output_name, loader, flatten) in enumerate(self._schema._plan):
+            value = self._load(i)
+            if value is None:
+                continue
+            if flatten and isinstance(value, dict):
+                output.update(value)
+            else:
+                output[output_name] = value
+        return self._schema.finish_load(output, self._raw)
+
+    def to_dict(self, *args, **kwargs):
+        return self.materialize().to_dict(*args, **kwargs)
+
+    def __repr__(self):
+        loaded = ", ".join(
+            f"{self._schema._plan[i][0]}={v!r}" for i, v in self._values.items()
+        )
+        return f"LazyRow({self._schema.__class__.__name__}, loaded=[{loaded}])"
@@ -1,29 +1,11 @@
-import ujson as json
-import datetime
-from dataclasses import dataclass, is_dataclass, fields
-from collections import abc
+from dataclasses import dataclass, fields
 
-from .util import to_dict, DataConversion
+from .util import row_fields, DataConversion
 from yankee.util import is_valid
 
-def to_dict(obj, item_class=dict, collection_class=list, date_style="python"):
-    if isinstance(obj, abc.Mapping):
-        return item_class((k, to_dict(v, item_class, collection_class, date_style)) for k, v in obj.items())
-    elif is_dataclass(obj):
-        return to_dict(item_class(obj), item_class, collection_class, date_style)
-    elif isinstance(obj, abc.Iterable) and not isinstance(obj, (str, bytes)):
-        return collection_class(to_dict(i, item_class, collection_class, date_style) for i in obj)
-    elif date_style == "mongo" and isinstance(obj, datetime.date):
-        return datetime.datetime.combine(obj, datetime.datetime.min.time())
-    elif date_style == "json" and isinstance(obj, (datetime.date, datetime.datetime)):
-        return obj.isoformat()
-    else:
-        return obj
-
 @dataclass
 class Row(DataConversion):
-    def to_dict(self):
-        return to_dict(self)
+    __slots__ = ()
 
     def fields(self):
         return fields(self)
@@ -47,16 +29,14 @@ class Row(DataConversion):
             return default
 
     def items(self):
-        for f in fields(self):
-            yield (f.name, getattr(self, f.name))
+        names, getter = row_fields(self.__class__)
+        return zip(names, getter(self))
 
     def values(self):
-        for f in fields(self):
-            yield getattr(self, f.name)
+        return iter(row_fields(self.__class__)[1](self))
     
     def keys(self):
-        for f in fields(self):
-            yield f.name
+        return iter(row_fields(self.__class__)[0])
 
     def __bool__(self):
-        return not all(v is None for v in self.__dict__.values())
+        return any(v is not None for v in row_fields(self.__class__)[1](self))
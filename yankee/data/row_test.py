@@ -0,0 +1,55 @@
+import datetime
+import dataclasses as dc
+
+from .row import Row
+from .util import to_dict
+from .collection import ListCollection
+from .attrdict import AttrDict
+
+
+@dc.dataclass
+class Part(Row):
+    name: str = None
+
+
+@dc.dataclass
+class Record(Row):
+    id: int = None
+    date: datetime.date = None
+    part: Part = None
+    parts: list = dc.field(default_factory=ListCollection)
+    extra: dict = None
+
+
+def make_record():
+    return Record(
+        id=1,
+        date=datetime.date(2021, 5, 4),
+        part=Part("a"),
+        parts=ListCollection([Part("b"), Part(None)]),
+        extra=AttrDict(nested=[Part("c")]),
+    )
+
+
+def test_row_access():
+    record = make_record()
+    assert list(record.keys()) == ["id", "date", "part", "parts", "extra"]
+    assert dict(record.items())["id"] == 1
+    assert list(record.values())[0] == 1
+    assert Record.__dict__["_row_fields"][0] == ("id", "date", "part", "parts", "extra")
+    assert bool(record) and not bool(Part())
+
+
+def test_fast_to_dict_matches_generic():
+    record = make_record()
+    expected = {
+        "id": 1,
+        "date": datetime.date(2021, 5, 4),
+        "part": {"name": "a"},
+        "parts": [{"name": "b"}, {"name": None}],
+        "extra": {"nested": [{"name": "c"}]},
+    }
+    assert record.to_dict() == expected
+    assert to_dict(record) == expected
+    assert type(record.to_dict()["extra"]) is dict
+    assert record.to_dict(date_style="json")["date"] == "2021-05-04"
@@ -0,0 +1,153 @@
+import datetime
+import dataclasses
+from collections import abc
+from functools import lru_cache
+from operator import attrgetter
+
+# Kinds of value, as classified by type
+LEAF, DATE, MAPPING, DATACLASS, SEQUENCE = range(1, 6)
+
+_kinds = {
+    str: LEAF,
+    bytes: LEAF,
+    int: LEAF,
+    float: LEAF,
+    bool: LEAF,
+    type(None): LEAF,
+    datetime.date: DATE,
+    datetime.datetime: DATE,
+    dict: MAPPING,
+    list: SEQUENCE,
+    tuple: SEQUENCE,
+}
+
+
+def kind_of(t):
+    """Classify a type for serialization. Results are cached per type, so the
+    abstract base class checks only happen the first time a type is seen"""
+    kind = _kinds.get(t)
+    if kind is not None:
+        return kind
+    if issubclass(t, (str, bytes)):
+        kind = LEAF
+    elif issubclass(t, datetime.date):
+        kind = DATE
+    elif issubclass(t, abc.Mapping):
+        kind = MAPPING
+    elif dataclasses.is_dataclass(t):
+        kind = DATACLASS
+    elif issubclass(t, abc.Iterable):
+        kind = SEQUENCE
+    else:
+        kind = LEAF
+    _kinds[t] = kind
+    return kind
+
+
+def row_fields(cls):
+    """Return the field names of a dataclass, and a getter that returns a tuple of
+    their values from an instance. Computed once per class and cached on it"""
+    cached = cls.__dict__.get("_row_fields")
+    if cached is None:
+        names = tuple(f.name for f in dataclasses.fields(cls))
+        if len(names) > 1:
+            getter = attrgetter(*names)
+        elif names:
+            single = attrgetter(names[0])
+            getter = lambda obj: (single(obj),)
+        else:
+            getter = lambda obj: ()
+        cached = (names, getter)
+        cls._row_fields = cached
+    return cached
+
+
+def mongo_date(obj):
+    if isinstance(obj, datetime.datetime):
+        return obj
+    return datetime.datetime.combine(obj, datetime.datetime.min.time())
+
+
+def json_date(obj):
+    return obj.isoformat()
+
+
+date_styles = {
+    "python": None,
+    "json": json_date,
+    "mongo": mongo_date,
+}
+
+
+class Serializer(object):
+    """
+    Converts nested Mappings, dataclasses (e.g. Rows) and iterables into plain
+    `item_class` / `collection_class` objects.
+
+    Dates are converted according to `date_style`, which is one of "python"
+    (left as is), "json" (isoformat strings), "mongo" (dates become datetimes),
+    or a callable. If `key` is given, it is applied to every mapping key.
+
+    Nested values are walked with an explicit stack rather than recursion, so
+    arbitrarily deep data doesn't hit the recursion limit.
+    """
+
+    def __init__(self, item_class=dict, collection_class=list, date_style="python", key=None):
+        self.item_class = item_class
+        self.collection_class = collection_class
+        self.date = date_styles[date_style] if isinstance(date_style, str) else date_style
+        self.key = key
+
+    def children(self, kind, obj):
+        if kind == MAPPING:
+            return iter(obj.items())
+        if kind == DATACLASS:
+            names, getter = row_fields(type(obj))
+            return zip(names, getter(obj))
+        return iter(obj)
+
+    def finish(self, kind, values):
+        if kind == SEQUENCE:
+            return values if self.collection_class is list else self.collection_class(values)
+        if self.key is not None:
+            key = self.key
+            return self.item_class((key(k), v) for k, v in values)
+        return self.item_class(values)
+
+    def __call__(self, obj):
+        date = self.date
+        kinds = _kinds
+        kind = kinds.get(type(obj)) or kind_of(type(obj))
+        if kind == LEAF:
+            return obj
+        if kind == DATE:
+            return date(obj) if date is not None else obj
+        # Each frame is (kind, iterator of children, converted children, key in parent)
+        stack = [(kind, self.children(kind, obj), list(), None)]
+        while True:
+            kind, children, values, _ = frame = stack[-1]
+            is_sequence = kind == SEQUENCE
+            for child in children:
+                if is_sequence:
+                    key, value = None, child
+                else:
+                    key, value = child
+                child_kind = kinds.get(type(value)) or kind_of(type(value))
+                if child_kind == DATE:
+                    value = date(value) if date is not None else value
+                elif child_kind != LEAF:
+                    stack.append((child_kind, self.children(child_kind, value), list(), key))
+                    break
+                values.append(value if is_sequence else (key, value))
+            else:
+                stack.pop()
+                result = self.finish(kind, values)
+                if not stack:
+                    return result
+                parent_kind, _, parent_values, _ = stack[-1]
+                parent_values.append(result if parent_kind == SEQUENCE else (frame[3], result))
+
+
+@lru_cache(maxsize=64)
+def get_serializer(item_class=dict, collection_class=list, date_style="python", key=None) -> Serializer:
+    return Serializer(item_class, collection_class, date_style, key)
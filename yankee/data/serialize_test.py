@@ -0,0 +1,42 @@
+import datetime
+
+from .serialize import Serializer
+from .util import to_dict
+from .row_test import make_record
+from yankee.io.convert import jsonify, pythonify
+
+
+def test_deeply_nested():
+    data = leaf = dict()
+    for _ in range(5000):
+        leaf["a"] = [dict()]
+        leaf = leaf["a"][0]
+    result = to_dict(data)
+    depth = 0
+    while result:
+        result = result["a"][0]
+        depth += 1
+    assert depth == 5000
+
+
+def test_date_styles():
+    record = make_record()
+    assert to_dict(record, date_style="json")["date"] == "2021-05-04"
+    assert to_dict(record, date_style="mongo")["date"] == datetime.datetime(2021, 5, 4)
+    moment = datetime.datetime(2021, 5, 4, 12, 5)
+    assert to_dict({"at": moment}, date_style="mongo") == {"at": moment}
+    assert to_dict([moment], date_style=lambda d: d.year) == [2021]
+
+
+def test_item_and_collection_classes():
+    result = Serializer(item_class=dict, collection_class=tuple)(make_record())
+    assert result["parts"] == ({"name": "b"}, {"name": None})
+    assert to_dict((i for i in range(3))) == [0, 1, 2]
+    assert to_dict({"s": "string", "b": b"bytes"}) == {"s": "string", "b": b"bytes"}
+
+
+def test_key_functions():
+    data = {"some_key": [{"a_date": datetime.date(2020, 1, 1)}], "when": datetime.datetime(2020, 1, 1, 5)}
+    assert jsonify(data) == {"someKey": [{"aDate": "2020-01-01T00:00:00"}], "when": "2020-01-01T05:00:00"}
+    assert pythonify({"someKey": {"innerKey": [1]}}) == {"some_key": {"inner_key": [1]}}
+    assert pythonify({"someKey": 1}).some_key == 1
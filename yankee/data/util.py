@@ -3,6 +3,7 @@ import json
 from typing import *
 import dataclasses
 from collections import abc
+from .serialize import get_serializer, row_fields
 
 
 class JsonEncoder(json.JSONEncoder):
@@ -14,23 +15,9 @@ class JsonEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, o)
 
 def to_dict(obj, item_class=dict, collection_class=list, date_style="python"):
-    # print(f"Obj is {obj}")
-    if isinstance(obj, abc.Mapping):
-        # print(f"Casting as Mapping with class {item_class}")
-        return item_class((k, to_dict(v, item_class, collection_class, date_style)) for k, v in obj.items())
-    elif dataclasses.is_dataclass(obj):
-        # print("Converting Dataclass")
-        return to_dict(item_class(obj), item_class, collection_class, date_style)
-    elif isinstance(obj, abc.Iterable) and not isinstance(obj, (str, bytes)):
-        # print(f"Casting as Collection with {collection_class}")
-        return collection_class(to_dict(i, item_class, collection_class, date_style) for i in obj)
-    elif date_style == "mongo" and isinstance(obj, datetime.date):
-        return datetime.datetime.combine(obj, datetime.datetime.min.time())
-    elif date_style == "json" and isinstance(obj, (datetime.datetime, datetime.date)):
-        return obj.isoformat()
-    else:
-        # print("No cast - passing through")
-        return obj
+    """Convert nested Mappings, dataclasses and iterables into plain Python objects.
+    See yankee.data.serialize.Serializer"""
+    return get_serializer(item_class, collection_class, date_style)(obj)
     
 async def ato_dict(obj, item_class=dict, collection_class=list, date_style="python"):
     if isinstance(obj, abc.AsyncIterable):
@@ -76,6 +63,8 @@ def resolve(item, key):
     return item
 
 class DataConversion():
+    __slots__ = ()
+
     def to_mongo(self):
         """Convert object to a Python dictionary with datetime.dates converted to datetime.datetimes for MongoDB compatibility"""
         return to_dict(self, date_style="mongo")
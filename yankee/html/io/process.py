@@ -1,13 +1,21 @@
 import logging
 
 import lxml.etree as ET
-from file_utils import file_iterparse
+
+from ...io.iterparse import file_iterparse
+from ...io.parallel import parallel_load
+from .iterparse import xml_iterparse
+
+# Start and end of each document in a file of concatenated XML documents
+multidoc_patterns = (r"<\?xml".encode("utf-8"), r"\n(?=\<\?xml)".encode("utf-8"))
 
 
 class XmlProcessor(object):
     parser = None
     record_tag = None
+    multidoc = False
     dtd_resolver = ET.Resolver
+    _record_parser = None
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -16,7 +24,10 @@ class XmlProcessor(object):
             ns, tag = self.record_tag.split(":")
             self.record_tag = f"{{{self.schema.Meta['ns'][ns]}}}{tag}"
 
-    def process(self, file_obj, meta=None):
+    def process(self, file_obj, meta=None, workers=None, chunksize=100, ordered=True):
+        if workers:
+            yield from self._process_parallel(file_obj, meta, workers, chunksize, ordered)
+            return
         parse_element = self._parse_element
         if self.multidoc:
             for el in self._process_multidoc(file_obj):
@@ -31,13 +42,34 @@ class XmlProcessor(object):
             r["meta"] = meta
         return r
 
-    def _process_multidoc(self, file_obj):
-        start = r"<\?xml".encode("utf-8")
-        end = r"\n(?=\<\?xml)".encode("utf-8")
+    def _process_parallel(self, file_obj, meta, workers, chunksize, ordered):
+        # Records are split as raw bytes here, and each worker parses them with the same
+        # parser settings, and loads them with the same function, as the sequential path
+        if self.multidoc:
+            records = file_iterparse(file_obj, *multidoc_patterns)
+        else:
+            # Split on the unexpanded record tag, since records are matched as raw bytes
+            records = xml_iterparse(file_obj, tag=self.__class__.record_tag)
+        yield from parallel_load(
+            self, records, workers=workers, chunksize=chunksize, ordered=ordered,
+            method="_parse_record", args=(meta,),
+        )
+
+    def _parse_record(self, meta, record):
+        # Called in the worker processes, which each build their own parser
+        if self._record_parser is None:
+            self._record_parser = self._xml_parser()
+        return self._parse_element(ET.fromstring(record, self._record_parser), meta)
+
+    def _xml_parser(self):
         xml_parser = ET.XMLParser(load_dtd=True, recover=True)
         xml_parser.resolvers.add(self.dtd_resolver())
-        for r in file_iterparse(file_obj, start, end):
-            yield xml_parser.fromstring(r)
+        return xml_parser
+
+    def _process_multidoc(self, file_obj):
+        xml_parser = self._xml_parser()
+        for r in file_iterparse(file_obj, *multidoc_patterns):
+            yield ET.fromstring(r, xml_parser)
 
     def _process_normal(self, file_obj):
         et_gen = ET.iterparse(
@@ -50,11 +82,9 @@ class XmlProcessor(object):
 
 
 def parse_multidoc(file_obj, xml_parser=None):
-    start = r"<\?xml".encode("utf-8")
-    end = r"\n(?=\<\?xml)".encode("utf-8")
     xml_parser = xml_parser or ET.XMLParser()
-    for r in file_iterparse(file_obj, start, end):
-        yield xml_parser.fromstring(r)
+    for r in file_iterparse(file_obj, *multidoc_patterns):
+        yield ET.fromstring(r, xml_parser)
 
 
 def parse_xml_file(file_obj, record_tag):
@@ -1,16 +1,19 @@
+from functools import lru_cache
+
 import lxml.etree as ET
 
 from yankee.base.accessor import do_nothing
-
-try:
-    from cssselect import HTMLTranslator
-except ImportError:
-    pass
+from yankee.xml.util import compile_xpath, simple_path_accessor
 
 class CSS():
     def __init__(self, path):
         self.path = path
 
+@lru_cache(maxsize=1024)
+def css_to_xpath(path):
+    from cssselect import HTMLTranslator
+    return HTMLTranslator().css_to_xpath(path)
+
 def html_accessor(data_key, name, many, meta):
     if isinstance(data_key, ET.XPath):
         def accessor_func(obj):
@@ -26,12 +29,12 @@ def html_accessor(data_key, name, many, meta):
     namespaces = getattr(meta, "namespaces", None)
 
     if isinstance(data_key, CSS):
-        data_key = HTMLTranslator().css_to_xpath(data_key.path)
+        data_key = css_to_xpath(data_key.path)
 
-    if many:
-        xpath = ET.XPath(data_key, namespaces=namespaces)
-    else:
-        xpath = ET.XPath(f"({data_key})[1]", namespaces=namespaces)
+    xpath = compile_xpath(data_key, namespaces, many)
+    fast_accessor = simple_path_accessor(data_key, namespaces, many, xpath)
+    if fast_accessor is not None:
+        return fast_accessor
     
     def accessor_func(obj):
         if obj is None:
@@ -1,5 +1,6 @@
 import lxml.etree as ET
 from yankee.base import fields
+from yankee.base.deserializer import ignores_raw
 from yankee.util import clean_whitespace
 
 from .mixin import HtmlMixin
@@ -65,6 +66,7 @@ class TailField(fields.Field):
     def load(self, obj):
         return super().load(obj)
 
+    @ignores_raw
     def deserialize(self, obj):
         return clean_whitespace(super().deserialize(obj).tail)
 
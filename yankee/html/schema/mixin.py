@@ -1,12 +1,30 @@
 import lxml.etree as ET
 from yankee.util import clean_whitespace
-from .accessor import html_accessor
+from yankee.xml.schema.accessor import (cleans_whitespace, exists_accessor, is_element_path, scalar_function,
+                                        text_accessor)
+from .accessor import CSS, css_to_xpath, html_accessor
 
 class HtmlMixin(object):
     class Meta:
         accessor_function = html_accessor
         infer_keys = False
 
+    def make_accessor(self):
+        # See XmlMixin.make_accessor
+        function = scalar_function(self) if self.Meta.accessor_function is html_accessor else None
+        if function is not None:
+            namespaces = getattr(self.Meta, "namespaces", None)
+            data_key = css_to_xpath(self.data_key.path) if isinstance(self.data_key, CSS) else self.data_key
+            if function == "boolean" and isinstance(data_key, str):
+                self.accessor = exists_accessor(data_key, namespaces)
+                return
+            if function == "string" and (isinstance(self.data_key, CSS) or is_element_path(data_key, namespaces)):
+                self.text_accessor = text_accessor(data_key, namespaces, not cleans_whitespace(self.formatter))
+                return super().make_accessor()
+        if "text_accessor" in self.__dict__:
+            del self.text_accessor
+        return super().make_accessor()
+
     def to_string(self, elem):
         if isinstance(elem, str):
             return elem
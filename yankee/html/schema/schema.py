@@ -2,20 +2,33 @@ import lxml.html as ET
 from lxml.etree import _Element
 from yankee.base import schema
 from yankee.base.deserializer import Deserializer
-
+from yankee.html.io.iterparse import xml_iterparse, axml_iterparse
 from .mixin import HtmlMixin
 
 class Deserializer(HtmlMixin, Deserializer):
     pass
 
 class Schema(HtmlMixin, schema.Schema):
-    def load(self, obj):
+    def coerce(self, obj):
         if isinstance(obj, _Element):
-            return super().load(obj)
+            return obj
         elif isinstance(obj, str):
-            return super().load(ET.fromstring(obj.encode()))
+            return ET.fromstring(obj.encode())
         elif isinstance(obj, bytes):
-            return super().load(ET.fromstring(obj))
+            return ET.fromstring(obj)
+        elif isinstance(obj, memoryview):
+            return ET.fromstring(obj.tobytes())
+
+    def load(self, obj, only=None, exclude=None):
+        obj = self.coerce(obj)
+        if obj is not None:
+            return super().load(obj, only, exclude)
+
+    def iter_records(self, file_obj, record_tag):
+        return xml_iterparse(file_obj, tag=record_tag)
+
+    def aiter_records(self, stream, record_tag):
+        return axml_iterparse(stream, tag=record_tag)
 
 
 class PolymorphicSchema(HtmlMixin, schema.PolymorphicSchema):
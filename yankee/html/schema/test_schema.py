@@ -172,3 +172,17 @@ def test_literal_css():
     
     data = CssListSchema().load(doc)
     assert data.a == ["data 1", "data 2"]
+
+def test_scalar_pushdown_css():
+    doc = b"<html><body><dd class='judge'>Hon. <b>A</b> Judge</dd><dd class='judge'>Other</dd></body></html>"
+
+    class CssSchema(Schema):
+        judge = f.Str(CSS("dd.judge"))
+        clerk = f.Exists(CSS("dd.clerk"))
+
+    schema = CssSchema()
+    assert schema.fields["judge"].text_accessor.__qualname__.startswith("text_accessor")
+    assert schema.fields["clerk"].accessor.__qualname__.startswith("exists_accessor")
+    data = schema.load(doc)
+    assert data.judge == "Hon. A Judge"
+    assert data.clerk is False
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import pytest
+
+# Optional or rarely needed dependencies that should only be imported on first use
+deferred = ("asyncio", "concurrent.futures", "cssselect", "dateutil", "jsonpath_ng", "orjson", "ujson", "pyarrow", "pandas")
+
+
+@pytest.mark.parametrize("module", ["yankee", "yankee.xml", "yankee.json", "yankee.html"])
+def test_heavy_imports_are_deferred(module):
+    code = f"import sys, {module}; print(' '.join(m for m in {deferred!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == []
+
+
+def test_json_path_is_exported():
+    import yankee.json.schema as schema
+
+    assert "JsonPath" in dir(schema)
+    namespace = dict()
+    exec("from yankee.json.schema import *", namespace)
+    assert namespace["JsonPath"]("$.a").find({"a": 1})[0].value == 1
+
+
+def test_json_path_without_jsonpath_ng(monkeypatch):
+    import yankee.json.schema as schema
+
+    monkeypatch.delitem(schema.__dict__, "JsonPath", raising=False)
+    monkeypatch.setitem(sys.modules, "jsonpath_ng", None)
+    assert not hasattr(schema, "JsonPath")
+    assert getattr(schema, "JsonPath", None) is None
@@ -1 +1,8 @@
-from .iterparse import file_iterparse
+from .iterparse import file_iterparse, iter_record_spans, iter_records_mmap, RecordSplitter, aiter_records
+
+def __getattr__(name):
+    # The record index is imported on first use
+    if name in ("RecordIndex", "build_record_index"):
+        from . import index
+        return getattr(index, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,149 @@
+import os
+import mmap
+
+
+from .iterparse import iter_record_spans, compile_pattern
+
+
+class RecordIndex(object):
+    """
+    An index of byte offsets of each record in a bulk file, with optional keys,
+    allowing individual records or ranges of records to be read without scanning
+    the file. Build one with `build_record_index`, or open a saved one with
+    `RecordIndex.open`.
+    """
+
+    def __init__(self, path, offsets, lengths, keys=None, size=None, mtime=None):
+        self.path = str(path)
+        self.offsets = offsets
+        self.lengths = lengths
+        self.keys = keys
+        self.size = size
+        self.mtime = mtime
+        self._positions = None
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __repr__(self):
+        return f"RecordIndex({self.path!r}, records={len(self)})"
+
+    def __getitem__(self, i):
+        with open(self.path, "rb") as f:
+            f.seek(self.offsets[i])
+            return f.read(self.lengths[i])
+
+    def position(self, key):
+        if self.keys is None:
+            raise ValueError("Index was built without a key pattern")
+        if self._positions is None:
+            positions = dict()
+            for i, k in enumerate(self.keys):
+                positions.setdefault(k, i)
+            self._positions = positions
+        return self._positions[key]
+
+    def get(self, key, schema=None):
+        """Return the record with the given key, loaded with `schema` if provided"""
+        record = self[self.position(key)]
+        return schema.load(record) if schema is not None else record
+
+    def slice(self, i, j, schema=None) -> "List":
+        """Return records i through j, read from the file in a single contiguous read"""
+        offsets, lengths = self.offsets[i:j], self.lengths[i:j]
+        if not offsets:
+            return list()
+        start = offsets[0]
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            data = f.read(offsets[-1] + lengths[-1] - start)
+        records = [data[o - start : o - start + l] for o, l in zip(offsets, lengths)]
+        if schema is not None:
+            return [schema.load(r) for r in records]
+        return records
+
+    def shards(self, n) -> "List[Tuple[int, int]]":
+        """Split the index into `n` (i, j) ranges of roughly equal size in bytes,
+        suitable for passing to `slice` on separate workers or machines"""
+        total = sum(self.lengths)
+        bounds, i, acc = list(), 0, 0
+        for k, length in enumerate(self.lengths):
+            acc += length
+            if acc >= total * (len(bounds) + 1) / n and len(bounds) < n - 1:
+                bounds.append((i, k + 1))
+                i = k + 1
+        bounds.append((i, len(self)))
+        return bounds
+
+    def is_current(self):
+        stat = os.stat(self.path)
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime
+
+    def save(self, index_path=None):
+        index_path = index_path or default_index_path(self.path)
+        data = {
+            "path": self.path,
+            "size": self.size,
+            "mtime": self.mtime,
+            "offsets": self.offsets,
+            "lengths": self.lengths,
+            "keys": self.keys,
+        }
+        import ujson
+        with open(index_path, "w") as f:
+            ujson.dump(data, f)
+        return index_path
+
+    @classmethod
+    def open(cls, path, index_path=None):
+        """Open the sidecar index for the file at `path`. Raises ValueError if the
+        file has changed since the index was built"""
+        index_path = index_path or default_index_path(path)
+        import ujson
+        with open(index_path, "r") as f:
+            data = ujson.load(f)
+        index = cls(path, data["offsets"], data["lengths"], data["keys"], data["size"], data["mtime"])
+        if not index.is_current():
+            raise ValueError(f"Index {index_path} is out of date for {path}")
+        return index
+
+
+def default_index_path(path):
+    return f"{path}.idx"
+
+
+def build_record_index(
+    path, tag=None, key=None, start=None, end=None, index_path=None, save=True
+) -> RecordIndex:
+    """
+    Scans the file at `path` once and builds a RecordIndex of each record's offset and length.
+
+    Records are either XML elements named `tag`, or are delimited by `start` and `end`
+    regexes as in `iter_record_spans`. If `key` is given, it is a regex searched within
+    each record, and its first group (or whole match) becomes the record's key for
+    `RecordIndex.get`. Unless `save` is False, the index is written to a sidecar file
+    next to the data (`<path>.idx`) or to `index_path`.
+    """
+    if tag is not None:
+        from yankee.xml.io.iterparse import record_patterns
+
+        start, end = record_patterns(tag)
+    key = compile_pattern(key)
+    stat = os.stat(path)
+    offsets, lengths = list(), list()
+    keys = list() if key is not None else None
+    if stat.st_size:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for record_start, record_end in iter_record_spans(mm, start, end):
+                offsets.append(record_start)
+                lengths.append(record_end - record_start)
+                if key is not None:
+                    match = key.search(mm, record_start, record_end)
+                    if match is None:
+                        keys.append(None)
+                    else:
+                        keys.append((match.group(1) if match.re.groups else match.group(0)).decode())
+    index = RecordIndex(path, offsets, lengths, keys, stat.st_size, stat.st_mtime_ns)
+    if save:
+        index.save(index_path)
+    return index
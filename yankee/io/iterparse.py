@@ -1,5 +1,7 @@
 import io
+import os
 import re
+import mmap
 
 
 def file_iterparse(
@@ -60,7 +62,8 @@ def file_event_parser(
     last_event = None
     while True:
         chunk_length = len(chunk)
-        start_index = safe_search(chunk, start).start(0)
+        start_match = start.search(chunk)
+        start_index = start_match.start(0) if start_match else None
         end_index = safe_search(chunk, end).end(0) if end else None
         # Middle of Record
         if start_index is None and end_index is None:
@@ -73,27 +76,20 @@ def file_event_parser(
             chunk = bytearray()
 
         # Start of Record
-        elif (
-            start_index is not None
-            and end_index is None
-            or (start_index and end_index and start_index < end_index)
-        ):
+        # (offsets are compared with None, since a match at offset 0 is falsy)
+        elif start_index is not None and (end_index is None or start_index < end_index):
             if last_event:
                 yield ("end", chunk[:start_index])
                 last_event = "end"
             else:
                 yield (None, chunk[:start_index])
-            yield ("start", chunk[start_index : start_index + len(start.pattern)])
+            yield ("start", chunk[start_index : start_match.end(0)])
             last_event = "start"
-            chunk = chunk[start_index + len(start.pattern) :]
+            chunk = chunk[start_match.end(0) :]
             recording = True
 
         # End of record
-        elif (
-            end_index is not None
-            and start_index is None
-            or (start_index and end_index and end_index < start_index)
-        ):
+        elif end_index is not None:
             # It is implied that you are recording
             yield ("end", chunk[:end_index])
             last_event = "end"
@@ -108,3 +104,185 @@ def file_event_parser(
 
     if last_event in ("middle", "start"):
         yield ("end", b"")
+
+
+def compile_pattern(pattern):
+    if isinstance(pattern, str):
+        pattern = pattern.encode()
+    if isinstance(pattern, bytes):
+        pattern = re.compile(pattern)
+    return pattern
+
+
+def iter_record_spans(buffer, start, end=None) -> "Iterable[Tuple[int, int]]":
+    """
+    Given a bytes-like buffer (including an mmap), and a start and optional end regex,
+    yields (start, end) offsets of each record in a single forward scan.
+
+    Without an end regex, a record runs up to the next start match (or the end of the
+    buffer). With an end regex, a record runs through the end of the next end match,
+    and a trailing record with no end match is dropped. A start match that ends in
+    `/>` is an empty XML element (e.g. `<item id="1"/>`), and is a whole record.
+    """
+    start = compile_pattern(start)
+    end = compile_pattern(end)
+    if end is None:
+        record_start = None
+        for match in start.finditer(buffer):
+            if record_start is not None:
+                yield (record_start, match.start())
+            record_start = match.start()
+        if record_start is not None:
+            yield (record_start, len(buffer))
+        return
+    pos = 0
+    while True:
+        start_match = start.search(buffer, pos)
+        if start_match is None:
+            return
+        if buffer[start_match.end() - 2:start_match.end()] == b"/>":
+            yield (start_match.start(), start_match.end())
+            pos = start_match.end()
+            continue
+        end_match = end.search(buffer, start_match.start())
+        if end_match is None:
+            return
+        yield (start_match.start(), end_match.end())
+        pos = max(end_match.end(), start_match.end() + 1)
+
+
+class RecordSplitter(object):
+    """
+    Incrementally splits a byte stream into records, as `iter_record_spans` does
+    for a whole buffer. Feed it chunks as they arrive, and it returns each record
+    as soon as it is complete; only the unfinished record, or the last `overlap`
+    bytes if there isn't one, are kept in memory. Each feed only searches the new
+    data, plus `overlap` bytes before it, which must be at least as long as any
+    start or end match, so that matches split between chunks are found.
+    """
+
+    def __init__(self, start, end=None, overlap=1024):
+        self.start = compile_pattern(start)
+        self.end = compile_pattern(end)
+        self.overlap = overlap
+        self.buffer = bytearray()
+        # The offset of the record whose end hasn't arrived yet, if any
+        self.record_start = None
+        # The offset the next search resumes from
+        self.scan = 0
+
+    def feed(self, chunk) -> "List[bytes]":
+        buffer = self.buffer
+        resume = max(self.scan - self.overlap, 0)
+        buffer += chunk
+        if self.end is None:
+            records, record_start, pos = self._split_at_starts(buffer, resume)
+        else:
+            records, record_start, pos = self._split_spans(buffer, resume)
+        if record_start is not None:
+            keep = record_start
+            self.scan = len(buffer) - keep
+        else:
+            keep = max(len(buffer) - self.overlap, pos)
+            self.scan = 0
+        del buffer[:keep]
+        self.record_start = record_start - keep if record_start is not None else None
+        return records
+
+    def _split_at_starts(self, buffer, resume):
+        # A record runs up to the next start, so the last one is held until the next
+        # start arrives, or the stream is closed
+        records, record_start = list(), self.record_start
+        for match in self.start.finditer(buffer, resume):
+            if record_start is not None:
+                if match.start() <= record_start:
+                    continue
+                records.append(bytes(buffer[record_start:match.start()]))
+            record_start = match.start()
+        return records, record_start, 0
+
+    def _split_spans(self, buffer, resume):
+        records, record_start, pos = list(), self.record_start, resume
+        while True:
+            if record_start is not None:
+                # Matched again, as the start of an empty element may have been cut off
+                start_match = self.start.match(buffer, record_start)
+                if start_match is None:
+                    pos, record_start = record_start + 1, None
+                    continue
+                end_from = max(resume, record_start)
+            else:
+                start_match = self.start.search(buffer, pos)
+                if start_match is None:
+                    return records, None, pos
+                end_from = start_match.start()
+            record_start = None
+            if buffer[start_match.end() - 2:start_match.end()] == b"/>":
+                records.append(bytes(buffer[start_match.start():start_match.end()]))
+                pos = start_match.end()
+                continue
+            end_match = self.end.search(buffer, end_from)
+            if end_match is None:
+                return records, start_match.start(), pos
+            records.append(bytes(buffer[start_match.start():end_match.end()]))
+            pos = max(end_match.end(), start_match.end() + 1)
+
+    def close(self) -> "List[bytes]":
+        """Return any record left at the end of the stream"""
+        records = list()
+        if self.end is None:
+            match = self.start.search(self.buffer)
+            if match is not None:
+                records.append(bytes(self.buffer[match.start():]))
+        self.buffer = bytearray()
+        self.record_start, self.scan = None, 0
+        return records
+
+
+async def aiter_chunks(stream, chunk_size=65536) -> "AsyncIterator[bytes]":
+    """Read chunks from an async file-like object with an awaitable `read` (e.g.
+    aiofiles, aiohttp's StreamReader), or an async iterable of byte chunks"""
+    if hasattr(stream, "read"):
+        while True:
+            chunk = await stream.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for chunk in stream:
+            yield chunk
+
+
+async def aiter_records(stream, start, end=None, chunk_size=65536) -> "AsyncIterator[bytes]":
+    """Asynchronously split records out of an async byte stream as it is read.
+    See `RecordSplitter` and `aiter_chunks`"""
+    splitter = RecordSplitter(start, end)
+    async for chunk in aiter_chunks(stream, chunk_size):
+        for record in splitter.feed(chunk):
+            yield record
+    for record in splitter.close():
+        yield record
+
+
+def iter_records_mmap(path, start, end=None) -> "Iterable[memoryview]":
+    """
+    Memory-maps the file at `path`, and yields a zero-copy memoryview of each record,
+    as found by `iter_record_spans`. Views can be passed directly to `lxml.etree.fromstring`
+    or `bytes()`, and should not be kept past the end of iteration, since the map is
+    closed once the generator is exhausted.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mm)
+    try:
+        for record_start, record_end in iter_record_spans(mm, start, end):
+            yield view[record_start:record_end]
+    finally:
+        view.release()
+        try:
+            mm.close()
+        except BufferError:
+            # A caller is still holding a record view; the map closes when it is released
+            pass
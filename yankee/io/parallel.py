@@ -0,0 +1,75 @@
+import os
+import itertools
+from functools import partial
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, as_completed, FIRST_COMPLETED
+
+# Each worker process builds its own schema once, in the pool initializer
+_worker_schema = None
+_worker_load = None
+
+
+def _init_worker(schema, method, args):
+    global _worker_schema, _worker_load
+    _worker_schema = schema() if isinstance(schema, type) else schema
+    load = getattr(_worker_schema, method)
+    _worker_load = partial(load, *args) if args else load
+
+
+def _load_batch(records):
+    return [_worker_load(r) for r in records]
+
+
+def batched(iterable, n):
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, n))
+        if not batch:
+            return
+        yield batch
+
+
+def parallel_load(
+    schema,
+    records: "Iterable[bytes]",
+    workers: int = None,
+    chunksize: int = 100,
+    ordered: bool = True,
+    max_in_flight: int = None,
+    method: str = "load",
+    args: tuple = (),
+) -> "Iterator":
+    """
+    Loads raw records with a pool of worker processes
+
+    Records are split in the calling process and shipped to the pool in batches
+    of `chunksize`. At most `max_in_flight` batches (default: 2 per worker) are
+    outstanding at any time, so memory use stays bounded regardless of input size.
+    Results are yielded in input order unless `ordered` is False.
+
+    `schema` is a schema instance, which is pickled and sent to each worker, or a
+    schema class, which each worker constructs without arguments. Either way, the
+    schema classes must be importable, and the loaded records must be pickleable.
+    Each record is loaded with `schema.<method>(*args, record)`.
+    """
+    workers = workers or os.cpu_count()
+    max_in_flight = max_in_flight or 2 * workers
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(schema, method, args)) as pool:
+        if ordered:
+            pending = deque()
+            for batch in batched(records, chunksize):
+                if len(pending) >= max_in_flight:
+                    yield from pending.popleft().result()
+                pending.append(pool.submit(_load_batch, batch))
+            while pending:
+                yield from pending.popleft().result()
+        else:
+            pending = set()
+            for batch in batched(records, chunksize):
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+                pending.add(pool.submit(_load_batch, batch))
+            for future in as_completed(pending):
+                yield from future.result()
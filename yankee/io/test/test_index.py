@@ -0,0 +1,61 @@
+import pytest
+
+from ..index import RecordIndex, build_record_index
+
+bulk_doc = "<applications>\n" + "".join(
+    f"<application><number>{i:08d}</number><title>Title {i}</title></application>\n"
+    for i in range(20)
+) + "</applications>"
+
+
+@pytest.fixture
+def bulk_file(tmp_path):
+    path = tmp_path / "bulk.xml"
+    path.write_bytes(bulk_doc.encode())
+    return path
+
+
+def test_build_index(bulk_file):
+    index = build_record_index(bulk_file, tag="application", key=rb"<number>(\d+)</number>")
+    assert len(index) == 20
+    assert index[0] == b"<application><number>00000000</number><title>Title 0</title></application>"
+    assert index.get("00000013") == index[13]
+    assert b"Title 13" in index.get("00000013")
+
+
+def test_build_index_empty_elements(tmp_path):
+    path = tmp_path / "items.xml"
+    path.write_bytes(b'<items><item id="1"/><item id="2">Two</item><item id="3"/></items>')
+    index = build_record_index(path, tag="item", key=rb'id="(\d+)"', save=False)
+    assert [index[i] for i in range(len(index))] == [b'<item id="1"/>', b'<item id="2">Two</item>', b'<item id="3"/>']
+    assert index.get("3") == b'<item id="3"/>'
+
+
+def test_index_slice_and_shards(bulk_file):
+    index = build_record_index(bulk_file, tag="application", save=False)
+    assert index.slice(2, 5) == [index[2], index[3], index[4]]
+    shards = index.shards(3)
+    assert len(shards) == 3
+    assert shards[0][0] == 0 and shards[-1][1] == 20
+    assert sum(len(index.slice(i, j)) for i, j in shards) == 20
+
+
+def test_index_sidecar(bulk_file):
+    build_record_index(bulk_file, tag="application", key=rb"<number>(\d+)</number>")
+    index = RecordIndex.open(bulk_file)
+    assert b"Title 7" in index.get("00000007")
+    bulk_file.write_bytes(bulk_doc.encode() + b"\n")
+    with pytest.raises(ValueError):
+        RecordIndex.open(bulk_file)
+
+
+def test_index_loads_schema(bulk_file):
+    from yankee.xml.schema import Schema, fields as f
+
+    class ApplicationSchema(Schema):
+        number = f.Str("./number")
+        title = f.Str("./title")
+
+    index = build_record_index(bulk_file, tag="application", key=rb"<number>(\d+)</number>", save=False)
+    assert index.get("00000004", schema=ApplicationSchema()).title == "Title 4"
+    assert [r.title for r in index.slice(0, 2, schema=ApplicationSchema())] == ["Title 0", "Title 1"]
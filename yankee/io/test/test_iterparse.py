@@ -1,6 +1,8 @@
 import io
 
-from ..iterparse import file_iterparse
+import pytest
+
+from ..iterparse import file_iterparse, iter_record_spans, iter_records_mmap, RecordSplitter, aiter_records
 
 test_doc = """
 <record>
@@ -13,3 +15,90 @@ test_doc = """
 def test_file_iterparse_with_record_start():
     records = list(file_iterparse(io.BytesIO(test_doc.encode()), "<"))
     assert len(records) == 4
+
+
+mmap_doc = b"""<?xml version="1.0"?>
+<records>
+<record><a>1</a></record>
+<record><a>2</a></record>
+<record/>
+</records>"""
+
+
+def test_iter_record_spans_with_end():
+    spans = list(iter_record_spans(mmap_doc, rb"<record(?=[\s/>])", rb"</record>|record/>"))
+    assert [mmap_doc[s:e] for s, e in spans] == [
+        b"<record><a>1</a></record>",
+        b"<record><a>2</a></record>",
+        b"<record/>",
+    ]
+
+
+def test_iter_records_mmap(tmp_path):
+    path = tmp_path / "records.txt"
+    path.write_bytes(test_doc.encode())
+    records = [bytes(r) for r in iter_records_mmap(path, "<")]
+    assert records == [b"<record>\n"] * 4
+
+
+def test_iter_records_mmap_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert list(iter_records_mmap(path, "<")) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_record_splitter(chunk_size):
+    expected = [mmap_doc[s:e] for s, e in iter_record_spans(mmap_doc, rb"<record(?=[\s/>])", rb"</record>|record/>")]
+    splitter = RecordSplitter(rb"<record(?=[\s/>])", rb"</record>|record/>")
+    records = list()
+    for i in range(0, len(mmap_doc), chunk_size):
+        records += splitter.feed(mmap_doc[i : i + chunk_size])
+    records += splitter.close()
+    assert records == expected
+
+
+def test_record_splitter_without_end():
+    splitter = RecordSplitter(rb"<record")
+    records = list()
+    for i in range(0, len(test_doc), 4):
+        records += splitter.feed(test_doc[i : i + 4].encode())
+    records += splitter.close()
+    assert records == [r.encode() for r in ("<record>\n",) * 3 + ("<record>\n",)]
+
+
+sparse_doc = (
+    b"<records>" + b"<!-- preamble -->" * 200
+    + b"<record id='1'><a>" + b"x" * 5000 + b"</a></record>" + b" " * 3000
+    + b"<record id='2'/>" + b"<other/>" * 500 + b"<record id='3'><a>3</a></record></records>"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 4096])
+@pytest.mark.parametrize("end", [rb"</record>|record/>", None])
+def test_record_splitter_matches_spans(chunk_size, end):
+    start = rb"<record(?=[\s/>])(?:[^>]*/>)?"
+    expected = [sparse_doc[s:e] for s, e in iter_record_spans(sparse_doc, start, end)]
+    splitter = RecordSplitter(start, end, overlap=64)
+    records, largest = list(), 0
+    for i in range(0, len(sparse_doc), chunk_size):
+        records += splitter.feed(sparse_doc[i : i + chunk_size])
+        if splitter.record_start is None:
+            largest = max(largest, len(splitter.buffer))
+    records += splitter.close()
+    assert records == expected
+    # Text between records isn't kept
+    assert largest <= 64 + chunk_size
+
+
+@pytest.mark.asyncio
+async def test_aiter_records():
+    class AsyncReader():
+        def __init__(self, data):
+            self.file = io.BytesIO(data)
+
+        async def read(self, n):
+            return self.file.read(n)
+
+    records = [r async for r in aiter_records(AsyncReader(mmap_doc), rb"<record(?=[\s/>])", rb"</record>|record/>", chunk_size=5)]
+    assert len(records) == 3 and records[-1] == b"<record/>"
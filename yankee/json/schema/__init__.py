@@ -1,13 +1,33 @@
+from importlib.util import find_spec as _find_spec
+
 from .fields import *
 from .schema import PolymorphicSchema, Schema, RegexSchema, ZipSchema
 
-try:
-    import jsonpath_ng
-    def JsonPath(string):
+# JsonPath is only defined if jsonpath_ng is installed, and jsonpath_ng
+# (and ply) are only imported when it is first used
+__all__ = [name for name in globals() if not name.startswith("_")]
+if _find_spec("jsonpath_ng") is not None:
+    __all__.append("JsonPath")
+
+
+def __getattr__(name):
+    if name == "JsonPath":
         try:
-            return jsonpath_ng.parse(string)
-        except jsonpath_ng.exceptions.JsonPathParserError:
-            return jsonpath_ng.ext.parse(string)
-except ImportError:
-    pass
+            import jsonpath_ng
+            import jsonpath_ng.ext
+        except ImportError as e:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}, as jsonpath_ng isn't installed") from e
+
+        def JsonPath(string):
+            try:
+                return jsonpath_ng.parse(string)
+            except jsonpath_ng.exceptions.JsonPathParserError:
+                return jsonpath_ng.ext.parse(string)
+
+        globals()["JsonPath"] = JsonPath
+        return JsonPath
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,12 +1,18 @@
-from collections.abc import Sequence
+import sys
+
 from yankee.util import camelize
-from yankee.base.accessor import do_nothing
-import jsonpath_ng
+from yankee.base.accessor import do_nothing, split_key, mapping_path
+
+
+def is_jsonpath(data_key):
+    # A JSONPath data key can only exist if jsonpath_ng has been imported
+    jsonpath_ng = sys.modules.get("jsonpath_ng")
+    return jsonpath_ng is not None and isinstance(data_key, jsonpath_ng.JSONPath)
 
 
 def json_accessor(data_key, name, many, meta):
     # Handle JSONPath objects passed as data keys
-    if isinstance(data_key, jsonpath_ng.JSONPath):
+    if is_jsonpath(data_key):
         def accessor_func(obj):
             result = [match.value for match in data_key.find(obj)]
             try:
@@ -20,18 +26,4 @@ def json_accessor(data_key, name, many, meta):
     # Handle implicit data keys
     elif data_key is None and meta.infer_keys:
         data_key = camelize(name)
-    key_segments = tuple(int(s) if s.isdigit() else s for s in data_key.split("."))
-    def accessor_func(obj):
-        result = obj
-        for seg in key_segments:
-            if isinstance(result, Sequence) and not isinstance(result, str):
-                try:
-                    result = result[int(seg)]
-                except IndexError:
-                    result = None
-            elif result is None:
-                return None
-            else:
-                result = result.get(seg, None)
-        return result
-    return accessor_func
\ No newline at end of file
+    return mapping_path(split_key(data_key))
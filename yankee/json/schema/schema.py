@@ -1,25 +1,48 @@
+from functools import lru_cache
+
 from yankee.base import schema
-import ujson as json
 from .mixin import JsonMixin
 from .fields import List
 
+@lru_cache(maxsize=None)
+def json_parsers():
+    """The JSON parsers to try in turn, imported on first use"""
+    import ujson
+    try:
+        import orjson
+    except ImportError:
+        return ((ujson.loads, ujson.JSONDecodeError),)
+    return ((orjson.loads, orjson.JSONDecodeError), (ujson.loads, ujson.JSONDecodeError))
+
+def loads(obj):
+    """Parse JSON with orjson when it is installed, falling back to ujson
+    for documents orjson rejects (e.g. integers wider than 64 bits)"""
+    *parsers, (fallback, _) = json_parsers()
+    for parse, error in parsers:
+        try:
+            return parse(obj)
+        except error:
+            pass
+    if isinstance(obj, memoryview):
+        obj = obj.tobytes()
+    return fallback(obj)
+
 class Schema(JsonMixin, schema.Schema):
-    def load(self, obj):
+    def coerce(self, obj):
         if self.name is not None or isinstance(obj, (list, dict)):
-            return super().load(obj)
-        elif isinstance(obj, str):
-            return super().load(json.loads(obj))
-        elif isinstance(obj, bytes):
-            return super().load(json.loads(obj.decode()))
+            return obj
+        elif isinstance(obj, (str, bytes, bytearray, memoryview)):
+            return loads(obj)
         raise ValueError(f"Cannot load {obj} as {self.__class__.__name__}")
 
+    def load(self, obj, only=None, exclude=None):
+        return super().load(self.coerce(obj), only, exclude)
+
     def load_batch(self, obj):
         if self.name is not None or isinstance(obj, list):
             return super().load_batch(obj)
-        elif isinstance(obj, str):
-            return super().load_batch(json.loads(obj))
-        elif isinstance(obj, bytes):
-            return super().load_batch(json.loads(obj.decode()))
+        elif isinstance(obj, (str, bytes, bytearray, memoryview)):
+            return super().load_batch(loads(obj))
         raise ValueError(f"Cannot load {obj} as {self.__class__.__name__}")
 
 class PolymorphicSchema(JsonMixin, schema.PolymorphicSchema):
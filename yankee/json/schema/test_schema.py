@@ -79,4 +79,33 @@ def test_json_path():
     class PathListSchema(Schema):
         numbers = f.List(f.Int, JsonPath("foo[*].baz"))
     data = PathListSchema().load(doc)
-    assert data.numbers == [1, 2]
\ No newline at end of file
+    assert data.numbers == [1, 2]
+
+@pytest.mark.parametrize(
+    "data_key,expected",
+    [
+        ("a", {"b": [1, {"c": "deep"}]}),
+        ("a.b", [1, {"c": "deep"}]),
+        ("a.b.0", 1),
+        ("a.b.1.c", "deep"),
+        ("a.b.5.c", None),
+        ("a.missing.c", None),
+        ("a.b.c", None),
+        ("list.0", "first"),
+        ("0", None),
+    ],
+)
+def test_key_paths(data_key, expected):
+    from yankee.json.schema.accessor import json_accessor
+
+    obj = {"a": {"b": [1, {"c": "deep"}]}, "list": ["first"]}
+    accessor = json_accessor(data_key, "name", False, Schema.Meta)
+    assert accessor(obj) == expected
+    assert accessor(None) is None
+
+
+def test_load_bytes():
+    result = SubSchema().load(json.dumps({"string": "bytes", "float": 1.5}).encode())
+    assert result.to_dict() == {"string": "bytes", "float": 1.5}
+    result = SubSchema().load(memoryview(b'{"string": "view"}'))
+    assert result.to_dict() == {"string": "view"}
@@ -2,12 +2,16 @@ import re
 import itertools
 import importlib
 import datetime
-import ujson as json
 import dataclasses as dc
+from functools import lru_cache
 
-def import_class(string):
-    module, klass = string.rsplit(".", 1)
-    return getattr(importlib.import_module(module), klass)
+@lru_cache(maxsize=1024)
+def import_class(string, module=None):
+    """Import a class from a dotted path. A bare class name is looked up in `module`.
+    Results are cached, so lazy references to schemas are only resolved once"""
+    if "." in string:
+        module, string = string.rsplit(".", 1)
+    return getattr(importlib.import_module(module), string)
 
 us_re_0 = re.compile(r"[^A-Za-z\d_]")
 us_re_1 = re.compile(r"([A-Z]+)([A-Z][a-z])")
@@ -50,6 +54,7 @@ def is_valid(obj):
         return bool(obj)
     return True
 
+@lru_cache(maxsize=4096)
 def inflect(string, style=None):
     try:
         if style is None:
@@ -100,7 +105,8 @@ class AttrDict(dict):
             return obj
 
     def to_json(self, *args, **kwargs):
-        return json.dumps(self, *args, default=date_encoder, **kwargs)
+        import ujson
+        return ujson.dumps(self, *args, default=date_encoder, **kwargs)
 
 def update_class(orig, update):
     for k in filter(lambda k: not k.startswith("_"), update.__dict__.keys()):
@@ -1,5 +1,7 @@
 import re
 
+from ...io.iterparse import iter_records_mmap, aiter_records
+
 class NullObject(object):
     """A nothing object that returns null to all possible
     method calls"""
@@ -27,41 +29,61 @@ def safe_read(in_f, chunk_size):
         chunk = nxt_chunk[end_tag:]
         
 def iter_file(in_f, start_regex, end_regex, chunksize):
+    # Until the input runs out, the last `overlap` bytes are kept for the next search,
+    # so a tag split across two reads is still matched
+    overlap = max(len(start_regex.pattern), len(end_regex.pattern))
     pending = False
+    exhausted = False
     chunk = bytearray()
+    wait = False
     chunk_iter = safe_read(in_f, chunksize)
-    chunk += next(chunk_iter)
 
     while True:
-        if len(chunk) < chunksize:
+        if not exhausted and (wait or len(chunk) < chunksize or len(chunk) <= overlap):
             new_chunk = next(chunk_iter)
+            exhausted = not new_chunk
             chunk += new_chunk
-        start = safe_search(chunk, start_regex).start(0)
-        end = safe_search(chunk, end_regex).end(0)
+            wait = False
+        keep = len(chunk) - (0 if exhausted else overlap)
+        start_match = start_regex.search(chunk)
+        start = start_match.start(0) if start_match else None
+        if pending or start is None:
+            end = safe_search(chunk, end_regex).end(0)
+        elif chunk.endswith(b"/>", 0, start_match.end(0)):
+            # An empty element, e.g. <tag id="1"/>
+            end = start_match.end(0)
+        else:
+            end = (end_regex.search(chunk, start) or NullObject()).end(0)
+        # The rest of the start tag hasn't been read yet
+        if not pending and start is not None and not exhausted and chunk.find(b">", start) == -1:
+            wait = True
         # Initialization - skip to first record
-        if not pending and not start:
-            chunk = bytearray()
+        elif not pending and start is None:
+            chunk = chunk[max(keep, 0):]
         # Complete record within chunk
-        elif start and end:
+        elif not pending and end is not None:
             yield ("start", chunk[start:end])
             yield ("end", bytearray())
             chunk = chunk[end:]
         # start detected, no open preceding item
-        elif start and not pending:
-            yield ("start", chunk[start:])
-            chunk = bytearray()
+        elif not pending:
+            cut = max(keep, start + 1)
+            yield ("start", chunk[start:cut])
+            pending = True
+            chunk = chunk[cut:]
         # end detected, open preceding item
-        elif end and pending:
+        elif end is not None:
             yield ("end", chunk[:end])
             pending = False
             chunk = chunk[end:]
-        # no start or end detected, but pending record
-        elif not start and not end and pending:
-            yield ("middle", chunk)
-            chunk = bytearray()
+        # no end detected, but pending record
+        elif end is None:
+            if keep > 0:
+                yield ("middle", chunk[:keep])
+                chunk = chunk[keep:]
         else:
             raise ValueError("Uncaught parser condition!")
-        if not chunk and not new_chunk:
+        if exhausted and not chunk:
             break
             
 def iter_record(in_f, start, end, chunksize):
@@ -78,7 +100,25 @@ def iter_record(in_f, start, end, chunksize):
 
 chunk_size = 30000
 
+def record_patterns(tag):
+    # The start also takes in the rest of an empty element's tag, e.g. <tag id="1"/>,
+    # which is then a whole record
+    start_re = re.compile(f"<{tag}(?=[\\s/>])(?:[^>]*/>)?".encode())
+    # Equivalent to </tag>|tag/>, but with a literal prefix so the scan stays fast
+    end_re = re.compile(f"{tag}(?:(?<=</{tag})>|/>)".encode())
+    return start_re, end_re
+
 def xml_iterparse(file_obj: "io.RawBytesIO", tag=None, chunksize=chunk_size):
-    start_re = re.compile(f"<{tag}".encode())
-    end_re = re.compile(f"</{tag}>|{tag}/>".encode())
-    yield from iter_record(file_obj, start_re, end_re, chunksize)
\ No newline at end of file
+    start_re, end_re = record_patterns(tag)
+    yield from iter_record(file_obj, start_re, end_re, chunksize)
+
+def xml_iterparse_mmap(path, tag=None):
+    """Like xml_iterparse, but memory-maps the file at `path` and yields
+    zero-copy memoryviews of each record"""
+    yield from iter_records_mmap(path, *record_patterns(tag))
+
+def axml_iterparse(stream, tag=None, chunksize=chunk_size):
+    """Like xml_iterparse, but splits records out of an async byte stream (an object
+    with an awaitable `read`, or an async iterable of chunks) as it is read"""
+    start_re, end_re = record_patterns(tag)
+    return aiter_records(stream, start_re, end_re, chunksize)
@@ -1,6 +1,8 @@
 import io
 
-from .iterparse import xml_iterparse
+import pytest
+
+from .iterparse import xml_iterparse, xml_iterparse_mmap, axml_iterparse
 
 example_doc = """
 <?xml version=1.0>
@@ -20,3 +22,55 @@ def test_xml_iterparse():
         print(el)
         counter += 1
     assert counter == 4
+
+
+def test_xml_iterparse_mmap(tmp_path):
+    path = tmp_path / "example.xml"
+    path.write_bytes(example_doc.encode())
+    records = [bytes(r) for r in xml_iterparse_mmap(path, tag="item")]
+    assert records == [b"<item>Some Text</item>", b"<item/>", b"<item/>", b"<item/>"]
+
+
+def test_xml_iterparse_small_chunksize():
+    expected = [b"<item>Some Text</item>", b"<item/>", b"<item/>", b"<item/>"]
+    for chunksize in (1, 2, 5, 7, 16):
+        records = list(xml_iterparse(io.BytesIO(example_doc.encode()), tag="item", chunksize=chunksize))
+        assert records == expected
+
+
+empty_element_doc = b"""<items>
+<item id="1"/>
+<item id="2">Two <b/></item>
+<item/>
+<item id="3" path="a/b"/>
+<items>Not a record</items>
+<item
+  id="4">Four</item>
+</items>"""
+
+empty_element_records = [
+    b'<item id="1"/>',
+    b'<item id="2">Two <b/></item>',
+    b"<item/>",
+    b'<item id="3" path="a/b"/>',
+    b'<item\n  id="4">Four</item>',
+]
+
+
+def test_xml_iterparse_empty_elements_with_attributes(tmp_path):
+    for chunksize in (1, 3, 8, 30000):
+        records = list(xml_iterparse(io.BytesIO(empty_element_doc), tag="item", chunksize=chunksize))
+        assert records == empty_element_records
+    path = tmp_path / "example.xml"
+    path.write_bytes(empty_element_doc)
+    assert [bytes(r) for r in xml_iterparse_mmap(path, tag="item")] == empty_element_records
+
+
+@pytest.mark.asyncio
+async def test_axml_iterparse_empty_elements_with_attributes():
+    async def chunks():
+        for i in range(0, len(empty_element_doc), 5):
+            yield empty_element_doc[i : i + 5]
+
+    records = [r async for r in axml_iterparse(chunks(), tag="item")]
+    assert records == empty_element_records
@@ -0,0 +1,44 @@
+import io
+
+from yankee.xml.schema import Schema, fields as f
+
+from .process import XmlProcessor
+
+
+class ItemSchema(Schema):
+    name = f.Str("./name")
+    number = f.Int("./number")
+
+
+class ItemProcessor(XmlProcessor):
+    parser = ItemSchema()
+    record_tag = "item"
+
+
+class MultidocProcessor(ItemProcessor):
+    multidoc = True
+
+
+bulk_doc = "<items>" + "".join(
+    f"<item><name>Item {i}</name><number>{i}</number></item>" for i in range(30)
+) + "</items>"
+
+multidoc = "".join(
+    f'<?xml version="1.0"?>\n<item><name>Item {i}</name><number>{i}</number></item>\n' for i in range(30)
+)
+
+
+def test_process_parallel_matches_sequential():
+    processor = ItemProcessor()
+    expected = list(processor.process(io.BytesIO(bulk_doc.encode()), meta={"file": "a"}))
+    assert expected[0] == {"name": "Item 0", "number": 0, "meta": {"file": "a"}}
+    results = list(processor.process(io.BytesIO(bulk_doc.encode()), meta={"file": "a"}, workers=2, chunksize=7))
+    assert results == expected
+
+
+def test_process_parallel_multidoc():
+    processor = MultidocProcessor()
+    expected = list(processor.process(io.BytesIO(multidoc.encode())))
+    assert [r["number"] for r in expected] == list(range(30))
+    results = list(processor.process(io.BytesIO(multidoc.encode()), workers=2, chunksize=7))
+    assert results == expected
@@ -0,0 +1,106 @@
+import lxml.etree as ET
+
+from yankee.base import fields
+from yankee.base.schema import RegexSchema
+from yankee.xml.util import parse_simple_path
+
+
+class KeepTrie(object):
+    """A trie of the element paths a schema reads from each record. Elements
+    outside of the trie can be discarded while parsing. A node marked `keep_all`
+    needs its whole subtree (e.g. for text content, or a complex XPath)"""
+
+    def __init__(self):
+        self.children = dict()
+        self.keep_all = False
+
+    def child(self, tag):
+        return self.children.setdefault(tag, KeepTrie())
+
+    def descend(self, data_key, namespaces):
+        """Returns the node for `data_key`, relative to this node, and whether the
+        data key was a simple path. Complex paths mark this node as keep_all"""
+        if not data_key:
+            return self, True
+        parsed = parse_simple_path(data_key, namespaces) if isinstance(data_key, str) else None
+        if parsed is None:
+            self.keep_all = True
+            return self, False
+        tags, attr, text = parsed
+        node = self
+        for tag in tags:
+            node = node.child(tag)
+        if text:
+            node.keep_all = True
+        return node, attr is None and not text
+
+
+def schema_paths(deserializer, node=None, namespaces=None) -> KeepTrie:
+    """Walks a bound field tree, and returns a KeepTrie of every element path it reads"""
+    node = node if node is not None else KeepTrie()
+    if namespaces is None:
+        namespaces = getattr(deserializer.Meta, "namespaces", None)
+    if isinstance(deserializer, fields.Const):
+        return node
+    if isinstance(deserializer, fields.Nested):
+        return schema_paths(deserializer._schema, node, namespaces)
+    node, is_element = node.descend(getattr(deserializer, "data_key", None), namespaces)
+    if not is_element or node.keep_all:
+        return node
+    if isinstance(deserializer, fields.Dictionary):
+        schema_paths(deserializer.key, node, namespaces)
+        schema_paths(deserializer.value, node, namespaces)
+    elif isinstance(deserializer, RegexSchema):
+        node.keep_all = True
+    elif hasattr(deserializer, "fields"):
+        for field in deserializer.fields.values():
+            schema_paths(field, node, namespaces)
+    elif isinstance(deserializer, fields.List):
+        schema_paths(deserializer.item_schema, node, namespaces)
+    else:
+        node.keep_all = True
+    return node
+
+
+def qualify_tag(tag, namespaces):
+    if ":" in tag and not tag.startswith("{"):
+        prefix, local = tag.split(":", 1)
+        return f"{{{namespaces[prefix]}}}{local}"
+    return tag
+
+
+def stream_load(schema, file_obj, record_tag, **parser_kwargs) -> "Iterator":
+    """
+    Parses a bulk XML file incrementally and yields each record loaded with `schema`.
+    While parsing, any element the schema does not reference is removed from the
+    tree as soon as it ends, so memory use is bounded by what the schema actually reads
+    """
+    namespaces = getattr(schema.Meta, "namespaces", None)
+    record_tag = qualify_tag(record_tag, namespaces)
+    root = schema_paths(schema)
+    stack = list()
+    for event, elem in ET.iterparse(file_obj, events=("start", "end"), **parser_kwargs):
+        if event == "start":
+            if stack:
+                parent = stack[-1]
+                if parent is None:
+                    stack.append(None)
+                elif parent.keep_all:
+                    stack.append(parent)
+                else:
+                    stack.append(parent.children.get(elem.tag))
+            elif elem.tag == record_tag:
+                stack.append(root)
+            continue
+        if not stack:
+            continue
+        node = stack.pop()
+        if stack:
+            if node is None:
+                elem.getparent().remove(elem)
+            continue
+        # End of a record
+        yield schema.load(elem)
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
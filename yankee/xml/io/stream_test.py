@@ -0,0 +1,71 @@
+import io
+
+import lxml.etree as ET
+
+from yankee.xml.schema import Schema, fields as f
+
+from .stream import schema_paths
+
+bulk_doc = b"""<?xml version="1.0"?>
+<patents xmlns:p="urn:patent">
+    <p:patent id="1">
+        <p:number>123</p:number>
+        <title>First <b>bold</b> title</title>
+        <claims><claim>A claim</claim><claim>Another claim</claim></claims>
+        <description><table><row>lots of data</row></table></description>
+    </p:patent>
+    <p:patent id="2">
+        <p:number>456</p:number>
+        <title>Second title</title>
+        <claims><claim>Only claim</claim></claims>
+        <description><math>x^2</math></description>
+    </p:patent>
+</patents>
+"""
+
+
+class ClaimSchema(Schema):
+    text = f.Str(".")
+
+
+class PatentSchema(Schema):
+    class Meta:
+        namespaces = {"p": "urn:patent"}
+
+    id = f.Str("./@id")
+    number = f.Str("./p:number")
+    title = f.Str("./title")
+    claims = f.List(ClaimSchema, "./claims/claim")
+
+
+class CapturingPatentSchema(PatentSchema):
+    seen = list()
+
+    def pre_load(self, obj):
+        self.seen.append(ET.tostring(obj))
+        return obj
+
+
+def test_schema_paths():
+    trie = schema_paths(PatentSchema())
+    assert set(trie.children) == {"{urn:patent}number", "title", "claims"}
+    assert trie.children["title"].keep_all
+    assert trie.children["claims"].children["claim"].keep_all
+
+
+def test_stream_load_matches_load():
+    schema = PatentSchema()
+    records = schema.load_stream(io.BytesIO(bulk_doc), "p:patent").to_list()
+    tree = ET.fromstring(bulk_doc)
+    expected = [schema.load(el) for el in tree.iterchildren("{urn:patent}patent")]
+    assert records == expected
+    assert records[0].title == "First bold title"
+    assert [c.text for c in records[0].claims] == ["A claim", "Another claim"]
+
+
+def test_stream_load_discards_unused_elements():
+    schema = CapturingPatentSchema()
+    schema.load_stream(io.BytesIO(bulk_doc), "p:patent").to_list()
+    assert len(schema.seen) == 2
+    assert b"description" not in schema.seen[0]
+    assert b"<b>bold</b>" in schema.seen[0]
@@ -1,16 +1,21 @@
+from functools import lru_cache, partial
+
 import lxml.etree as ET
 
+from yankee.base import fields
 from yankee.base.accessor import do_nothing
-
-try:
-    from cssselect import GenericTranslator
-except ImportError:
-    pass
+from yankee.util import clean_whitespace
+from yankee.xml.util import compile_xpath, parse_simple_path, simple_path_accessor
 
 class CSS():
     def __init__(self, path):
         self.path = path
 
+@lru_cache(maxsize=1024)
+def css_to_xpath(path):
+    from cssselect import GenericTranslator
+    return GenericTranslator().css_to_xpath(path)
+
 def xml_accessor(data_key, name, many, meta):
     if isinstance(data_key, ET.XPath):
         def accessor_func(obj):
@@ -26,12 +31,12 @@ def xml_accessor(data_key, name, many, meta):
     namespaces = getattr(meta, "namespaces", None)
 
     if isinstance(data_key, CSS):
-        data_key = GenericTranslator().css_to_xpath(data_key.path)
+        data_key = css_to_xpath(data_key.path)
 
-    if many:
-        xpath = ET.XPath(data_key, namespaces=namespaces)
-    else:
-        xpath = ET.XPath(f"({data_key})[1]", namespaces=namespaces)
+    xpath = compile_xpath(data_key, namespaces, many)
+    fast_accessor = simple_path_accessor(data_key, namespaces, many, xpath)
+    if fast_accessor is not None:
+        return fast_accessor
     
     def accessor_func(obj):
         if obj is None:
@@ -43,3 +48,69 @@ def xml_accessor(data_key, name, many, meta):
             return None
     return accessor_func
 
+
+# Scalar Pushdown
+
+# Modules whose deserialize and to_string methods are known to read an element's text
+builtin_modules = {"yankee.base.fields", "yankee.xml.schema.mixin", "yankee.html.schema.mixin"}
+
+def is_builtin(method):
+    return method.__module__ in builtin_modules
+
+def is_element_path(data_key, namespaces=None):
+    """Whether a data key is a path of plain child steps, e.g. "./a/b", which can only
+    select elements"""
+    if not isinstance(data_key, str):
+        return False
+    parsed = parse_simple_path(data_key, namespaces)
+    return parsed is not None and parsed[1] is None and not parsed[2]
+
+def scalar_function(field):
+    """The XPath function that extracts a single-valued field's value in libxml2, if
+    its type allows it: string() for String fields (including those that parse the
+    string, like Integer or Date), if their data key only selects elements, and
+    boolean() for Exists. Subclasses that override deserialize or to_string get the
+    selected node as usual"""
+    cls = field.__class__
+    if isinstance(field, fields.String) and is_builtin(cls.deserialize) and is_builtin(cls.to_string):
+        function = "string"
+    elif isinstance(field, fields.Exists) and is_builtin(cls.deserialize):
+        function = "boolean"
+    else:
+        return None
+    return function if field.data_key and not field.many else None
+
+def cleans_whitespace(formatter):
+    """Whether a String formatter is the default, which cleans whitespace as to_string does"""
+    return (isinstance(formatter, partial) and formatter.func is clean_whitespace
+            and not formatter.args and formatter.keywords == {"preserve_newlines": True})
+
+def text_accessor(data_key, namespaces=None, clean=True):
+    """Returns an accessor that reads the text of the first element `data_key` selects
+    with string(), which is the same as joining its itertext(), or None if nothing is
+    selected. The text is cleaned as to_string cleans an element's text, unless `clean`
+    is False because the field's formatter cleans it anyway"""
+    first = f"({data_key})[1]"
+    text = compile_xpath(f"string({first})", namespaces, smart_strings=False)
+    exists = compile_xpath(f"boolean({first})", namespaces, smart_strings=False)
+
+    def accessor_func(obj):
+        if obj is None:
+            return None
+        result = text(obj)
+        # string() of an empty element and of nothing are both ""
+        if not result and not exists(obj):
+            return None
+        return clean_whitespace(result, preserve_newlines=True) if clean else result
+    return accessor_func
+
+def exists_accessor(data_key, namespaces=None):
+    """Returns an accessor that is True if `data_key` selects anything, and otherwise None"""
+    # Selecting only the first node lets libxml2 stop at the first match
+    xpath = compile_xpath(f"boolean(({data_key})[1])", namespaces, smart_strings=False)
+
+    def accessor_func(obj):
+        if obj is None:
+            return None
+        return True if xpath(obj) else None
+    return accessor_func
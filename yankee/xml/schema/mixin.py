@@ -1,7 +1,8 @@
 import lxml.etree as ET
 from yankee.util import clean_whitespace
 
-from .accessor import xml_accessor
+from .accessor import (CSS, cleans_whitespace, css_to_xpath, exists_accessor, is_element_path, scalar_function,
+                       text_accessor, xml_accessor)
 
 class XmlMixin(object):
     list_field = "yankee.xml.schema.fields.List"
@@ -9,6 +10,25 @@ class XmlMixin(object):
     class Meta:
         accessor_function = xml_accessor
         infer_keys = False
+        single_pass = False
+
+    def make_accessor(self):
+        # String fields read the text of the element they select, and Exists fields
+        # whether anything is selected, with one XPath call, e.g. string((./title)[1]),
+        # rather than selecting a node and reading it in Python
+        function = scalar_function(self) if self.Meta.accessor_function is xml_accessor else None
+        if function is not None:
+            namespaces = getattr(self.Meta, "namespaces", None)
+            data_key = css_to_xpath(self.data_key.path) if isinstance(self.data_key, CSS) else self.data_key
+            if function == "boolean" and isinstance(data_key, str):
+                self.accessor = exists_accessor(data_key, namespaces)
+                return
+            if function == "string" and (isinstance(self.data_key, CSS) or is_element_path(data_key, namespaces)):
+                self.text_accessor = text_accessor(data_key, namespaces, not cleans_whitespace(self.formatter))
+                return super().make_accessor()
+        if "text_accessor" in self.__dict__:
+            del self.text_accessor
+        return super().make_accessor()
 
     def to_string(self, elem):
         if isinstance(elem, str):
@@ -1,20 +1,94 @@
 import lxml.etree as ET
 from yankee.base import schema
 from yankee.base.deserializer import Deserializer
-
+from yankee.data import AttrDict, Collection
+from yankee.util import is_valid
+from yankee.xml.io.iterparse import xml_iterparse, axml_iterparse
+from yankee.xml.util import PathTrie, parse_simple_path
 from .mixin import XmlMixin
 
 class Deserializer(XmlMixin, Deserializer):
     pass
 
 class Schema(XmlMixin, schema.Schema):
-    def load(self, obj):
+    _single_pass_plan = None
+
+    def coerce(self, obj):
         if isinstance(obj, (ET._Element, ET._ElementTree)):
-            return super().load(obj)
+            return obj
         elif isinstance(obj, str):
-            return super().load(ET.fromstring(obj.encode()))
-        elif isinstance(obj, bytes):
-            return super().load(ET.fromstring(obj))
+            return ET.fromstring(obj.encode())
+        elif isinstance(obj, (bytes, memoryview)):
+            return ET.fromstring(obj)
+
+    def load(self, obj, only=None, exclude=None):
+        obj = self.coerce(obj)
+        if obj is not None:
+            return super().load(obj, only, exclude)
+
+    def iter_records(self, file_obj, record_tag):
+        return xml_iterparse(file_obj, tag=record_tag)
+
+    def aiter_records(self, stream, record_tag):
+        return axml_iterparse(stream, tag=record_tag)
+
+    def load_stream(self, file_obj, record_tag, **parser_kwargs):
+        """Incrementally parse a bulk file, keeping only the parts of each record
+        this schema reads. See `yankee.xml.io.stream.stream_load`"""
+        from yankee.xml.io.stream import stream_load
+        return Collection(stream_load(self, file_obj, record_tag, **parser_kwargs), schema=self)
+
+    def bind(self, name=None, parent=None, meta=None):
+        super().bind(name, parent, meta)
+        self._single_pass_plan = None
+
+    def compile(self):
+        """Compile the schema. If `Meta.single_pass` is set, fields with simple child
+        paths are also arranged into a trie, so that all of their nodes are collected
+        in one walk of each record, and fields with complex paths use their own accessor"""
+        super().compile()
+        if getattr(self.Meta, "single_pass", False):
+            self._compile_single_pass()
+        return self
+
+    def _compile_single_pass(self):
+        namespaces = getattr(self.Meta, "namespaces", None)
+        trie, plan = PathTrie(), list()
+        for (output_name, loader, flatten), field in zip(self._plan, self.fields.values()):
+            data_key = getattr(field, "data_key", None)
+            parsed = parse_simple_path(data_key, namespaces) if isinstance(data_key, str) else None
+            if parsed is None or parsed[2]:
+                plan.append((output_name, loader, flatten, None, False, None))
+                continue
+            tags, attr, _ = parsed
+            slot = len(plan)
+            trie.add(tags, slot)
+            plan.append((output_name, field.detached().make_loader(), flatten, slot, field.many, attr))
+        self._trie = trie
+        self._single_pass_plan = tuple(plan)
+
+    def _load_plan(self, obj):
+        plan = self._single_pass_plan
+        if plan is None or not isinstance(obj, ET._Element):
+            return super()._load_plan(obj)
+        gathered = [list() for _ in plan]
+        self._trie.gather(obj, gathered)
+        output = AttrDict()
+        for output_name, loader, flatten, slot, many, attr in plan:
+            if slot is None:
+                value = loader(obj)
+            else:
+                nodes = gathered[slot]
+                if attr is not None:
+                    nodes = [v for v in (n.get(attr) for n in nodes) if v is not None]
+                value = loader(nodes if many else (nodes[0] if nodes else None))
+            if not is_valid(value):
+                continue
+            if flatten and isinstance(value, dict):
+                output.update(value)
+            else:
+                output[output_name] = value
+        return output
 
 
 class PolymorphicSchema(XmlMixin, schema.PolymorphicSchema):
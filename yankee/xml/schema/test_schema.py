@@ -173,4 +173,261 @@ def test_literal_css():
         a = f.List(f.Str, CSS("a"))
     
     data = CssListSchema().load(doc)
-    assert data.a == ["data 1", "data 2"]
\ No newline at end of file
+    assert data.a == ["data 1", "data 2"]
+def test_compiled_schema():
+    expected = ExampleSchema().load(test_doc).to_dict()
+    data = ExampleSchema().compile().load(test_doc).to_dict()
+    assert data == expected
+
+class ItemSchema(Schema):
+    name = f.Str("./name")
+    number = f.Int("./number")
+
+bulk_doc = "<items>" + "".join(
+    f"<item><name>Item {i}</name><number>{i}</number></item>" for i in range(50)
+) + "</items>"
+
+def test_load_parallel():
+    import io
+    schema = ItemSchema()
+    data = schema.load_parallel(io.BytesIO(bulk_doc.encode()), "item", workers=2, chunksize=7).to_list()
+    assert [d.number for d in data] == list(range(50))
+    assert data[3].name == "Item 3"
+
+def test_load_parallel_unordered():
+    import io
+    schema = ItemSchema()
+    data = schema.load_parallel(io.BytesIO(bulk_doc.encode()), "item", workers=2, chunksize=7, ordered=False, max_in_flight=1)
+    assert sorted(d.number for d in data) == list(range(50))
+
+class SinglePassSchema(ExampleSchema):
+    class Meta:
+        single_pass = True
+        compiled = True
+    attr = f.Str("./dict/item/@name")
+    attrs = f.List(f.Str, "./dict/item/@name")
+    names = f.List(f.Str, "./zip/first_name/name")
+
+def test_single_pass_matches_per_field():
+    expected = ExampleSchema().load(test_doc).to_dict()
+    schema = SinglePassSchema()
+    data = schema.load(test_doc).to_dict()
+    assert schema._single_pass_plan is not None
+    assert data.pop("attr") == "key1"
+    assert data.pop("attrs") == ["key1", "key2"]
+    assert data.pop("names") == ["Parker", "Peter"]
+    assert data == expected
+
+def test_load_lazy():
+    row = ExampleSchema().load_lazy(test_doc)
+    expected = ExampleSchema().load(test_doc)
+    assert row.string == expected.string
+    assert len(row._values) == 1
+    assert row.materialize() == expected
+
+def test_project():
+    schema = ExampleSchema()
+    data = schema.load(test_doc, only=["string", "dict", "name"])
+    assert data.to_dict() == {
+        "string": "Some String Data",
+        "name": "George Burdell",
+        "dict": {"key1": "value1", "key2": "value2"},
+    }
+    excluded = schema.load(test_doc, exclude=["regex", "csv"]).to_dict()
+    expected = schema.load(test_doc).to_dict()
+    del expected["csv"]
+    assert excluded == expected
+
+def test_load_iter_where():
+    import io
+    schema = ItemSchema()
+    data = schema.load_iter(io.BytesIO(bulk_doc.encode()), where={"number": lambda n: n % 10 == 0}, record_tag="item")
+    assert [d.number for d in data] == [0, 10, 20, 30, 40]
+    data = schema.load_iter(io.BytesIO(bulk_doc.encode()), where=lambda row: row.name == "Item 7", record_tag="item")
+    assert [d.to_dict() for d in data] == [{"name": "Item 7", "number": 7}]
+
+def test_load_iter_prefilter():
+    import io
+    schema = ItemSchema()
+    data = schema.load_iter(io.BytesIO(bulk_doc.encode()), prefilter=rb"<number>4\d</number>", record_tag="item")
+    assert [d.number for d in data] == list(range(40, 50))
+
+@pytest.mark.asyncio
+async def test_aload_iter():
+    async def chunks():
+        data = bulk_doc.encode()
+        for i in range(0, len(data), 100):
+            yield data[i : i + 100]
+
+    schema = ItemSchema()
+    data = [d async for d in schema.aload_iter(chunks(), record_tag="item", concurrency=3)]
+    assert [d.number for d in data] == list(range(50))
+    data = [d async for d in schema.aload_iter(chunks(), record_tag="item", where={"number": 7})]
+    assert [d.name for d in data] == ["Item 7"]
+
+class RawSchema(ItemSchema):
+    def post_load(self, obj):
+        obj["raw_name"] = self.raw.findtext("name")
+        return obj
+
+def test_load_many_threads():
+    import lxml.etree as ET
+    records = [f"<item><name>Item {i}</name><number>{i}</number></item>".encode() for i in range(500)]
+    schema = RawSchema()
+    expected = [schema.load(r).to_dict() for r in records]
+    assert schema.raw.findtext("number") == "499"
+    results = schema.load_many(records, workers=8)
+    assert [r.to_dict() for r in results] == expected
+    assert all(r.raw_name == r.name for r in results)
+
+def test_shared_schema_concurrent_load():
+    from concurrent.futures import ThreadPoolExecutor
+    records = [f"<item><name>Item {i}</name><number>{i}</number></item>".encode() for i in range(200)]
+    schema = RawSchema()
+    def load_all(offset):
+        return [schema.load(records[(i + offset) % 200]).number for i in range(200)]
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(load_all, range(0, 200, 25)))
+    for offset, numbers in zip(range(0, 200, 25), results):
+        assert numbers == [(i + offset) % 200 for i in range(200)]
+
+def test_scalar_pushdown():
+    doc = ET.fromstring(b"<doc><title>A <b>bold</b> title</title><title>Second</title><count>7</count><flag/></doc>")
+
+    class PushdownSchema(Schema):
+        title = f.Str("./title")
+        count = f.Int("./count")
+        flag = f.Exists("./flag")
+        missing = f.Exists("./missing")
+        missing_title = f.Str("./missing")
+        css_title = f.Str(CSS("title"))
+
+    schema = PushdownSchema()
+    assert schema.fields["title"].text_accessor(doc) == "A bold title"
+    assert schema.fields["css_title"].text_accessor is not None
+    data = schema.load(doc)
+    assert data.title == "A bold title"
+    assert data.css_title == "A bold title"
+    assert data.count == 7
+    assert data.flag is True
+    assert data.missing is False
+    assert "missing_title" not in data.to_dict()
+
+class ElementPathStr(f.Str):
+    # Overriding deserialize opts out of the string() pushdown
+    def deserialize(self, elem):
+        return super().deserialize(elem)
+
+def test_scalar_pushdown_matches_element_path():
+    doc = ET.fromstring(
+        b"<doc><p>  Hello\n    <b>big</b>   world  </p><empty/><blank>  </blank><dash>-</dash>"
+        b"<a x='' y='  spaced  out ' z='-'/><!--  a   comment --></doc>"
+    )
+    keys = ["./p", "./empty", "./blank", "./dash", "./missing", "./a/@x", "./a/@y", "./a/@z", "./p/text()", "./comment()"]
+    options = [dict(), dict(formatter=lambda s: s), dict(null_value="-"), dict(formatter=str.upper, null_value="-")]
+    for kwargs in options:
+        for key in keys:
+            pushed, plain = f.Str(key, **kwargs), ElementPathStr(key, **kwargs)
+            for field in (pushed, plain):
+                field.bind("value", Schema())
+            assert pushed.load(doc) == plain.load(doc), (key, kwargs)
+    custom = f.Str("./p", formatter=lambda s: s)
+    custom.bind("p", Schema())
+    assert custom.text_accessor is not None
+    assert custom.load(doc) == "Hello\nbig world"
+    assert f.Str("./a/@y").text_accessor is None
+
+def test_scalar_pushdown_custom_field():
+    doc = ET.fromstring(b"<doc><title>Title</title></doc>")
+
+    class TagField(f.Str):
+        def to_string(self, elem):
+            return elem.tag
+
+    class TagSchema(Schema):
+        title = TagField("./title")
+
+    assert TagSchema().load(doc).title == "title"
+
+def test_compile_with_default_meta():
+    from yankee.base.schema import Schema as BaseSchema
+
+    class InnerSchema(Schema):
+        name = f.Str("./name")
+
+    class OuterSchema(BaseSchema):
+        inner = InnerSchema("inner")
+
+    class CustomMeta:
+        accessor_function = staticmethod(Schema.Meta.accessor_function)
+
+    schema = OuterSchema()
+    assert schema.compile() is schema
+    inner = InnerSchema()
+    inner.Meta = CustomMeta
+    assert inner.compile() is inner
+
+class TagStr(f.Str):
+    def post_load(self, obj):
+        return f"{self.raw.tag}: {obj}"
+
+class RawInnerSchema(Schema):
+    class Meta:
+        compiled = True
+    name = f.Str("./name")
+
+    def post_load(self, obj):
+        obj["raw_text"] = self.raw_text.strip()
+        return obj
+
+class RawOuterSchema(Schema):
+    class Meta:
+        compiled = True
+    name = TagStr("./name")
+    inner = RawInnerSchema("./inner")
+    inners = f.List(RawInnerSchema, "./inner")
+
+def test_raw_in_fields_and_nested_schemas():
+    doc = "<doc><name>Outer</name><inner><name>Inner</name></inner></doc>"
+    schema = RawOuterSchema()
+    data = schema.load(doc)
+    assert data.name == "doc: Outer"
+    # Like fields, a schema with a data key is given its parent's object
+    assert data.inner.raw_text.startswith("<doc>")
+    assert data.inners[0].raw_text == "<inner>\n  <name>Inner</name>\n</inner>"
+    # As before, a top-level load keeps the object it was given
+    assert schema.raw.tag == "doc"
+    assert schema.raw_text.startswith("<doc>")
+
+def test_raw_setter():
+    schema = ItemSchema()
+    schema.raw = "something"
+    assert schema.raw == "something"
+    assert schema.load("<item><name>A</name></item>").name == "A"
+    assert schema.raw.findtext("name") == "A"
+
+def test_reads_raw_follows_overrides():
+    from yankee.base.deserializer import reads_raw
+    assert not reads_raw(Schema)
+    assert not reads_raw(ItemSchema)
+    assert not reads_raw(f.Str)
+    assert not reads_raw(f.Date)
+    assert reads_raw(RawSchema)
+    assert reads_raw(TagStr)
+
+    class UpperStr(f.Str):
+        def deserialize(self, elem):
+            return super().deserialize(elem).upper()
+
+    assert reads_raw(UpperStr)
+
+def test_raw_in_lazy_post_load():
+    data = RawInnerSchema().load_lazy(ET.fromstring("<inner><name>Inner</name></inner>"))
+    assert data.materialize().raw_text == "<inner>\n  <name>Inner</name>\n</inner>"
+
+def test_prepare_nested_schemas():
+    schema = RawOuterSchema()
+    schema.prepare()
+    assert schema._plan is not None
+    assert schema.fields["inner"]._plan is not None
+    assert schema.fields["inners"].item_schema._plan is not None
@@ -1,3 +1,10 @@
+import re
+import threading
+from threading import get_ident
+from functools import lru_cache
+
+import lxml.etree as ET
+
 # XPath Utilites
 
 # XPath Node Set Operations
@@ -9,4 +16,186 @@ def xpath_intersection(ns1, ns2):
 def xpath_difference(ns1, ns2):
     """The Kaysian Method for XPath 1.0 differences
     Do not include leading . in ns1 and ns2"""
-    return f"{ns1}[count({ns1}) != count({ns2})]"
\ No newline at end of file
+    return f"{ns1}[count({ns1}) != count({ns2})]"
+
+# Compiled XPath Cache
+
+class _ThreadXPaths(threading.local):
+    def __init__(self):
+        self.compiled = dict()
+
+_thread_xpaths = _ThreadXPaths()
+
+class ThreadXPath(object):
+    """Evaluates an XPath with a copy compiled for the calling thread. lxml locks
+    each XPath object while it is evaluated, so threads sharing one take turns"""
+    __slots__ = ("path", "namespaces", "smart_strings", "owner", "xpath")
+
+    def __init__(self, path, namespaces=None, smart_strings=True):
+        self.path = path
+        self.namespaces = namespaces
+        self.smart_strings = smart_strings
+        # The thread that compiled the XPath uses it directly
+        self.owner = get_ident()
+        self.xpath = self.compile()
+
+    def compile(self):
+        namespaces = dict(self.namespaces) if self.namespaces else None
+        return ET.XPath(self.path, namespaces=namespaces, smart_strings=self.smart_strings)
+
+    def __call__(self, obj):
+        if get_ident() == self.owner:
+            return self.xpath(obj)
+        compiled = _thread_xpaths.compiled
+        xpath = compiled.get(self)
+        if xpath is None:
+            xpath = compiled[self] = self.compile()
+        return xpath(obj)
+
+@lru_cache(maxsize=4096)
+def _cached_xpath(expression, namespaces, many, smart_strings):
+    if not many:
+        expression = f"({expression})[1]"
+    return ThreadXPath(expression, namespaces, smart_strings)
+
+def compile_xpath(expression, namespaces=None, many=True, smart_strings=True):
+    """Returns an XPath, shared process-wide between all fields using the same
+    expression, and compiled once per thread that evaluates it. If many is False,
+    the XPath selects only the first match"""
+    ns_key = tuple(sorted(namespaces.items())) if namespaces else None
+    return _cached_xpath(expression, ns_key, many, smart_strings)
+
+
+# Simple Path Fast Path
+
+name_re = re.compile(r"^(?:(?P<prefix>[A-Za-z_][\w.\-]*):)?(?P<local>[A-Za-z_][\w.\-]*)$")
+
+def _qualify(qname, namespaces):
+    match = name_re.match(qname)
+    if match is None:
+        return None
+    prefix, local = match.group("prefix"), match.group("local")
+    if prefix is None:
+        return local
+    if not namespaces or prefix not in namespaces:
+        return None
+    return f"{{{namespaces[prefix]}}}{local}"
+
+def parse_simple_path(expression, namespaces=None):
+    """Parses a relative XPath of plain child steps, optionally ending in an attribute
+    or text() step (e.g. "./a/b", "./a/@id", "a/text()"). Returns a tuple of
+    (tags, attribute, text), where tags are in Clark notation, or None if the
+    expression is anything more complex"""
+    ns_key = tuple(sorted(namespaces.items())) if namespaces else None
+    return _parse_simple_path(expression, ns_key)
+
+@lru_cache(maxsize=4096)
+def _parse_simple_path(expression, namespaces):
+    namespaces = dict(namespaces) if namespaces else None
+    if expression.startswith("./"):
+        expression = expression[2:]
+    if not expression:
+        return None
+    segments = expression.split("/")
+    attr, text = None, False
+    if segments[-1] == "text()":
+        text = True
+        segments.pop()
+    elif segments[-1].startswith("@"):
+        attr = _qualify(segments.pop()[1:], namespaces)
+        if attr is None:
+            return None
+    tags = tuple(_qualify(s, namespaces) for s in segments)
+    if None in tags:
+        return None
+    return tags, attr, text
+
+def _iter_path(elem, tags, i=0):
+    if i == len(tags):
+        yield elem
+        return
+    for child in elem.iterchildren(tags[i]):
+        yield from _iter_path(child, tags, i + 1)
+
+def _first_text(elem):
+    if elem.text is not None:
+        return elem.text
+    for child in elem:
+        if child.tail is not None:
+            return child.tail
+    return None
+
+def simple_path_accessor(expression, namespaces, many, fallback):
+    """Returns an accessor function that resolves simple child paths with
+    iterchildren/get rather than the XPath engine, or None if the expression
+    is not simple. Objects other than elements are passed to the fallback XPath"""
+    parsed = parse_simple_path(expression, namespaces)
+    if parsed is None or (many and parsed[2]):
+        return None
+    tags, attr, text = parsed
+
+    if len(tags) == 1 and attr is None and not text:
+        tag = tags[0]
+        if many:
+            def select(elem):
+                return list(elem.iterchildren(tag))
+        else:
+            def select(elem):
+                return next(elem.iterchildren(tag), None)
+    elif not tags and attr is not None and not many:
+        def select(elem):
+            return elem.get(attr)
+    elif attr is not None:
+        if many:
+            def select(elem):
+                return [v for v in (e.get(attr) for e in _iter_path(elem, tags)) if v is not None]
+        else:
+            def select(elem):
+                return next((v for v in (e.get(attr) for e in _iter_path(elem, tags)) if v is not None), None)
+    elif text:
+        def select(elem):
+            return next((t for t in map(_first_text, _iter_path(elem, tags)) if t is not None), None)
+    elif many:
+        def select(elem):
+            return list(_iter_path(elem, tags))
+    else:
+        def select(elem):
+            return next(_iter_path(elem, tags), None)
+
+    def accessor_func(obj):
+        if obj is None:
+            return None
+        if isinstance(obj, ET._Element):
+            return select(obj)
+        result = fallback(obj)
+        if many:
+            return result
+        return result[0] if result else None
+    return accessor_func
+
+
+# Single Pass Extraction
+
+class PathTrie(object):
+    """A trie of child element paths (in Clark notation). `gather` walks an element
+    once, following only the branches in the trie, and collects the nodes at each
+    path into numbered slots, in document order"""
+    def __init__(self):
+        self.children = dict()
+        self.slots = list()
+
+    def add(self, tags, slot):
+        node = self
+        for tag in tags:
+            node = node.children.setdefault(tag, PathTrie())
+        node.slots.append(slot)
+
+    def gather(self, elem, results):
+        for slot in self.slots:
+            results[slot].append(elem)
+        children = self.children
+        if children:
+            for child in elem.iterchildren():
+                node = children.get(child.tag)
+                if node is not None:
+                    node.gather(child, results)
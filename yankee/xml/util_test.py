@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import lxml.etree as ET
+import pytest
+
+from .util import _thread_xpaths, compile_xpath, parse_simple_path, simple_path_accessor
+
+doc = ET.fromstring(b"""
+<root xmlns:h="urn:h">
+    <a id="1"><b>first</b></a>
+    <a><b>second</b><b id="2">third</b></a>
+    <h:c h:key="value">namespaced</h:c>
+    <mixed><i>child</i>tail text</mixed>
+    <!-- comment -->
+</root>
+""")
+
+namespaces = {"h": "urn:h"}
+
+paths = [
+    "./a",
+    "a/b",
+    "./a/@id",
+    "./a/b/@id",
+    "./h:c",
+    "./h:c/@h:key",
+    "./a/b/text()",
+    "./mixed/text()",
+    "./missing",
+    "./missing/@id",
+]
+
+
+@pytest.mark.parametrize("path", paths)
+@pytest.mark.parametrize("many", [True, False])
+def test_simple_path_matches_xpath(path, many):
+    xpath = compile_xpath(path, namespaces, many)
+    accessor = simple_path_accessor(path, namespaces, many, xpath)
+    if accessor is None:
+        assert many and path.endswith("text()")
+        return
+    expected = xpath(doc)
+    if not many:
+        expected = expected[0] if expected else None
+    assert accessor(doc) == expected
+
+
+@pytest.mark.parametrize("path", ["./a[1]", ".//a", "../a", "./comment()", "./a | ./b", "./x:c"])
+def test_complex_paths_are_not_simple(path):
+    assert parse_simple_path(path, namespaces) is None
+
+
+def test_xpath_cache_is_shared():
+    assert compile_xpath("./a", namespaces, False) is compile_xpath("./a", dict(namespaces), False)
+    assert compile_xpath("./a", namespaces, True) is not compile_xpath("./a", namespaces, False)
+
+
+def test_xpath_compiled_per_thread():
+    xpath = compile_xpath(".//b", namespaces)
+
+    def evaluate():
+        return xpath(doc), _thread_xpaths.compiled.get(xpath)
+
+    with ThreadPoolExecutor(1) as pool:
+        result, compiled = pool.submit(evaluate).result()
+    assert result == xpath(doc)
+    # The other thread compiled its own copy, rather than sharing this thread's
+    assert compiled is not None and compiled is not xpath.xpath
+    assert xpath not in _thread_xpaths.compiled